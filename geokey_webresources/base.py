@@ -5,3 +5,63 @@ from model_utils import Choices
 
 STATUS = Choices('active', 'inactive', 'deleted')
 FORMAT = Choices('GeoJSON', 'KML')
+ACTION = Choices('created', 'updated', 'reordered', 'deleted')
+
+# Gap left between positions of web resources, so that a single web resource
+# can be moved between two others without renumbering all of them
+ORDER_GAP = 1024
+
+# Number of web resources shown on a single page of the admin list
+PAGE_SIZE = 50
+
+# Maximum number of changes of web resources returned at once, and default
+# maximum number of seconds a request for changes waits for new ones
+# (long-polling, `WEBRESOURCES_CHANGES_TIMEOUT` setting, 0 to disable it)
+CHANGES_LIMIT = 500
+CHANGES_TIMEOUT = 30
+
+# Number of seconds, within which a transaction that logged a change of web
+# resources is expected to commit: changes are returned only after that, so
+# that a cursor never passes a change that commits later with a lower ID
+CHANGES_GRACE = 5
+
+# Number of seconds, for which a granted access of a user to a project is
+# cached for the public API
+ACCESS_TIMEOUT = 60
+
+# Size (in pixels) of the longer side of a symbol at 1x scale, scales and
+# formats of resized symbol variants
+SYMBOL_SIZE = 32
+SYMBOL_SCALES = (1, 2)
+SYMBOL_FORMATS = ('png', 'webp')
+
+# Number of seconds, for which clients can cache files with content-hashed
+# names (e.g. sprites of symbols)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Number of seconds, for which content of a URL cached on the server is used
+# before it is revalidated with the remote server, maximum size (in bytes) of
+# the cached content and number of seconds to wait for the remote server
+CACHE_TIMEOUT = 60 * 60
+CACHE_MAX_SIZE = 50 * 1024 * 1024
+CACHE_FETCH_TIMEOUT = 30
+
+# Default maximum total size (in bytes) of the cache of remote content, and
+# of content used by a single project (`WEBRESOURCES_CACHE_SIZE` and
+# `WEBRESOURCES_CACHE_PROJECT_SIZE` settings), and number of seconds, within
+# which repeated access to cached content is not recorded again
+CACHE_SIZE = 1024 * 1024 * 1024
+CACHE_PROJECT_SIZE = 256 * 1024 * 1024
+CACHE_ACCESS_RESOLUTION = 60
+
+# Version of the binary format of features converted from cached content,
+# increased whenever the format changes, so that features are converted again,
+# and maximum number of feature stores kept open by each process
+FEATURE_STORE_VERSION = 3
+FEATURE_STORE_OPEN = 32
+
+# Maximum number of children of a node of the spatial index of features
+# converted to FlatGeobuf, and version of converted files, increased whenever
+# they change, so that features are converted again
+FLATGEOBUF_NODE_SIZE = 16
+FLATGEOBUF_VERSION = 3
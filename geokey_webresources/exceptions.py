@@ -21,3 +21,14 @@ class URLError(Exception):
         html += '</ul>'
 
         return mark_safe(html)
+
+
+class FetchInProgressError(URLError):
+    """Throw error when a URL is being fetched by another request."""
+
+    def __init__(self):
+        """Initialise error messages."""
+        super(FetchInProgressError, self).__init__(
+            'The data is being fetched.',
+            ['Try again in a moment.']
+        )
@@ -1,8 +1,14 @@
 """All forms for the extension."""
 
+from django.core.files.uploadedfile import UploadedFile
 from django.forms import ModelForm
 
 from .models import WebResource
+from .helpers.symbol_helpers import (
+    store_symbol,
+    delete_unused_symbols,
+    schedule_symbol_variants
+)
 
 
 class WebResourceForm(ModelForm):
@@ -13,3 +19,37 @@ class WebResourceForm(ModelForm):
 
         model = WebResource
         fields = ('name', 'description', 'url', 'colour', 'symbol')
+
+    def save(self, commit=True):
+        """
+        Save web resource and create resized variants of its symbol.
+
+        Uploaded symbol is stored under the hash of its content. The previous
+        symbol file is deleted, when no other web resource uses it. Variants
+        are created once the transaction commits.
+
+        Parameters
+        ----------
+        commit : bool
+            Whether web resource should be saved to the database.
+
+        Returns
+        -------
+        geokey_webresources.models.WebResource
+            Web resource.
+        """
+        previous = self.initial.get('symbol')
+        symbol = self.cleaned_data.get('symbol')
+
+        if isinstance(symbol, UploadedFile):
+            self.instance.symbol = store_symbol(symbol, symbol.name)
+
+        webresource = super(WebResourceForm, self).save(commit=commit)
+
+        if commit:
+            schedule_symbol_variants(webresource.id)
+
+            if previous and previous.name != webresource.symbol.name:
+                delete_unused_symbols([previous.name])
+
+        return webresource
@@ -0,0 +1,95 @@
+"""All helpers for access to projects."""
+
+import uuid
+
+from django.core.cache import cache
+
+from geokey.projects.models import Project
+
+from ..base import ACCESS_TIMEOUT
+
+
+def _version_key(project_id):
+    """Return cache key of the version of cached access to the project."""
+    return 'geokey_webresources:access:%s' % project_id
+
+
+def _version(project_id):
+    """
+    Return the version of cached access to the project.
+
+    Versions are random, so a version that was evicted from the cache is
+    never replaced with one used before (which could still have access
+    cached under it).
+    """
+    key = _version_key(project_id)
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+
+    return version
+
+
+def _access_key(user, project_id, version):
+    """Return cache key of the cached access of the user to the project."""
+    return 'geokey_webresources:access:%s:%s:%s' % (
+        project_id,
+        version,
+        'anonymous' if user.is_anonymous() else user.id
+    )
+
+
+def check_read_access(user, project_id):
+    """
+    Check that the user can read the project.
+
+    Access is checked with `Project.objects.get_single`. When it is granted,
+    the decision is cached for `ACCESS_TIMEOUT` seconds, or until access to
+    the project is invalidated. Denied access is never cached.
+
+    The cache must be shared by all processes (e.g. Memcached or Redis):
+    with a local-memory cache, access invalidated by one process is still
+    granted by others until it expires.
+
+    Parameters
+    ----------
+    user : geokey.users.models.User
+        User reading the project.
+    project_id : int
+        Identifies the project in the database.
+
+    Returns
+    -------
+    int
+        Identifies the project in the database.
+
+    Raises
+    ------
+    Project.DoesNotExist
+        When project was not found or user has no access to it.
+    """
+    project_id = int(project_id)
+    key = _access_key(user, project_id, _version(project_id))
+
+    if not cache.get(key):
+        Project.objects.get_single(user, project_id)
+        cache.set(key, True, ACCESS_TIMEOUT)
+
+    return project_id
+
+
+def invalidate_access(project_id):
+    """
+    Invalidate cached access of all users to the project.
+
+    A new version of cached access is set in the (shared) cache, so access
+    cached under previous versions is not used anymore.
+
+    Parameters
+    ----------
+    project_id : int
+        Identifies the project in the database.
+    """
+    cache.set(_version_key(project_id), uuid.uuid4().hex, None)
@@ -0,0 +1,142 @@
+"""All helpers for archiving."""
+
+import time
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..base import STATUS
+from ..models import WebResource, ArchivedWebResource, SymbolVariant
+from .symbol_helpers import delete_unused_symbols, delete_unused_variants
+
+
+def archive_webresources(days, batch_size=500, pause=0):
+    """
+    Archive web resources deleted more than the given number of days ago.
+
+    Web resources are moved to the archive in batches, each in its own
+    transaction, with a pause between batches so that locks are released.
+    Symbol files (and variants) no other web resource uses are removed
+    afterwards, so symbols are lost and cannot be restored. Changes logged
+    for archived web resources are kept, so they are still reported as
+    deleted.
+
+    Parameters
+    ----------
+    days : int
+        Number of days, for which deleted web resources are kept.
+    batch_size : int
+        Number of web resources moved in one transaction.
+    pause : float
+        Number of seconds to wait between batches.
+
+    Returns
+    -------
+    int
+        Number of archived web resources.
+    """
+    deleted_before = timezone.now() - timedelta(days=days)
+    archived = 0
+
+    while True:
+        with transaction.atomic():
+            webresources = list(
+                WebResource._base_manager.select_for_update().filter(
+                    status=STATUS.deleted,
+                    status_changed__lt=deleted_before
+                ).order_by('pk')[:batch_size]
+            )
+
+            if not webresources:
+                break
+
+            variants = list(SymbolVariant.objects.filter(
+                webresource__in=webresources
+            ).values_list('image', flat=True))
+
+            now = timezone.now()
+            ArchivedWebResource.objects.bulk_create([
+                ArchivedWebResource(
+                    webresource_id=webresource.id,
+                    name=webresource.name,
+                    description=webresource.description,
+                    dataformat=webresource.dataformat,
+                    url=webresource.url,
+                    order=webresource.order,
+                    colour=webresource.colour,
+                    created=webresource.created,
+                    deleted=webresource.status_changed,
+                    archived=now,
+                    project_id=webresource.project_id,
+                    creator_id=webresource.creator_id
+                ) for webresource in webresources
+            ])
+            WebResource._base_manager.filter(pk__in=[
+                webresource.id for webresource in webresources
+            ]).delete()
+
+        delete_unused_symbols(
+            webresource.symbol.name for webresource in webresources
+            if webresource.symbol
+        )
+        delete_unused_variants(variants)
+
+        archived += len(webresources)
+
+        if pause:
+            time.sleep(pause)
+
+    return archived
+
+
+def restore_webresource(webresource_id):
+    """
+    Restore archived web resource.
+
+    Web resource is restored with its original ID, as inactive and without
+    a symbol (or symbol variants), because symbol files are removed when
+    archiving. Set a new symbol to use one again.
+
+    Parameters
+    ----------
+    webresource_id : int
+        Identifies the archived web resource (by its original ID).
+
+    Returns
+    -------
+    geokey_webresources.models.WebResource
+        Restored web resource.
+
+    Raises
+    ------
+    DoesNotExist
+        When archived web resource was not found.
+    """
+    with transaction.atomic():
+        archived = ArchivedWebResource.objects.select_for_update().get(
+            webresource_id=webresource_id
+        )
+
+        webresource = WebResource(
+            id=archived.webresource_id,
+            status=STATUS.inactive,
+            name=archived.name,
+            description=archived.description,
+            dataformat=archived.dataformat,
+            url=archived.url,
+            order=archived.order,
+            colour=archived.colour,
+            project_id=archived.project_id,
+            creator_id=archived.creator_id
+        )
+        webresource.save(force_insert=True)
+        WebResource.objects.filter(pk=webresource.id).update(
+            created=archived.created
+        )
+        webresource.created = archived.created
+
+        archived.delete()
+
+    return webresource
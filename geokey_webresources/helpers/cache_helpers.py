@@ -0,0 +1,959 @@
+"""All helpers for the cache of remote content."""
+
+import gzip
+import zlib
+import urllib
+import urllib2
+import urlparse
+import hashlib
+import tempfile
+
+from operator import or_
+from datetime import timedelta
+from collections import namedtuple, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db import transaction, IntegrityError
+from django.db.models import Q, Sum, Count, Case, When
+from django.utils import timezone
+
+from ..base import (
+    STATUS,
+    CACHE_TIMEOUT,
+    CACHE_MAX_SIZE,
+    CACHE_FETCH_TIMEOUT,
+    CACHE_SIZE,
+    CACHE_PROJECT_SIZE,
+    CACHE_ACCESS_RESOLUTION
+)
+from ..exceptions import URLError, FetchInProgressError
+from ..models import WebResource, CachedContent
+from .url_helpers import open_url
+from .storage_helpers import save_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+COUNTERS = ('hits', 'misses', 'evictions')
+FILE_FIELDS = ('content', 'brotli', 'features', 'flatgeobuf')
+DERIVED_FIELDS = ('features', 'flatgeobuf')
+
+# Single cached content considered for eviction: its ID, name of its file,
+# size, time of the last access and IDs of projects using it
+CacheEntry = namedtuple(
+    'CacheEntry',
+    ['id', 'name', 'size', 'accessed', 'projects']
+)
+
+
+def _counter_key(counter):
+    """Return cache key of a counter of the cache of remote content."""
+    return 'geokey_webresources:cache:%s' % counter
+
+
+def _fetch_key(url):
+    """Return cache key of the lock of fetching a URL."""
+    return 'geokey_webresources:fetch:%s' % hashlib.sha1(
+        url.encode('utf-8')
+    ).hexdigest()
+
+
+def count(counter, number=1):
+    """
+    Increase a counter of the cache of remote content.
+
+    Counters are kept in the Django cache, so they are shared by all
+    processes when the cache backend is.
+
+    Parameters
+    ----------
+    counter : str
+        Counter to increase: `hits`, `misses` or `evictions`.
+    number : int
+        Number to increase the counter by.
+    """
+    if number:
+        cache.add(_counter_key(counter), 0, None)
+        cache.incr(_counter_key(counter), number)
+
+
+def get_stats():
+    """
+    Get statistics of the cache of remote content.
+
+    Returns
+    -------
+    dict
+        Number of hits, misses and evictions, number of cached entries and
+        total size of their (compressed) files.
+    """
+    stats = dict(
+        (counter, cache.get(_counter_key(counter), 0))
+        for counter in COUNTERS
+    )
+    sizes = dict(CachedContent.objects.values_list('content', 'stored_size'))
+
+    stats['entries'] = CachedContent.objects.count()
+    stats['size'] = sum(sizes.values())
+
+    return stats
+
+
+def normalise_url(url):
+    """
+    Normalise URL, so that the same URL written differently is cached once.
+
+    Scheme and host are lowercased, default port and fragment are removed,
+    and query parameters are sorted.
+
+    Parameters
+    ----------
+    url : str
+        URL to normalise.
+
+    Returns
+    -------
+    str
+        Normalised URL.
+    """
+    parts = urlparse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    netloc = parts.hostname or ''
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = '%s:%s' % (netloc, parts.port)
+    if parts.username:
+        netloc = '%s@%s' % (
+            parts.username + (
+                ':%s' % parts.password if parts.password else ''
+            ),
+            netloc
+        )
+
+    query = urllib.urlencode(sorted(
+        urlparse.parse_qsl(parts.query, keep_blank_values=True)
+    ))
+
+    return urlparse.urlunsplit((scheme, netloc, parts.path or '/', query, ''))
+
+
+def download(url, etag='', last_modified=''):
+    """
+    Download content of a URL to a temporary file.
+
+    When ETag or time of the last modification of the cached content is
+    given, the request is conditional. Only URLs on public addresses are
+    downloaded (also after redirects).
+
+    Parameters
+    ----------
+    url : str
+        URL to download.
+    etag : str
+        ETag of the cached content.
+    last_modified : str
+        Time of the last modification of the cached content.
+
+    Returns
+    -------
+    tuple
+        Temporary file, checksum, size and headers of the content, `None`
+        if the cached content has not been modified.
+
+    Raises
+    ------
+    URLError
+        When URL cannot be downloaded.
+    """
+    request = urllib2.Request(url)
+    if etag:
+        request.add_header('If-None-Match', etag)
+    if last_modified:
+        request.add_header('If-Modified-Since', last_modified)
+
+    try:
+        response = open_url(request, timeout=CACHE_FETCH_TIMEOUT)
+    except urllib2.HTTPError, error:
+        if error.code == 304:
+            return None
+
+        raise URLError(
+            'The URL cannot be used due to:',
+            ['The server returned %s error.' % error.code]
+        )
+    except urllib2.URLError, error:
+        raise URLError(
+            'The URL cannot be used due to:',
+            ['Failed to reach the server: %s.' % error.reason]
+        )
+
+    content = tempfile.TemporaryFile()
+    checksum = hashlib.sha1()
+    size = 0
+
+    try:
+        while size <= CACHE_MAX_SIZE:
+            chunk = response.read(64 * 1024)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            checksum.update(chunk)
+            content.write(chunk)
+    finally:
+        response.close()
+
+    if size > CACHE_MAX_SIZE:
+        content.close()
+        raise URLError(
+            'The URL cannot be used due to:',
+            ['The data is larger than %s bytes.' % CACHE_MAX_SIZE]
+        )
+
+    content.seek(0)
+    return File(content), checksum.hexdigest(), size, response.info()
+
+
+def compress(content, checksum):
+    """
+    Store content compressed, under its checksum.
+
+    Content is always compressed with gzip, and also with brotli when the
+    `brotli` package is installed. Compression runs once, when content is
+    stored, so that it can be served to clients as it is.
+
+    Parameters
+    ----------
+    content : django.core.files.File
+        Content to compress.
+    checksum : str
+        Checksum of the content.
+
+    Returns
+    -------
+    tuple
+        Names of gzip and brotli files (empty when not compressed with
+        brotli), and their total size.
+    """
+    storage = CachedContent._meta.get_field('content').storage
+    upload_to = CachedContent._meta.get_field('content').upload_to
+
+    gzip_name = '%s/%s.gz' % (upload_to, checksum)
+    if not storage.exists(gzip_name):
+        compressed = tempfile.TemporaryFile()
+
+        try:
+            with gzip.GzipFile(
+                    filename='', mode='wb', fileobj=compressed, mtime=0
+            ) as gzip_file:
+                for chunk in content.chunks():
+                    gzip_file.write(chunk)
+
+            compressed.seek(0)
+            gzip_name = save_file(storage, gzip_name, File(compressed))
+        finally:
+            compressed.close()
+
+    stored_size = storage.size(gzip_name)
+    brotli_name = ''
+
+    if brotli is not None:
+        brotli_name = '%s/%s.br' % (upload_to, checksum)
+        if not storage.exists(brotli_name):
+            content.seek(0)
+            brotli_name = save_file(
+                storage,
+                brotli_name,
+                ContentFile(brotli.compress(content.read()))
+            )
+
+        stored_size += storage.size(brotli_name)
+
+    return gzip_name, brotli_name, stored_size
+
+
+def decompress(compressed, chunk_size=64 * 1024):
+    """
+    Decompress gzip content on the fly, chunk by chunk.
+
+    Parameters
+    ----------
+    compressed : file
+        File with gzip content, closed when read.
+    chunk_size : int
+        Number of compressed bytes read at once.
+
+    Returns
+    -------
+    generator
+        Chunks of decompressed content.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    try:
+        while True:
+            chunk = compressed.read(chunk_size)
+            if not chunk:
+                break
+
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+
+        yield decompressor.flush()
+    finally:
+        compressed.close()
+
+
+def read_content(cached):
+    """
+    Read cached content, decompressed.
+
+    Parameters
+    ----------
+    cached : geokey_webresources.models.CachedContent
+        Cached content to read.
+
+    Returns
+    -------
+    str
+        Content.
+    """
+    content = cached.content.storage.open(cached.content.name, 'rb')
+
+    if cached.encoding == 'gzip':
+        return ''.join(decompress(content))
+
+    try:
+        return content.read()
+    finally:
+        content.close()
+
+
+def accepted_encodings(header):
+    """
+    Get content encodings accepted by the client.
+
+    Parameters
+    ----------
+    header : str
+        Value of the `Accept-Encoding` header.
+
+    Returns
+    -------
+    set
+        Accepted content encodings, excluding the ones with zero quality.
+    """
+    encodings = set()
+
+    for part in header.split(','):
+        coding, _, parameters = part.partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+
+        for parameter in parameters.split(';'):
+            name, _, value = parameter.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+
+        if coding and quality > 0:
+            encodings.add(coding)
+
+    return encodings
+
+
+def byte_range(header, size):
+    """
+    Get the byte range requested by the client.
+
+    Only a single range is supported, other requests (and ranges that are
+    not valid) are served whole.
+
+    Parameters
+    ----------
+    header : str
+        Value of the `Range` header.
+    size : int
+        Size of the file.
+
+    Returns
+    -------
+    tuple
+        First and last (inclusive) byte, `None` when the whole file is
+        requested.
+
+    Raises
+    ------
+    ValueError
+        When the range is not satisfiable.
+    """
+    unit, _, ranges = header.partition('=')
+
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None
+
+    first, separator, last = ranges.strip().partition('-')
+
+    if not separator or not (first or last) or not all(
+            value.isdigit() for value in (first, last) if value):
+        return None
+
+    if not first:
+        first = max(size - int(last), 0)
+        last = size - 1
+    else:
+        first = int(first)
+        last = int(last) if last else size - 1
+
+        if first > last:
+            return None
+
+        last = min(last, size - 1)
+
+    if first > last or first >= size:
+        raise ValueError('Range is not satisfiable.')
+
+    return first, last
+
+
+def read_range(fileobj, first, last, chunk_size=64 * 1024):
+    """
+    Read a byte range of a file, chunk by chunk.
+
+    Parameters
+    ----------
+    fileobj : file
+        File to read, closed when read.
+    first : int
+        First byte of the range.
+    last : int
+        Last (inclusive) byte of the range.
+    chunk_size : int
+        Number of bytes read at once.
+
+    Returns
+    -------
+    generator
+        Chunks of the range.
+    """
+    try:
+        fileobj.seek(first)
+        remaining = last - first + 1
+
+        while remaining > 0:
+            chunk = fileobj.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+def _fetch(cached, url, source_url):
+    """
+    Fetch content of a URL and store it in the cache.
+
+    Content is stored under its checksum, so identical content of different
+    URLs is stored once.
+
+    Parameters
+    ----------
+    cached : geokey_webresources.models.CachedContent
+        Cached content to revalidate, `None` if the URL is not cached yet.
+    url : str
+        Normalised URL.
+    source_url : str
+        URL to fetch content from.
+
+    Returns
+    -------
+    geokey_webresources.models.CachedContent
+        Cached content.
+    """
+    storage = CachedContent._meta.get_field('content').storage
+    now = timezone.now()
+
+    downloaded = None
+    if cached is not None and storage.exists(cached.content.name):
+        downloaded = download(source_url, cached.etag, cached.last_modified)
+
+        if downloaded is None:
+            count('hits')
+            cached.fetched = now
+            cached.accessed = now
+            cached.save(update_fields=['fetched', 'accessed'])
+            return cached
+
+    if downloaded is None:
+        downloaded = download(source_url)
+
+    count('misses')
+
+    content, checksum, size, headers = downloaded
+
+    try:
+        name, brotli_name, stored_size = compress(content, checksum)
+    finally:
+        content.close()
+
+    values = {
+        'checksum': checksum,
+        'content': name,
+        'encoding': 'gzip',
+        'brotli': brotli_name,
+        'content_type': headers.get('Content-Type', '')[:100],
+        'size': size,
+        'stored_size': stored_size,
+        'etag': headers.get('ETag', '')[:200],
+        'last_modified': headers.get('Last-Modified', '')[:100],
+        'fetched': now,
+        'accessed': now
+    }
+
+    if cached is None:
+        try:
+            with transaction.atomic():
+                return CachedContent.objects.create(url=url, **values)
+        except IntegrityError:
+            cached = CachedContent.objects.get(url=url)
+
+    previous = [getattr(cached, field).name for field in FILE_FIELDS]
+
+    for field in DERIVED_FIELDS:
+        derived = getattr(cached, field).name
+
+        if (cached.checksum == checksum and derived and
+                storage.exists(derived)):
+            values[field] = derived
+            values['stored_size'] += storage.size(derived)
+        else:
+            values[field] = ''
+
+    for field, value in values.items():
+        setattr(cached, field, value)
+    cached.save()
+
+    delete_unused_content(
+        previous_name for previous_name in previous
+        if previous_name not in [getattr(cached, field).name
+                                 for field in FILE_FIELDS]
+    )
+
+    return cached
+
+
+def get_cached_content(webresource):
+    """
+    Get cached content of the URL of a web resource.
+
+    Content is cached once per normalised URL and shared by all web
+    resources pointing to it, in any project. It is fetched from the remote
+    server when not cached yet, and revalidated when older than
+    `CACHE_TIMEOUT` seconds. Only one request fetches a URL at a time (the
+    lock is kept in the Django cache): other requests are served content
+    that is out of date meanwhile, or fail when there is none yet. The web
+    resource is linked to the cached content, which is released when not
+    used by the web resource anymore. Time of the access is recorded for
+    eviction of the least recently used content, which runs when content
+    fetched anew takes the cache (or the project) over its size limit.
+
+    Parameters
+    ----------
+    webresource : geokey_webresources.models.WebResource
+        Web resource to get cached content of.
+
+    Returns
+    -------
+    geokey_webresources.models.CachedContent
+        Cached content.
+
+    Raises
+    ------
+    URLError
+        When content is not cached and cannot be fetched.
+    FetchInProgressError
+        When content is not cached and is being fetched by another request.
+    """
+    url = normalise_url(webresource.url)
+    cached = webresource.cached_content
+
+    if cached is None or cached.url != url:
+        cached = CachedContent.objects.filter(url=url).first()
+
+    now = timezone.now()
+    fetched = cached is None or (
+        cached.fetched < now - timedelta(seconds=CACHE_TIMEOUT)
+    )
+
+    if fetched and not cache.add(
+            _fetch_key(url),
+            True,
+            2 * CACHE_FETCH_TIMEOUT):
+        if cached is None:
+            raise FetchInProgressError()
+
+        fetched = False
+
+    if fetched:
+        try:
+            cached = _fetch(cached, url, webresource.url)
+        finally:
+            cache.delete(_fetch_key(url))
+    else:
+        count('hits')
+
+        if cached.accessed < now - timedelta(
+                seconds=CACHE_ACCESS_RESOLUTION):
+            CachedContent.objects.filter(pk=cached.id).update(accessed=now)
+            cached.accessed = now
+
+    previous = webresource.cached_content_id
+    if previous != cached.id:
+        WebResource._base_manager.filter(pk=webresource.id).update(
+            cached_content=cached
+        )
+        webresource.cached_content = cached
+
+        if previous is not None:
+            release_cached_content([previous])
+
+    if fetched and _over_limits(webresource.project_id):
+        evict_cached_content(keep=[cached.id])
+
+    return cached
+
+
+def store_derived(cached, field, name, build):
+    """
+    Store a file derived from cached content, once.
+
+    The file is built only when it is not stored yet, and counts towards the
+    stored size of the content. The previous file of the field is deleted,
+    when not used anymore.
+
+    Parameters
+    ----------
+    cached : geokey_webresources.models.CachedContent
+        Cached content.
+    field : str
+        Name of the file field: `features` or `flatgeobuf`.
+    name : str
+        Name of the file, derived from the checksum of the content.
+    build : callable
+        Returns the file to store, as `django.core.files.File`.
+
+    Returns
+    -------
+    str
+        Name of the stored file.
+    """
+    storage = CachedContent._meta.get_field(field).storage
+    previous = getattr(cached, field).name
+
+    if previous == name and storage.exists(name):
+        return name
+
+    if not storage.exists(name):
+        derived = build()
+
+        try:
+            name = save_file(storage, name, derived)
+        finally:
+            derived.close()
+
+    if previous != name:
+        stored_size = cached.stored_size + storage.size(name)
+        if previous and storage.exists(previous):
+            stored_size -= storage.size(previous)
+
+        CachedContent.objects.filter(pk=cached.id).update(**{
+            field: name,
+            'stored_size': stored_size
+        })
+        setattr(cached, field, name)
+        cached.stored_size = stored_size
+
+        delete_unused_content([previous])
+
+    return name
+
+
+def delete_unused_content(names):
+    """
+    Delete files of cached content, which are not used anymore.
+
+    Parameters
+    ----------
+    names : iterable
+        Names of files of cached content.
+    """
+    storage = CachedContent._meta.get_field('content').storage
+
+    for name in set(names):
+        if name and not CachedContent.objects.filter(
+                reduce(or_, [Q(**{field: name}) for field in FILE_FIELDS])
+        ).exists():
+            storage.delete(name)
+
+
+def release_cached_content(ids):
+    """
+    Release cached content, which is not used by any web resource.
+
+    References of cached content are counted among active and inactive web
+    resources. Cached content without references is deleted, together with
+    its file when no other cached content shares it.
+
+    Parameters
+    ----------
+    ids : iterable
+        IDs of cached content to release.
+
+    Returns
+    -------
+    int
+        Number of deleted cached content.
+    """
+    ids = set(cached_id for cached_id in ids if cached_id is not None)
+
+    if not ids:
+        return 0
+
+    unused = list(CachedContent.objects.filter(pk__in=ids).annotate(
+        references=Count(Case(When(
+            webresources__status__in=[STATUS.active, STATUS.inactive],
+            then=1
+        )))
+    ).filter(references=0).values_list('pk', *FILE_FIELDS))
+
+    CachedContent.objects.filter(
+        pk__in=[values[0] for values in unused]
+    ).delete()
+
+    delete_unused_content(name for values in unused for name in values[1:])
+
+    return len(unused)
+
+
+def release_changed_content(ids):
+    """
+    Release cached content of web resources, whose URL has changed.
+
+    Web resources are unlinked from cached content of their previous URL,
+    which is released right away instead of on the next request for data.
+
+    Parameters
+    ----------
+    ids : iterable
+        IDs of web resources.
+
+    Returns
+    -------
+    int
+        Number of deleted cached content.
+    """
+    changed = [
+        (webresource_id, cached_id)
+        for webresource_id, url, cached_id, cached_url
+        in WebResource._base_manager.filter(
+            pk__in=ids,
+            cached_content__isnull=False
+        ).values_list('pk', 'url', 'cached_content', 'cached_content__url')
+        if normalise_url(url) != cached_url
+    ]
+
+    if not changed:
+        return 0
+
+    WebResource._base_manager.filter(
+        pk__in=[webresource_id for webresource_id, _ in changed]
+    ).update(cached_content=None)
+
+    return release_cached_content(cached_id for _, cached_id in changed)
+
+
+def select_evictions(entries, max_size, project_max_size=None, keep=()):
+    """
+    Select cached content to evict, the least recently used first.
+
+    First, content is evicted from projects using more than their quota.
+    Content shared by many projects counts towards the quota of each of
+    them. Then, content is evicted until the total size of cached files is
+    within the limit. Files shared by many entries are counted once, and
+    freed only when all of them are evicted.
+
+    Parameters
+    ----------
+    entries : list
+        All cached content, as `CacheEntry`.
+    max_size : int
+        Maximum total size (in bytes) of cached files.
+    project_max_size : int
+        Maximum size (in bytes) of content used by a single project, no
+        quota when not set.
+    keep : iterable
+        IDs of cached content that must not be evicted.
+
+    Returns
+    -------
+    set
+        IDs of cached content to evict.
+    """
+    keep = set(keep)
+    order = sorted(
+        [entry for entry in entries if entry.id not in keep],
+        key=lambda entry: entry.accessed
+    )
+    evicted = set()
+
+    if project_max_size is not None:
+        usage = defaultdict(int)
+        for entry in entries:
+            for project_id in entry.projects:
+                usage[project_id] += entry.size
+
+        for entry in order:
+            if any(usage[project_id] > project_max_size
+                   for project_id in entry.projects):
+                evicted.add(entry.id)
+
+                for project_id in entry.projects:
+                    usage[project_id] -= entry.size
+
+    references = defaultdict(int)
+    sizes = {}
+    for entry in entries:
+        if entry.id not in evicted:
+            references[entry.name] += 1
+            sizes[entry.name] = entry.size
+
+    total = sum(sizes.values())
+
+    for entry in order:
+        if total <= max_size:
+            break
+
+        if entry.id in evicted:
+            continue
+
+        evicted.add(entry.id)
+        references[entry.name] -= 1
+
+        if not references[entry.name]:
+            total -= entry.size
+
+    return evicted
+
+
+def _limits():
+    """Return maximum total size and maximum size of a single project."""
+    return (
+        getattr(settings, 'WEBRESOURCES_CACHE_SIZE', CACHE_SIZE),
+        getattr(
+            settings,
+            'WEBRESOURCES_CACHE_PROJECT_SIZE',
+            CACHE_PROJECT_SIZE
+        )
+    )
+
+
+def _over_limits(project_id):
+    """
+    Check whether cached content is over the size limits.
+
+    Only sizes are read, for all content and for content used by the
+    project, so it is cheap compared to eviction, which reads the whole
+    index of cached content. Files shared by many entries are counted once,
+    as by `select_evictions`.
+    """
+    max_size, project_max_size = _limits()
+
+    sizes = dict(CachedContent.objects.values_list('content', 'stored_size'))
+
+    if sum(sizes.values()) > max_size:
+        return True
+
+    project_size = CachedContent.objects.filter(
+        pk__in=WebResource.objects.filter(
+            project=project_id
+        ).values('cached_content')
+    ).aggregate(size=Sum('stored_size'))['size'] or 0
+
+    return project_size > project_max_size
+
+
+def evict_cached_content(max_size=None, project_max_size=None, keep=()):
+    """
+    Evict the least recently used cached content over the size limits.
+
+    Decisions are made from the index of cached content in the database,
+    without scanning files. Web resources using evicted content fetch it
+    again when needed.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum total size (in bytes) of cached files, the
+        `WEBRESOURCES_CACHE_SIZE` setting when not set.
+    project_max_size : int
+        Maximum size (in bytes) of content used by a single project, the
+        `WEBRESOURCES_CACHE_PROJECT_SIZE` setting when not set.
+    keep : iterable
+        IDs of cached content that must not be evicted.
+
+    Returns
+    -------
+    int
+        Number of evicted cached content.
+    """
+    if max_size is None:
+        max_size = _limits()[0]
+    if project_max_size is None:
+        project_max_size = _limits()[1]
+
+    projects = defaultdict(set)
+    for cached_id, project_id in WebResource.objects.filter(
+            cached_content__isnull=False
+    ).values_list('cached_content', 'project').order_by().distinct():
+        projects[cached_id].add(project_id)
+
+    names = {}
+    entries = []
+    for values in CachedContent.objects.values_list(
+            'pk',
+            'stored_size',
+            'accessed',
+            *FILE_FIELDS):
+        cached_id, size, accessed = values[:3]
+        names[cached_id] = values[3:]
+        entries.append(CacheEntry(
+            cached_id,
+            values[3],
+            size,
+            accessed,
+            projects[cached_id]
+        ))
+
+    evicted = select_evictions(entries, max_size, project_max_size, keep)
+
+    if not evicted:
+        return 0
+
+    CachedContent.objects.filter(pk__in=evicted).delete()
+    delete_unused_content(
+        name for cached_id in evicted for name in names[cached_id]
+    )
+    count('evictions', len(evicted))
+
+    return len(evicted)
@@ -0,0 +1,155 @@
+"""All helpers for cloning."""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from ..base import ACTION, ORDER_GAP
+from ..exceptions import URLError
+from ..models import WebResource, SymbolVariant
+from ..signals import send_bulk_change
+from .url_helpers import check_urls
+
+
+def clone_webresources(source, target, creator, ids=None,
+                       checked_within=None, workers=8):
+    """
+    Clone web resources from one project to another.
+
+    Symbols (and their variants) and cached content of URLs are reused by
+    reference, so their files are never duplicated.
+    URLs are checked again, unless they were checked within the given number
+    of seconds. All web resources are created with `bulk_create` in a single
+    transaction.
+
+    Parameters
+    ----------
+    source : geokey.projects.models.Project
+        Project to clone web resources from.
+    target : geokey.projects.models.Project
+        Project to clone web resources to.
+    creator : geokey.users.models.User
+        User cloning web resources.
+    ids : list
+        IDs of web resources to clone, all web resources if not set.
+    checked_within : int
+        Number of seconds, within which URLs are not checked again.
+    workers : int
+        Maximum number of URLs checked at the same time.
+
+    Returns
+    -------
+    list
+        Report of each web resource: its ID, name, ID of the clone and
+        errors, if any.
+
+    Raises
+    ------
+    DoesNotExist
+        When one or more web resources were not found.
+    """
+    webresources = source.webresources.order_by('order', 'pk')
+
+    if ids is not None:
+        ids = set(int(webresource_id) for webresource_id in ids)
+        webresources = webresources.filter(pk__in=ids)
+
+    webresources = list(webresources.prefetch_related('symbol_variants'))
+    found = set(webresource.id for webresource in webresources)
+
+    if ids is not None and found != ids:
+        raise WebResource.DoesNotExist(
+            'One or more web resources were not found.'
+        )
+
+    now = timezone.now()
+    if checked_within is None:
+        to_check = webresources
+    else:
+        checked_after = now - timedelta(seconds=checked_within)
+        to_check = [
+            webresource for webresource in webresources
+            if webresource.url_checked is None or
+            webresource.url_checked < checked_after
+        ]
+
+    dataformats = dict(zip(
+        [webresource.id for webresource in to_check],
+        check_urls(
+            [webresource.url for webresource in to_check],
+            workers=workers
+        )
+    ))
+
+    report = []
+    clones = []
+
+    with transaction.atomic():
+        last_order = target.webresources.aggregate(last=Max('order'))['last']
+        order = last_order if last_order is not None else -ORDER_GAP
+
+        for webresource in webresources:
+            result = {
+                'source': webresource.id,
+                'name': webresource.name,
+                'id': None,
+                'errors': []
+            }
+            report.append(result)
+
+            dataformat = dataformats.get(
+                webresource.id,
+                webresource.dataformat
+            )
+            if isinstance(dataformat, URLError):
+                result['errors'].append(dataformat.message)
+                result['errors'].extend(dataformat.errors)
+                continue
+
+            order += ORDER_GAP
+            clones.append((result, webresource, WebResource(
+                status=webresource.status,
+                name=webresource.name,
+                description=webresource.description,
+                dataformat=dataformat,
+                url=webresource.url,
+                url_checked=(
+                    now if webresource.id in dataformats
+                    else webresource.url_checked
+                ),
+                order=order,
+                colour=webresource.colour,
+                symbol=webresource.symbol.name,
+                cached_content_id=webresource.cached_content_id,
+                project=target,
+                creator=creator
+            )))
+
+        created = WebResource.objects.bulk_create(
+            [clone for _, _, clone in clones]
+        )
+        SymbolVariant.objects.bulk_create([
+            SymbolVariant(
+                webresource=clone,
+                source=variant.source,
+                scale=variant.scale,
+                imageformat=variant.imageformat,
+                image=variant.image.name,
+                width=variant.width,
+                height=variant.height
+            )
+            for (_, webresource, _), clone in zip(clones, created)
+            for variant in webresource.symbol_variants.all()
+        ])
+        send_bulk_change(
+            WebResource,
+            [(clone.id, target.id) for clone in created],
+            ACTION.created
+        )
+
+    for (result, _, _), clone in zip(clones, created):
+        result['id'] = clone.id
+
+    return report
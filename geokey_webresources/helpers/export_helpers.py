@@ -0,0 +1,256 @@
+"""All helpers for the export."""
+
+import json
+import time
+import zlib
+import struct
+import zipfile
+
+from itertools import chain
+
+
+EXPORT_FORMATS = ('ndjson', 'json', 'zip')
+EXPORT_FIELDS = (
+    'name', 'description', 'url', 'colour', 'order', 'dataformat', 'status'
+)
+
+# Files in a zip archive are written with a data descriptor (bit 3), so that
+# sizes and CRC can follow the data. Names are encoded in UTF-8 (bit 11).
+ZIP_FLAGS = 0x08 | 0x800
+ZIP_VERSION = 20
+
+# Sizes are not known before files are streamed, so local headers always
+# have a Zip64 extra field (sizes in data descriptors take 8 bytes). Zip64
+# is used in the central directory only over the limits of sizes, offsets
+# and number of entries.
+ZIP64_VERSION = 45
+ZIP64_LIMIT = 0xffffffff
+ZIP64_COUNT_LIMIT = 0xffff
+
+
+def export_webresources(webresources):
+    """
+    Export web resources one by one.
+
+    Web resources are read with a queryset iterator, so that they are never
+    all loaded into memory.
+
+    Parameters
+    ----------
+    webresources : django.db.models.Queryset
+        Web resources to export.
+
+    Returns
+    -------
+    generator
+        Exported web resources.
+    """
+    for webresource in webresources.order_by(
+            'project', 'order', 'pk').iterator():
+        exported = dict(
+            (field, getattr(webresource, field)) for field in EXPORT_FIELDS
+        )
+        exported['project'] = webresource.project_id
+        exported['symbol'] = webresource.symbol.name or None
+
+        yield exported
+
+
+def stream_ndjson(exported):
+    """
+    Stream exported web resources as NDJSON, one web resource per line.
+
+    Parameters
+    ----------
+    exported : iterable
+        Exported web resources.
+
+    Returns
+    -------
+    generator
+        Lines of NDJSON.
+    """
+    for webresource in exported:
+        yield json.dumps(webresource) + '\n'
+
+
+def stream_json(exported):
+    """
+    Stream exported web resources as a JSON array.
+
+    Parameters
+    ----------
+    exported : iterable
+        Exported web resources.
+
+    Returns
+    -------
+    generator
+        Chunks of JSON.
+    """
+    separator = '[\n'
+
+    for webresource in exported:
+        yield separator + json.dumps(webresource)
+        separator = ',\n'
+
+    yield '[]\n' if separator == '[\n' else '\n]\n'
+
+
+def stream_zip(files):
+    """
+    Stream files as a zip archive.
+
+    Each file is compressed while being read, so neither the files, nor the
+    archive, are ever fully loaded into memory. Zip64 is used, so files and
+    archives can be larger than 4 GiB and have more than 65535 entries.
+
+    Parameters
+    ----------
+    files : iterable
+        Pairs of file name and iterable of file content chunks.
+
+    Returns
+    -------
+    generator
+        Chunks of zip archive.
+    """
+    offset = 0
+    central_directory = []
+
+    now = time.localtime()
+    dostime = now[3] << 11 | now[4] << 5 | now[5] // 2
+    dosdate = (now[0] - 1980) << 9 | now[1] << 5 | now[2]
+
+    for name, chunks in files:
+        name = name.encode('utf-8') if isinstance(name, unicode) else name
+        header_offset = offset
+
+        extra = struct.pack('<HHQQ', 1, 16, 0, 0)
+        header = struct.pack(
+            zipfile.structFileHeader, zipfile.stringFileHeader,
+            ZIP64_VERSION, 0, ZIP_FLAGS, zipfile.ZIP_DEFLATED, dostime,
+            dosdate, 0, ZIP64_LIMIT, ZIP64_LIMIT, len(name), len(extra)
+        ) + name + extra
+        offset += len(header)
+        yield header
+
+        crc = 0
+        size = 0
+        compressed_size = 0
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION,
+            zlib.DEFLATED,
+            -15
+        )
+
+        for chunk in chunks:
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+
+            compressed = compressor.compress(chunk)
+            if compressed:
+                compressed_size += len(compressed)
+                yield compressed
+
+        compressed = compressor.flush()
+        compressed_size += len(compressed)
+        crc &= 0xffffffff
+
+        descriptor = struct.pack(
+            '<4sLQQ', 'PK\x07\x08', crc, compressed_size, size
+        )
+        offset += compressed_size + len(descriptor)
+        yield compressed + descriptor
+
+        zip64 = []
+        if size >= ZIP64_LIMIT or compressed_size >= ZIP64_LIMIT:
+            zip64.extend([size, compressed_size])
+            size = compressed_size = ZIP64_LIMIT
+        if header_offset >= ZIP64_LIMIT:
+            zip64.append(header_offset)
+            header_offset = ZIP64_LIMIT
+
+        extra = ''
+        if zip64:
+            extra = struct.pack(
+                '<HH%sQ' % len(zip64), 1, 8 * len(zip64), *zip64
+            )
+
+        version = ZIP64_VERSION if zip64 else ZIP_VERSION
+        central_directory.append(struct.pack(
+            zipfile.structCentralDir, zipfile.stringCentralDir,
+            version, 0, version, 0, ZIP_FLAGS, zipfile.ZIP_DEFLATED,
+            dostime, dosdate, crc, compressed_size, size, len(name),
+            len(extra), 0, 0, 0, 0, header_offset
+        ) + name + extra)
+
+    entries = len(central_directory)
+    central_directory = ''.join(central_directory)
+    end = ''
+
+    if (entries >= ZIP64_COUNT_LIMIT or
+            len(central_directory) >= ZIP64_LIMIT or offset >= ZIP64_LIMIT):
+        end = struct.pack(
+            zipfile.structEndArchive64, zipfile.stringEndArchive64,
+            44, ZIP64_VERSION, ZIP64_VERSION, 0, 0, entries, entries,
+            len(central_directory), offset
+        ) + struct.pack(
+            zipfile.structEndArchive64Locator,
+            zipfile.stringEndArchive64Locator,
+            0, offset + len(central_directory), 1
+        )
+
+    yield central_directory + end + struct.pack(
+        zipfile.structEndArchive, zipfile.stringEndArchive,
+        0, 0, min(entries, ZIP64_COUNT_LIMIT),
+        min(entries, ZIP64_COUNT_LIMIT),
+        min(len(central_directory), ZIP64_LIMIT),
+        min(offset, ZIP64_LIMIT), 0
+    )
+
+
+def stream_archive(webresources):
+    """
+    Stream web resources as a zip archive, together with their symbols.
+
+    The archive contains `webresources.ndjson` with exported web resources
+    and all symbol files, stored under their original names.
+
+    Parameters
+    ----------
+    webresources : django.db.models.Queryset
+        Web resources to export.
+
+    Returns
+    -------
+    generator
+        Chunks of zip archive.
+    """
+    def symbols():
+        names = set()
+
+        for webresource in webresources.exclude(symbol='').exclude(
+                symbol__isnull=True).iterator():
+            symbol = webresource.symbol
+
+            if symbol.name in names or not symbol.storage.exists(symbol.name):
+                continue
+
+            names.add(symbol.name)
+            symbol.open('rb')
+            yield symbol.name, read_and_close(symbol)
+
+    def read_and_close(symbol):
+        try:
+            for chunk in symbol.chunks():
+                yield chunk
+        finally:
+            symbol.close()
+
+    files = [(
+        'webresources.ndjson',
+        stream_ndjson(export_webresources(webresources))
+    )]
+
+    return stream_zip(chain(files, symbols()))
@@ -0,0 +1,922 @@
+"""All helpers for features converted from cached content."""
+
+import sys
+import json
+import mmap
+import struct
+
+from array import array
+from collections import OrderedDict
+from xml.etree import ElementTree
+
+from django.core.files.base import ContentFile
+
+from ..base import FORMAT, FEATURE_STORE_VERSION, FEATURE_STORE_OPEN
+from ..models import CachedContent
+from .cache_helpers import read_content, store_derived
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = 'GKWF'
+
+# Header: magic, version of the format, reserved, numbers of features,
+# geometries, rings, vertices and heights (as many as vertices, when any
+# vertex has a Z coordinate, none otherwise)
+HEADER = struct.Struct('<4sHHIIIII')
+
+GEOMETRY_TYPES = (
+    None,
+    'Point',
+    'LineString',
+    'Polygon',
+    'MultiPoint',
+    'MultiLineString',
+    'MultiPolygon',
+    'GeometryCollection'
+)
+
+# Names, type codes and numbers of items of all sections following the
+# header, by numbers of features, geometries, rings, vertices and heights
+SECTION_NAMES = (
+    'types',
+    'bboxes',
+    'features',
+    'geometries',
+    'rings',
+    'coordinates',
+    'heights',
+    'members'
+)
+SECTIONS = (
+    ('B', lambda f, g, r, v, h: f),
+    ('d', lambda f, g, r, v, h: 4 * f),
+    ('I', lambda f, g, r, v, h: f + 1),
+    ('I', lambda f, g, r, v, h: g + 1),
+    ('I', lambda f, g, r, v, h: r + 1),
+    ('d', lambda f, g, r, v, h: 2 * v),
+    ('d', lambda f, g, r, v, h: h),
+    ('I', lambda f, g, r, v, h: f + 1)
+)
+
+# Feature stores opened by this process, by name
+_stores = OrderedDict()
+
+
+def geometry_parts(geometry):
+    """Return type code and parts (lists of rings) of a GeoJSON geometry."""
+    if not isinstance(geometry, dict):
+        return 0, []
+
+    geometry_type = geometry.get('type')
+    coordinates = geometry.get('coordinates')
+
+    if geometry_type == 'Point':
+        parts = [[[coordinates]]]
+    elif geometry_type == 'LineString':
+        parts = [[coordinates]]
+    elif geometry_type == 'Polygon':
+        parts = [coordinates]
+    elif geometry_type == 'MultiPoint':
+        parts = [[[point]] for point in coordinates]
+    elif geometry_type == 'MultiLineString':
+        parts = [[line] for line in coordinates]
+    elif geometry_type == 'MultiPolygon':
+        parts = coordinates
+    elif geometry_type == 'GeometryCollection':
+        parts = [
+            part
+            for member in geometry.get('geometries') or []
+            for part in geometry_parts(member)[1]
+        ]
+    else:
+        return 0, []
+
+    return GEOMETRY_TYPES.index(geometry_type), parts
+
+
+def read_geojson(content):
+    """
+    Read features of GeoJSON content.
+
+    Parameters
+    ----------
+    content : str
+        GeoJSON content.
+
+    Returns
+    -------
+    list
+        GeoJSON features.
+
+    Raises
+    ------
+    ValueError
+        When content is not a GeoJSON feature or feature collection.
+    """
+    data = json.loads(content)
+
+    if isinstance(data, dict) and data.get('type') == 'Feature':
+        features = [data]
+    elif isinstance(data, dict) and data.get('type') == 'FeatureCollection':
+        features = data.get('features')
+    else:
+        features = None
+
+    if not isinstance(features, list):
+        raise ValueError('Data must be a GeoJSON feature collection.')
+
+    return features
+
+
+def _local_name(element):
+    """Return name of a KML element without its namespace."""
+    return element.tag.rpartition('}')[2]
+
+
+def _kml_children(element, *names):
+    """Return children of a KML element with one of the names."""
+    return [child for child in element if _local_name(child) in names]
+
+
+def _kml_text(element, name):
+    """Return stripped text of the first child of a KML element."""
+    children = _kml_children(element, name)
+    return (children[0].text or '').strip() if children else None
+
+
+def _kml_coordinates(element):
+    """Return coordinates (x, y and altitude, if set) of a KML geometry."""
+    return [
+        [float(value) for value in point.split(',')[:3]]
+        for point in (_kml_text(element, 'coordinates') or '').split()
+    ]
+
+
+def _kml_geometry(element):
+    """Return a KML geometry as GeoJSON geometry."""
+    name = _local_name(element)
+
+    if name == 'Point':
+        return {'type': 'Point', 'coordinates': _kml_coordinates(element)[0]}
+    elif name in ('LineString', 'LinearRing'):
+        return {'type': 'LineString', 'coordinates': _kml_coordinates(element)}
+    elif name == 'Polygon':
+        return {
+            'type': 'Polygon',
+            'coordinates': [
+                _kml_coordinates(ring)
+                for boundary in _kml_children(
+                    element,
+                    'outerBoundaryIs',
+                    'innerBoundaryIs'
+                )
+                for ring in _kml_children(boundary, 'LinearRing')
+            ]
+        }
+    elif name == 'MultiGeometry':
+        geometries = [
+            geometry for geometry in (
+                _kml_geometry(child) for child in element
+            )
+            if geometry is not None
+        ]
+        types = set(geometry['type'] for geometry in geometries)
+
+        if len(types) == 1 and types & set(['Point', 'LineString', 'Polygon']):
+            return {
+                'type': 'Multi%s' % types.pop(),
+                'coordinates': [
+                    geometry['coordinates'] for geometry in geometries
+                ]
+            }
+
+        return {'type': 'GeometryCollection', 'geometries': geometries}
+
+    return None
+
+
+def _kml_doctype(*args):
+    """Refuse a document type declaration (or entity) of KML."""
+    raise ValueError('KML must not contain a document type declaration.')
+
+
+def read_kml(content):
+    """
+    Read features of KML content.
+
+    Each placemark is a feature, with its name, description and extended
+    data as properties. Multi-geometries of different types are read as
+    geometry collections. Documents with a document type declaration are
+    not read, so that entities cannot be expanded.
+
+    Parameters
+    ----------
+    content : str
+        KML content.
+
+    Returns
+    -------
+    list
+        GeoJSON features.
+
+    Raises
+    ------
+    ValueError
+        When content is not KML.
+    """
+    parser = ElementTree.XMLParser()
+    # Refuse the declaration while parsing, so that it is found in any
+    # encoding (e.g. UTF-16), before any entity is declared
+    parser.parser.StartDoctypeDeclHandler = _kml_doctype
+    parser.parser.EntityDeclHandler = _kml_doctype
+
+    try:
+        parser.feed(content)
+        root = parser.close()
+    except SyntaxError, error:
+        raise ValueError('Data is not valid KML: %s.' % error)
+
+    if _local_name(root) != 'kml':
+        raise ValueError('Data must be a KML document.')
+
+    features = []
+
+    for placemark in root.iter():
+        if _local_name(placemark) != 'Placemark':
+            continue
+
+        properties = {}
+        for name in ('name', 'description'):
+            text = _kml_text(placemark, name)
+            if text is not None:
+                properties[name] = text
+
+        for extended in _kml_children(placemark, 'ExtendedData'):
+            for data in extended.iter():
+                if _local_name(data) == 'Data':
+                    properties[data.get('name')] = _kml_text(data, 'value')
+                elif _local_name(data) == 'SimpleData':
+                    properties[data.get('name')] = (data.text or '').strip()
+
+        geometry = None
+        for child in placemark:
+            try:
+                geometry = _kml_geometry(child)
+            except (IndexError, ValueError):
+                raise ValueError(
+                    'Coordinates of feature %s are not valid.' % len(features)
+                )
+
+            if geometry is not None:
+                break
+
+        features.append({
+            'type': 'Feature',
+            'geometry': geometry,
+            'properties': properties
+        })
+
+    return features
+
+
+def read_features(content, dataformat):
+    """
+    Read features of content of a web resource.
+
+    Parameters
+    ----------
+    content : str
+        Content of the web resource.
+    dataformat : str
+        Format of the content: GeoJSON or KML.
+
+    Returns
+    -------
+    list
+        GeoJSON features.
+
+    Raises
+    ------
+    ValueError
+        When content is not in the format.
+    """
+    if dataformat == FORMAT.KML:
+        return read_kml(content)
+
+    return read_geojson(content)
+
+
+def build_features(content, dataformat=FORMAT.GeoJSON):
+    """
+    Convert content of a web resource to the binary format of a feature
+    store.
+
+    Features are stored as sections of little-endian arrays, each aligned to
+    8 bytes: geometry types, bounding boxes, offsets of geometries of
+    features, of rings of geometries and of vertices of rings, coordinates
+    (x and y) of all vertices, their Z coordinates (only when any vertex has
+    one, NaN for vertices without it), and offsets of other members of
+    features (properties, ID), which follow as JSON objects. Geometry
+    collections are kept as GeoJSON with other members, and their vertices
+    are stored as parts of the feature.
+
+    Parameters
+    ----------
+    content : str
+        Content of the web resource.
+    dataformat : str
+        Format of the content: GeoJSON or KML.
+
+    Returns
+    -------
+    str
+        Feature store.
+
+    Raises
+    ------
+    ValueError
+        When content is not in the format.
+    """
+    features = read_features(content, dataformat)
+
+    types = array('B')
+    bboxes = array('d')
+    feature_offsets = array('I', [0])
+    geometry_offsets = array('I', [0])
+    ring_offsets = array('I', [0])
+    coordinates = array('d')
+    heights = array('d')
+    member_offsets = array('I', [0])
+    members = []
+    has_z = False
+
+    for number, feature in enumerate(features):
+        if not isinstance(feature, dict):
+            raise ValueError('Feature %s is not a GeoJSON feature.' % number)
+
+        type_code, parts = geometry_parts(feature.get('geometry'))
+        start = len(coordinates)
+
+        try:
+            for rings in parts:
+                for ring in rings:
+                    for point in ring:
+                        coordinates.append(float(point[0]))
+                        coordinates.append(float(point[1]))
+
+                        if len(point) > 2:
+                            heights.append(float(point[2]))
+                            has_z = True
+                        else:
+                            heights.append(float('nan'))
+
+                    ring_offsets.append(len(coordinates) // 2)
+
+                geometry_offsets.append(len(ring_offsets) - 1)
+        except (TypeError, IndexError, ValueError):
+            raise ValueError(
+                'Coordinates of feature %s are not valid.' % number
+            )
+
+        xs = coordinates[start::2]
+        ys = coordinates[start + 1::2]
+        if xs:
+            bboxes.extend([min(xs), min(ys), max(xs), max(ys)])
+        else:
+            bboxes.extend([float('inf'), float('inf'),
+                           float('-inf'), float('-inf')])
+
+        types.append(type_code)
+        feature_offsets.append(len(geometry_offsets) - 1)
+
+        member = json.dumps(
+            dict(
+                (key, value) for key, value in feature.items()
+                if key != 'type' and (
+                    key != 'geometry' or
+                    type_code == GEOMETRY_TYPES.index('GeometryCollection')
+                )
+            ),
+            sort_keys=True
+        )
+        members.append(member)
+        member_offsets.append(member_offsets[-1] + len(member))
+
+    if not has_z:
+        heights = array('d')
+
+    sections = [
+        types,
+        bboxes,
+        feature_offsets,
+        geometry_offsets,
+        ring_offsets,
+        coordinates,
+        heights,
+        member_offsets
+    ]
+    chunks = [HEADER.pack(
+        MAGIC,
+        FEATURE_STORE_VERSION,
+        0,
+        len(types),
+        len(geometry_offsets) - 1,
+        len(ring_offsets) - 1,
+        len(coordinates) // 2,
+        len(heights)
+    )]
+    size = HEADER.size
+
+    for section in sections:
+        if sys.byteorder == 'big':
+            section.byteswap()
+
+        padding = -size % 8
+        chunks.append('\0' * padding)
+        chunks.append(section.tostring())
+        size += padding + len(chunks[-1])
+
+    chunks.extend(members)
+
+    return ''.join(chunks)
+
+
+class FeatureStore(object):
+    """
+    Features read from the binary format of a feature store.
+
+    Geometries and members of features are read from the buffer only when
+    requested, without parsing the whole store or copying it. With NumPy
+    installed, bounding boxes and coordinates of all features are processed
+    as arrays read from the buffer (vectorised).
+
+    Parameters
+    ----------
+    buffer : str or mmap.mmap
+        Feature store.
+
+    Raises
+    ------
+    ValueError
+        When buffer is not a feature store of the current version.
+    """
+
+    def __init__(self, buffer):
+        """Read the header and find sections of the feature store."""
+        if len(buffer) < HEADER.size:
+            raise ValueError('Data is not a feature store.')
+
+        magic, version, _, features, geometries, rings, vertices, heights = (
+            HEADER.unpack_from(buffer, 0)
+        )
+
+        if magic != MAGIC:
+            raise ValueError('Data is not a feature store.')
+        if version != FEATURE_STORE_VERSION:
+            raise ValueError(
+                'Version %s of the feature store is not supported.' % version
+            )
+
+        offsets = []
+        offset = HEADER.size
+        for type_code, number in SECTIONS:
+            offset += -offset % 8
+            offsets.append(offset)
+            offset += struct.calcsize('<%s' % type_code) * number(
+                features,
+                geometries,
+                rings,
+                vertices,
+                heights
+            )
+
+        if offset > len(buffer):
+            raise ValueError('Feature store is truncated.')
+
+        self.buffer = buffer
+        self.count = features
+        self.vertex_count = vertices
+        self.has_z = heights > 0
+        self.offsets = dict(zip(SECTION_NAMES, offsets))
+        self._members = offset
+        (
+            self._types,
+            self._bboxes,
+            self._features,
+            self._geometries,
+            self._rings,
+            self._coordinates,
+            self._heights,
+            self._member_offsets
+        ) = offsets
+
+    def __len__(self):
+        """Return the number of features."""
+        return self.count
+
+    def _unpack(self, type_code, section, start, number):
+        """Read a number of items of a section, from the start item."""
+        return struct.unpack_from(
+            '<%s%s' % (number, type_code),
+            self.buffer,
+            section + start * struct.calcsize('<%s' % type_code)
+        )
+
+    def _doubles(self, section, number):
+        """Read a number of doubles of a section as NumPy array."""
+        if not number:
+            return np.zeros(0, dtype='<f8')
+
+        return np.frombuffer(
+            self.buffer,
+            dtype='<f8',
+            count=number,
+            offset=section
+        )
+
+    def _indexes(self, section, number):
+        """Read a number of indexes of a section as NumPy array."""
+        return np.frombuffer(
+            self.buffer,
+            dtype='<u4',
+            count=number,
+            offset=section
+        ).astype(np.int64)
+
+    def bbox(self, index):
+        """Return the bounding box of a feature."""
+        return self._unpack('d', self._bboxes, 4 * index, 4)
+
+    def geometry(self, index):
+        """Return the geometry of a feature, as GeoJSON geometry."""
+        geometry_type = GEOMETRY_TYPES[
+            self._unpack('B', self._types, index, 1)[0]
+        ]
+
+        if geometry_type is None:
+            return None
+        if geometry_type == 'GeometryCollection':
+            return json.loads(self.members(index))['geometry']
+
+        first, last = self._unpack('I', self._features, index, 2)
+        geometries = self._unpack(
+            'I',
+            self._geometries,
+            first,
+            last - first + 1
+        )
+        rings = self._unpack(
+            'I',
+            self._rings,
+            geometries[0],
+            geometries[-1] - geometries[0] + 1
+        )
+        values = self._unpack(
+            'd',
+            self._coordinates,
+            2 * rings[0],
+            2 * (rings[-1] - rings[0])
+        )
+        points = [
+            [values[number], values[number + 1]]
+            for number in range(0, len(values), 2)
+        ]
+
+        if self.has_z:
+            for point, height in zip(points, self._unpack(
+                    'd',
+                    self._heights,
+                    rings[0],
+                    rings[-1] - rings[0])):
+                # NaN marks a vertex without Z coordinate
+                if height == height:
+                    point.append(height)
+
+        parts = [
+            [
+                points[rings[ring] - rings[0]:rings[ring + 1] - rings[0]]
+                for ring in range(
+                    geometries[geometry] - geometries[0],
+                    geometries[geometry + 1] - geometries[0]
+                )
+            ]
+            for geometry in range(len(geometries) - 1)
+        ]
+
+        if geometry_type == 'Point':
+            coordinates = parts[0][0][0]
+        elif geometry_type == 'LineString':
+            coordinates = parts[0][0]
+        elif geometry_type == 'Polygon':
+            coordinates = parts[0]
+        elif geometry_type == 'MultiPoint':
+            coordinates = [part[0][0] for part in parts]
+        elif geometry_type == 'MultiLineString':
+            coordinates = [part[0] for part in parts]
+        else:
+            coordinates = parts
+
+        return {'type': geometry_type, 'coordinates': coordinates}
+
+    def members(self, index):
+        """Return other members of a feature (and geometry collection)."""
+        start, end = self._unpack('I', self._member_offsets, index, 2)
+        return self.buffer[self._members + start:self._members + end]
+
+    def feature(self, index):
+        """Return a feature, as GeoJSON feature."""
+        members = self.members(index)
+
+        if self._unpack('B', self._types, index, 1)[0] == (
+                GEOMETRY_TYPES.index('GeometryCollection')):
+            return '{"type": "Feature", %s' % members[1:]
+
+        return '{"type": "Feature", "geometry": %s%s' % (
+            json.dumps(self.geometry(index)),
+            '}' if members == '{}' else ', %s' % members[1:]
+        )
+
+    def intersecting(self, bbox):
+        """
+        Find features intersecting a bounding box.
+
+        Bounding boxes of features are compared as NumPy arrays, read from
+        the buffer without copying, when NumPy is installed.
+
+        Parameters
+        ----------
+        bbox : tuple
+            West, south, east and north of the bounding box.
+
+        Returns
+        -------
+        list
+            Indexes of features.
+        """
+        west, south, east, north = bbox
+
+        if not self.count:
+            return []
+
+        if np is not None:
+            bboxes = self._doubles(self._bboxes, 4 * self.count).reshape(-1, 4)
+
+            return np.flatnonzero(
+                (bboxes[:, 0] <= east) & (bboxes[:, 2] >= west) &
+                (bboxes[:, 1] <= north) & (bboxes[:, 3] >= south)
+            ).tolist()
+
+        values = self._unpack('d', self._bboxes, 0, 4 * self.count)
+
+        return [
+            index for index, (min_x, min_y, max_x, max_y) in enumerate(zip(
+                values[0::4],
+                values[1::4],
+                values[2::4],
+                values[3::4]
+            ))
+            if min_x <= east and max_x >= west and
+            min_y <= north and max_y >= south
+        ]
+
+    def extent(self):
+        """
+        Return the bounding box of all features.
+
+        Bounding boxes of features are reduced as a NumPy array, when NumPy is
+        installed.
+
+        Returns
+        -------
+        tuple
+            West, south, east and north, `None` when no feature has vertices.
+        """
+        if not self.count:
+            return None
+
+        if np is not None:
+            bboxes = self._doubles(self._bboxes, 4 * self.count).reshape(-1, 4)
+            west, south = bboxes[:, :2].min(axis=0)
+            east, north = bboxes[:, 2:].max(axis=0)
+        else:
+            values = self._unpack('d', self._bboxes, 0, 4 * self.count)
+            west, south = min(values[0::4]), min(values[1::4])
+            east, north = max(values[2::4]), max(values[3::4])
+
+        # Features without vertices have empty (inverted) bounding boxes
+        if west > east:
+            return None
+
+        return float(west), float(south), float(east), float(north)
+
+    def points_in_bbox(self, bbox):
+        """
+        Test which vertices of all features are within a bounding box.
+
+        Coordinates are compared as a NumPy array, read from the buffer
+        without copying. NumPy is required.
+
+        Parameters
+        ----------
+        bbox : tuple
+            West, south, east and north of the bounding box.
+
+        Returns
+        -------
+        numpy.ndarray
+            Mask of vertices within the bounding box.
+
+        Raises
+        ------
+        ImportError
+            When NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError('NumPy is required to test vertices.')
+
+        west, south, east, north = bbox
+        coordinates = self._doubles(
+            self._coordinates,
+            2 * self.vertex_count
+        ).reshape(-1, 2)
+        x = coordinates[:, 0]
+        y = coordinates[:, 1]
+
+        return (x >= west) & (x <= east) & (y >= south) & (y <= north)
+
+    def features_in_bbox(self, bbox):
+        """
+        Find features with any vertex within a bounding box.
+
+        NumPy is required.
+
+        Parameters
+        ----------
+        bbox : tuple
+            West, south, east and north of the bounding box.
+
+        Returns
+        -------
+        list
+            Indexes of features.
+
+        Raises
+        ------
+        ImportError
+            When NumPy is not installed.
+        """
+        inside = np.concatenate((
+            [0],
+            np.cumsum(self.points_in_bbox(bbox), dtype=np.int64)
+        ))
+
+        # First vertex of each feature (and the end of the last one),
+        # through offsets of its geometries and rings
+        geometries = self._indexes(self._features, self.count + 1)
+        rings = self._indexes(
+            self._geometries,
+            int(geometries[-1]) + 1
+        )[geometries]
+        vertices = self._indexes(
+            self._rings,
+            int(rings[-1]) + 1
+        )[rings]
+
+        return np.flatnonzero(
+            inside[vertices[1:]] > inside[vertices[:-1]]
+        ).tolist()
+
+
+def open_features(name):
+    """
+    Open a stored feature store.
+
+    Files are memory-mapped (read-only), so their pages are shared by all
+    worker processes reading them. Feature stores are kept open by each
+    process, up to `FEATURE_STORE_OPEN` of them: names of their files
+    contain the checksum of content, so files never change. Storages without
+    local files are read to memory instead.
+
+    Parameters
+    ----------
+    name : str
+        Name of the file of the feature store.
+
+    Returns
+    -------
+    FeatureStore
+        Feature store.
+
+    Raises
+    ------
+    ValueError
+        When file is not a feature store of the current version.
+    """
+    store = _stores.pop(name, None)
+
+    if store is None:
+        storage = CachedContent._meta.get_field('features').storage
+
+        try:
+            path = storage.path(name)
+        except NotImplementedError:
+            path = None
+
+        if path is None:
+            stored = storage.open(name, 'rb')
+
+            try:
+                buffer = stored.read()
+            finally:
+                stored.close()
+        else:
+            with open(path, 'rb') as stored:
+                buffer = mmap.mmap(
+                    stored.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+                )
+
+        store = FeatureStore(buffer)
+
+    _stores[name] = store
+    while len(_stores) > FEATURE_STORE_OPEN:
+        _stores.popitem(last=False)
+
+    return store
+
+
+def get_features(cached, dataformat=FORMAT.GeoJSON):
+    """
+    Get the feature store of cached content.
+
+    Content is converted once, when features are requested for the first
+    time (or after the format has changed), and the feature store is stored
+    next to the content, counting towards its stored size.
+
+    Parameters
+    ----------
+    cached : geokey_webresources.models.CachedContent
+        Cached content.
+    dataformat : str
+        Format of the content: GeoJSON or KML.
+
+    Returns
+    -------
+    FeatureStore
+        Feature store.
+
+    Raises
+    ------
+    ValueError
+        When content is not in the format.
+    """
+    name = store_derived(
+        cached,
+        'features',
+        '%s/%s.%s.features' % (
+            CachedContent._meta.get_field('features').upload_to,
+            cached.checksum,
+            FEATURE_STORE_VERSION
+        ),
+        lambda: ContentFile(
+            build_features(read_content(cached), dataformat)
+        )
+    )
+
+    return open_features(name)
+
+
+def stream_features(store, indexes, batch_size=100):
+    """
+    Stream features of a feature store as GeoJSON feature collection.
+
+    Parameters
+    ----------
+    store : FeatureStore
+        Feature store.
+    indexes : list
+        Indexes of features to stream.
+    batch_size : int
+        Number of features in one chunk.
+
+    Returns
+    -------
+    generator
+        Chunks of the feature collection.
+    """
+    yield '{"type": "FeatureCollection", "features": ['
+
+    for start in range(0, len(indexes), batch_size):
+        yield '%s%s' % (
+            ', ' if start else '',
+            ', '.join(
+                store.feature(index)
+                for index in indexes[start:start + batch_size]
+            )
+        )
+
+    yield ']}'
@@ -0,0 +1,853 @@
+"""All helpers for the FlatGeobuf format."""
+
+import json
+import math
+import struct
+import tempfile
+
+from django.core.files import File
+
+from ..base import FORMAT, FLATGEOBUF_NODE_SIZE, FLATGEOBUF_VERSION
+from ..models import CachedContent
+from .cache_helpers import store_derived
+from .feature_helpers import GEOMETRY_TYPES, geometry_parts, get_features
+
+
+# Magic bytes: `fgb`, major version 3, `fgb` and patch version 0
+MAGIC = 'fgb\x03fgb\x00'
+
+# Types of columns, as in the FlatGeobuf schema
+COLUMN_TYPES = {'Bool': 2, 'Long': 7, 'Double': 10, 'String': 11, 'Json': 12}
+
+# Index node: bounding box and offset
+NODE = struct.Struct('<ddddQ')
+
+# Maximum of X and Y of centres of features along the Hilbert curve
+HILBERT_MAX = (1 << 16) - 1
+
+
+class _Table(object):
+    """FlatBuffers table: fields by index, with format and value."""
+
+    def __init__(self, fields):
+        """Initiate table, fields with format `None` are references."""
+        self.fields = fields
+
+
+class _String(object):
+    """FlatBuffers string."""
+
+    def __init__(self, value):
+        """Initiate string."""
+        self.value = value.encode('utf-8') if isinstance(
+            value,
+            unicode
+        ) else value
+
+
+class _Vector(object):
+    """FlatBuffers vector of scalars (format of items) or tables (`None`)."""
+
+    def __init__(self, item_format, values):
+        """Initiate vector."""
+        self.item_format = item_format
+        self.values = values
+
+
+def _pad(buf, alignment):
+    """Pad the buffer to the alignment."""
+    buf.extend('\0' * (-len(buf) % alignment))
+
+
+def _write(buf, value):
+    """Write an object referenced by a table, return its position."""
+    if isinstance(value, _Table):
+        return _write_table(buf, value)
+
+    _pad(buf, 4)
+
+    if isinstance(value, _String):
+        position = len(buf)
+        buf.extend(struct.pack('<I', len(value.value)))
+        buf.extend(value.value + '\0')
+        return position
+
+    if value.item_format is None:
+        position = len(buf)
+        buf.extend(struct.pack('<I', len(value.values)))
+        buf.extend('\0' * 4 * len(value.values))
+
+        for number, table in enumerate(value.values):
+            offset = position + 4 + 4 * number
+            struct.pack_into('<I', buf, offset, _write(buf, table) - offset)
+
+        return position
+
+    if struct.calcsize('<%s' % value.item_format) == 8 and len(buf) % 8 == 0:
+        buf.extend('\0' * 4)
+
+    position = len(buf)
+    buf.extend(struct.pack('<I', len(value.values)))
+    buf.extend(struct.pack(
+        '<%s%s' % (len(value.values), value.item_format),
+        *value.values
+    ))
+    return position
+
+
+def _write_table(buf, table):
+    """Write a table after its vtable and objects it references after it."""
+    layout = []
+    size = 4
+
+    for index, field_format, value in sorted(
+            table.fields,
+            key=lambda field: -struct.calcsize('<%s' % (field[1] or 'I'))):
+        field_size = struct.calcsize('<%s' % (field_format or 'I'))
+        size += -size % field_size
+        layout.append((index, size, field_format, value))
+        size += field_size
+
+    fields = max(field[0] for field in table.fields) + 1 if layout else 0
+    vtable = [0] * fields
+    for index, offset, _, _ in layout:
+        vtable[index] = offset
+
+    _pad(buf, 2)
+    vtable_position = len(buf)
+    buf.extend(struct.pack(
+        '<%sH' % (fields + 2),
+        4 + 2 * fields,
+        size,
+        *vtable
+    ))
+
+    _pad(buf, max([4] + [
+        struct.calcsize('<%s' % field_format)
+        for _, _, field_format, _ in layout if field_format is not None
+    ]))
+    position = len(buf)
+    buf.extend('\0' * size)
+    struct.pack_into('<i', buf, position, position - vtable_position)
+
+    for index, offset, field_format, value in layout:
+        if field_format is not None:
+            struct.pack_into('<%s' % field_format, buf, position + offset,
+                             value)
+
+    for index, offset, field_format, value in layout:
+        if field_format is None:
+            struct.pack_into(
+                '<I',
+                buf,
+                position + offset,
+                _write(buf, value) - position - offset
+            )
+
+    return position
+
+
+def _finish(table):
+    """Return a size-prefixed FlatBuffers buffer with the root table."""
+    buf = bytearray('\0' * 4)
+    struct.pack_into('<I', buf, 0, _write_table(buf, table))
+
+    return struct.pack('<I', len(buf)) + str(buf)
+
+
+def _geometry(geometry, typed=True, has_z=False):
+    """Return a GeoJSON geometry as FlatGeobuf geometry table."""
+    geometry_type = geometry['type']
+    fields = []
+
+    if typed:
+        fields.append((6, 'B', GEOMETRY_TYPES.index(geometry_type)))
+
+    if geometry_type == 'GeometryCollection':
+        fields.append((7, None, _Vector(None, [
+            _geometry(member, True, has_z)
+            for member in geometry.get('geometries') or []
+            if geometry_parts(member)[0]
+        ])))
+        return _Table(fields)
+
+    coordinates = geometry['coordinates']
+    if geometry_type == 'MultiPolygon':
+        fields.append((7, None, _Vector(None, [
+            _geometry(
+                {'type': 'Polygon', 'coordinates': polygon},
+                False,
+                has_z
+            )
+            for polygon in coordinates
+        ])))
+        return _Table(fields)
+
+    if geometry_type == 'Point':
+        lines = [[coordinates]]
+    elif geometry_type in ('LineString', 'MultiPoint'):
+        lines = [coordinates]
+    else:
+        lines = coordinates
+
+    xy = []
+    z = []
+    ends = []
+    for line in lines:
+        for point in line:
+            xy.extend(point[:2])
+            z.append(point[2] if len(point) > 2 else float('nan'))
+
+        ends.append(len(xy) // 2)
+
+    if len(ends) > 1:
+        fields.append((0, None, _Vector('I', ends)))
+
+    fields.append((1, None, _Vector('d', xy)))
+    if has_z:
+        fields.append((2, None, _Vector('d', z)))
+    return _Table(fields)
+
+
+def _column_type(value):
+    """Return FlatGeobuf type of a property value."""
+    if isinstance(value, bool):
+        return 'Bool'
+    if isinstance(value, (int, long)) and -2 ** 63 <= value < 2 ** 63:
+        return 'Long'
+    if isinstance(value, (int, long, float)):
+        return 'Double'
+    if isinstance(value, basestring):
+        return 'String'
+
+    return 'Json'
+
+
+def _properties(properties, columns):
+    """Return properties encoded as FlatGeobuf property bytes."""
+    encoded = []
+
+    for number, (name, column_type) in enumerate(columns):
+        value = properties.get(name)
+        if value is None:
+            continue
+
+        encoded.append(struct.pack('<H', number))
+
+        if column_type == 'Bool':
+            encoded.append(struct.pack('<B', value))
+        elif column_type == 'Long':
+            encoded.append(struct.pack('<q', value))
+        elif column_type == 'Double':
+            encoded.append(struct.pack('<d', value))
+        else:
+            if column_type == 'Json':
+                value = json.dumps(value, sort_keys=True)
+            if isinstance(value, unicode):
+                value = value.encode('utf-8')
+
+            encoded.append(struct.pack('<I', len(value)))
+            encoded.append(value)
+
+    return ''.join(encoded)
+
+
+def hilbert(x, y):
+    """
+    Return the Hilbert curve distance of a point.
+
+    Parameters
+    ----------
+    x : int
+        X of the point, from 0 to 65535.
+    y : int
+        Y of the point, from 0 to 65535.
+
+    Returns
+    -------
+    int
+        Distance along the Hilbert curve.
+    """
+    a = x ^ y
+    b = 0xFFFF ^ a
+    c = 0xFFFF ^ (x | y)
+    d = x & (y ^ 0xFFFF)
+
+    A = a | (b >> 1)
+    B = (a >> 1) ^ a
+    C = ((c >> 1) ^ (b & (d >> 1))) ^ c
+    D = ((a & (c >> 1)) ^ (d >> 1)) ^ d
+
+    for shift in (2, 4):
+        a, b, c, d = A, B, C, D
+        A = (a & (a >> shift)) ^ (b & (b >> shift))
+        B = (a & (b >> shift)) ^ (b & ((a ^ b) >> shift))
+        C ^= (a & (c >> shift)) ^ (b & (d >> shift))
+        D ^= (b & (c >> shift)) ^ ((a ^ b) & (d >> shift))
+
+    a, b, c, d = A, B, C, D
+    C ^= (a & (c >> 8)) ^ (b & (d >> 8))
+    D ^= (b & (c >> 8)) ^ ((a ^ b) & (d >> 8))
+
+    a = C ^ (C >> 1)
+    b = D ^ (D >> 1)
+
+    i0 = x ^ y
+    i1 = b | (0xFFFF ^ (i0 | a))
+
+    for shift, mask in ((8, 0x00FF00FF), (4, 0x0F0F0F0F),
+                        (2, 0x33333333), (1, 0x55555555)):
+        i0 = (i0 | (i0 << shift)) & mask
+        i1 = (i1 | (i1 << shift)) & mask
+
+    return (i1 << 1) | i0
+
+
+def level_bounds(count, node_size):
+    """
+    Return bounds of levels of the packed Hilbert R-tree.
+
+    Parameters
+    ----------
+    count : int
+        Number of features.
+    node_size : int
+        Maximum number of children of a node.
+
+    Returns
+    -------
+    list
+        First and last (exclusive) node of each level, from leaves to the
+        root. Nodes are stored from the root to leaves.
+    """
+    sizes = [count]
+    nodes = count
+
+    while True:
+        count = int(math.ceil(float(count) / node_size))
+        nodes += count
+        sizes.append(count)
+
+        if count == 1:
+            break
+
+    bounds = []
+    for size in sizes:
+        nodes -= size
+        bounds.append((nodes, nodes + size))
+
+    return bounds
+
+
+def _index(bboxes, offsets, node_size):
+    """Return the packed Hilbert R-tree of sorted features, as bytes."""
+    bounds = level_bounds(len(bboxes), node_size)
+    nodes = [None] * bounds[0][1]
+
+    for number, (bbox, offset) in enumerate(zip(bboxes, offsets)):
+        nodes[bounds[0][0] + number] = tuple(bbox) + (offset,)
+
+    for level in range(len(bounds) - 1):
+        position, end = bounds[level]
+        parent = bounds[level + 1][0]
+
+        while position < end:
+            children = nodes[position:min(position + node_size, end)]
+            nodes[parent] = (
+                min(child[0] for child in children),
+                min(child[1] for child in children),
+                max(child[2] for child in children),
+                max(child[3] for child in children),
+                position
+            )
+            position += node_size
+            parent += 1
+
+    return ''.join(NODE.pack(*node) for node in nodes)
+
+
+def write_flatgeobuf(store, name=''):
+    """
+    Write features of a feature store in the FlatGeobuf format.
+
+    Features are encoded one by one to a temporary file, so that only their
+    bounding boxes and sizes are kept in memory. Features are then sorted
+    along the Hilbert curve and written after the header and the packed
+    Hilbert R-tree, which lets clients read features within a bounding box
+    with HTTP range requests. Features without geometry (or vertices) follow
+    all others, with empty bounding boxes in the index. Geometry collections
+    are written as parts, each with its type. Z coordinates are written when
+    the feature store has them (NaN for vertices without Z coordinate).
+    Types of properties are detected from their values, and feature IDs are
+    not written.
+
+    Parameters
+    ----------
+    store : geokey_webresources.helpers.feature_helpers.FeatureStore
+        Feature store.
+    name : str
+        Name of the dataset.
+
+    Returns
+    -------
+    generator
+        Chunks of FlatGeobuf data.
+    """
+    columns = {}
+    geometry_types = set(struct.unpack_from(
+        '<%sB' % len(store),
+        store.buffer,
+        store.offsets['types']
+    ))
+    geometry_type = geometry_types.pop() if len(geometry_types) == 1 else 0
+
+    for index in range(len(store)):
+        properties = json.loads(store.members(index)).get('properties') or {}
+
+        for key, value in properties.items():
+            if value is not None:
+                columns.setdefault(key, set()).add(_column_type(value))
+
+    for key, types in columns.items():
+        if len(types) == 1:
+            columns[key] = types.pop()
+        elif types <= set(['Long', 'Double']):
+            columns[key] = 'Double'
+        else:
+            columns[key] = 'Json'
+
+    columns = sorted(columns.items())
+    encoded = tempfile.TemporaryFile()
+    features = []
+
+    try:
+        offset = 0
+        for index in range(len(store)):
+            geometry = store.geometry(index)
+            properties = json.loads(
+                store.members(index)
+            ).get('properties') or {}
+            for key, column_type in columns:
+                if column_type == 'Double' and isinstance(
+                        properties.get(key), (int, long)):
+                    properties[key] = float(properties[key])
+
+            fields = [(1, None, _Vector(
+                'B',
+                bytearray(_properties(properties, columns))
+            ))]
+
+            bbox = store.bbox(index)
+            if geometry is not None:
+                fields.append((
+                    0,
+                    None,
+                    _geometry(geometry, not geometry_type, store.has_z)
+                ))
+
+            feature = _finish(_Table(fields))
+            encoded.write(feature)
+            features.append((bbox, offset, len(feature)))
+            offset += len(feature)
+
+        located = [bbox for bbox, _, _ in features if bbox[0] <= bbox[2]]
+        indexed = bool(located)
+        envelope = None
+        if indexed:
+            envelope = (
+                min(bbox[0] for bbox in located),
+                min(bbox[1] for bbox in located),
+                max(bbox[2] for bbox in located),
+                max(bbox[3] for bbox in located)
+            )
+            width = envelope[2] - envelope[0]
+            height = envelope[3] - envelope[1]
+
+            def distance(feature):
+                bbox = feature[0]
+                if bbox[0] > bbox[2]:
+                    # Features without vertices follow all others
+                    return 1 << 32
+
+                x = y = 0
+                if width:
+                    x = int(math.floor(HILBERT_MAX * (
+                        (bbox[0] + bbox[2]) / 2 - envelope[0]) / width))
+                if height:
+                    y = int(math.floor(HILBERT_MAX * (
+                        (bbox[1] + bbox[3]) / 2 - envelope[1]) / height))
+                return hilbert(x, y)
+
+            features.sort(key=distance)
+
+        header = [
+            (0, None, _String(name)),
+            (2, 'B', geometry_type),
+            (7, None, _Vector(None, [
+                _Table([
+                    (0, None, _String(key)),
+                    (1, 'B', COLUMN_TYPES[column_type])
+                ])
+                for key, column_type in columns
+            ])),
+            (8, 'Q', len(features)),
+            (9, 'H', FLATGEOBUF_NODE_SIZE if indexed else 0),
+            (10, None, _Table([(1, 'i', 4326)]))
+        ]
+        if envelope is not None:
+            header.append((1, None, _Vector('d', envelope)))
+        if store.has_z:
+            header.append((3, 'B', 1))
+
+        yield MAGIC
+        yield _finish(_Table(header))
+
+        if indexed:
+            offsets = []
+            offset = 0
+            for _, _, size in features:
+                offsets.append(offset)
+                offset += size
+
+            yield _index(
+                [bbox for bbox, _, _ in features],
+                offsets,
+                FLATGEOBUF_NODE_SIZE
+            )
+
+        for _, offset, size in features:
+            encoded.seek(offset)
+            yield encoded.read(size)
+    finally:
+        encoded.close()
+
+
+def _read_table(buffer, position):
+    """Return positions of fields of a table, by index."""
+    vtable = position - struct.unpack_from('<i', buffer, position)[0]
+    vtable_size = struct.unpack_from('<H', buffer, vtable)[0]
+    offsets = struct.unpack_from(
+        '<%sH' % ((vtable_size - 4) // 2),
+        buffer,
+        vtable + 4
+    )
+
+    return dict(
+        (index, position + offset)
+        for index, offset in enumerate(offsets) if offset
+    )
+
+
+def _reference(buffer, position):
+    """Return position of an object referenced from the position."""
+    return position + struct.unpack_from('<I', buffer, position)[0]
+
+
+def _read_vector(buffer, position, item_format):
+    """Return items of a vector referenced from the position."""
+    position = _reference(buffer, position)
+    length = struct.unpack_from('<I', buffer, position)[0]
+
+    if item_format is None:
+        return [
+            _reference(buffer, position + 4 + 4 * number)
+            for number in range(length)
+        ]
+
+    return struct.unpack_from(
+        '<%s%s' % (length, item_format),
+        buffer,
+        position + 4
+    )
+
+
+def _read_string(buffer, position):
+    """Return a string referenced from the position."""
+    position = _reference(buffer, position)
+    length = struct.unpack_from('<I', buffer, position)[0]
+
+    return buffer[position + 4:position + 4 + length].decode('utf-8')
+
+
+class FlatGeobufReader(object):
+    """
+    Reader of FlatGeobuf data written by `write_flatgeobuf`.
+
+    Parameters
+    ----------
+    buffer : str
+        FlatGeobuf data.
+
+    Raises
+    ------
+    ValueError
+        When data is not FlatGeobuf.
+    """
+
+    def __init__(self, buffer):
+        """Read the header."""
+        if buffer[:3] != MAGIC[:3]:
+            raise ValueError('Data is not FlatGeobuf.')
+
+        self.buffer = buffer
+        header_size = struct.unpack_from('<I', buffer, 8)[0]
+        header = _read_table(buffer, _reference(buffer, 12))
+
+        self.name = _read_string(buffer, header[0]) if 0 in header else ''
+        self.count = (
+            struct.unpack_from('<Q', buffer, header[8])[0]
+            if 8 in header else 0
+        )
+        self.node_size = (
+            struct.unpack_from('<H', buffer, header[9])[0]
+            if 9 in header else 16
+        )
+        self.geometry_type = (
+            struct.unpack_from('<B', buffer, header[2])[0]
+            if 2 in header else 0
+        )
+        self.has_z = (
+            bool(struct.unpack_from('<B', buffer, header[3])[0])
+            if 3 in header else False
+        )
+        self.envelope = (
+            _read_vector(buffer, header[1], 'd') if 1 in header else None
+        )
+        self.columns = []
+        for position in (
+                _read_vector(buffer, header[7], None) if 7 in header else []):
+            column = _read_table(buffer, position)
+            self.columns.append((
+                _read_string(buffer, column[0]),
+                struct.unpack_from('<B', buffer, column[1])[0]
+                if 1 in column else 0
+            ))
+
+        self.index = 12 + header_size
+        self.features = self.index
+        if self.node_size and self.count:
+            self.features += NODE.size * level_bounds(
+                self.count,
+                self.node_size
+            )[0][1]
+
+    def _geometry(self, position, type_code=None):
+        """Return a FlatGeobuf geometry table as GeoJSON geometry."""
+        buffer = self.buffer
+        geometry = _read_table(buffer, position)
+        if 6 in geometry:
+            type_code = struct.unpack_from('<B', buffer, geometry[6])[0]
+        geometry_type = GEOMETRY_TYPES[
+            self.geometry_type if type_code is None else type_code
+        ]
+
+        if geometry_type == 'GeometryCollection':
+            return {
+                'type': geometry_type,
+                'geometries': [
+                    self._geometry(part)
+                    for part in (
+                        _read_vector(buffer, geometry[7], None)
+                        if 7 in geometry else []
+                    )
+                ]
+            }
+
+        if geometry_type == 'MultiPolygon':
+            return {
+                'type': geometry_type,
+                'coordinates': [
+                    self._geometry(
+                        part,
+                        GEOMETRY_TYPES.index('Polygon')
+                    )['coordinates']
+                    for part in _read_vector(buffer, geometry[7], None)
+                ]
+            }
+
+        xy = _read_vector(buffer, geometry[1], 'd')
+        points = [
+            [xy[number], xy[number + 1]]
+            for number in range(0, len(xy), 2)
+        ]
+        if 2 in geometry:
+            for point, height in zip(
+                    points,
+                    _read_vector(buffer, geometry[2], 'd')):
+                # NaN marks a vertex without Z coordinate
+                if height == height:
+                    point.append(height)
+        ends = (
+            _read_vector(buffer, geometry[0], 'I') if 0 in geometry
+            else [len(points)]
+        )
+        lines = [
+            points[start:end]
+            for start, end in zip((0,) + tuple(ends[:-1]), ends)
+        ]
+
+        if geometry_type == 'Point':
+            coordinates = points[0]
+        elif geometry_type in ('LineString', 'MultiPoint'):
+            coordinates = points
+        else:
+            coordinates = lines
+
+        return {'type': geometry_type, 'coordinates': coordinates}
+
+    def _properties(self, position):
+        """Return FlatGeobuf property bytes as properties."""
+        data = str(bytearray(_read_vector(self.buffer, position, 'B')))
+        properties = {}
+        offset = 0
+
+        while offset < len(data):
+            number = struct.unpack_from('<H', data, offset)[0]
+            name, column_type = self.columns[number]
+            offset += 2
+
+            if column_type == COLUMN_TYPES['Bool']:
+                value = bool(struct.unpack_from('<B', data, offset)[0])
+                offset += 1
+            elif column_type == COLUMN_TYPES['Long']:
+                value = struct.unpack_from('<q', data, offset)[0]
+                offset += 8
+            elif column_type == COLUMN_TYPES['Double']:
+                value = struct.unpack_from('<d', data, offset)[0]
+                offset += 8
+            else:
+                length = struct.unpack_from('<I', data, offset)[0]
+                value = data[offset + 4:offset + 4 + length].decode('utf-8')
+                offset += 4 + length
+
+                if column_type == COLUMN_TYPES['Json']:
+                    value = json.loads(value)
+
+            properties[name] = value
+
+        return properties
+
+    def feature(self, offset):
+        """Return the feature at the offset, as GeoJSON feature."""
+        feature = _read_table(self.buffer, _reference(
+            self.buffer,
+            self.features + offset + 4
+        ))
+
+        return {
+            'type': 'Feature',
+            'geometry': (
+                self._geometry(_reference(self.buffer, feature[0]))
+                if 0 in feature else None
+            ),
+            'properties': (
+                self._properties(feature[1]) if 1 in feature else {}
+            )
+        }
+
+    def __iter__(self):
+        """Iterate over all features, as GeoJSON features."""
+        offset = 0
+
+        for number in range(self.count):
+            yield self.feature(offset)
+            offset += 4 + struct.unpack_from(
+                '<I',
+                self.buffer,
+                self.features + offset
+            )[0]
+
+    def search(self, bbox):
+        """
+        Find features intersecting a bounding box, with the index.
+
+        Parameters
+        ----------
+        bbox : tuple
+            West, south, east and north of the bounding box.
+
+        Returns
+        -------
+        list
+            Offsets of features.
+
+        Raises
+        ------
+        ValueError
+            When data has no index.
+        """
+        if not self.node_size or not self.count:
+            raise ValueError('Data has no index.')
+
+        west, south, east, north = bbox
+        bounds = level_bounds(self.count, self.node_size)
+        leaves = bounds[0][0]
+        queue = [(0, len(bounds) - 1)]
+        offsets = []
+
+        while queue:
+            first, level = queue.pop()
+
+            for position in range(
+                    first,
+                    min(first + self.node_size, bounds[level][1])):
+                min_x, min_y, max_x, max_y, offset = NODE.unpack_from(
+                    self.buffer,
+                    self.index + position * NODE.size
+                )
+
+                if (min_x > east or max_x < west or
+                        min_y > north or max_y < south):
+                    continue
+
+                if position >= leaves:
+                    offsets.append(offset)
+                else:
+                    queue.append((offset, level - 1))
+
+        return sorted(offsets)
+
+
+def get_flatgeobuf(cached, dataformat=FORMAT.GeoJSON):
+    """
+    Get cached content in the FlatGeobuf format.
+
+    Content is converted once (through its feature store) and stored next
+    to it, counting towards its stored size.
+
+    Parameters
+    ----------
+    cached : geokey_webresources.models.CachedContent
+        Cached content.
+    dataformat : str
+        Format of the content: GeoJSON or KML.
+
+    Returns
+    -------
+    str
+        Name of the FlatGeobuf file.
+
+    Raises
+    ------
+    ValueError
+        When content is not in the format.
+    """
+    def build():
+        converted = tempfile.TemporaryFile()
+
+        for chunk in write_flatgeobuf(get_features(cached, dataformat)):
+            converted.write(chunk)
+
+        converted.seek(0)
+        return File(converted)
+
+    return store_derived(
+        cached,
+        'flatgeobuf',
+        '%s/%s.%s.fgb' % (
+            CachedContent._meta.get_field('flatgeobuf').upload_to,
+            cached.checksum,
+            FLATGEOBUF_VERSION
+        ),
+        build
+    )
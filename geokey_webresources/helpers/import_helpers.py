@@ -0,0 +1,161 @@
+"""All helpers for the import."""
+
+import csv
+import json
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from ..base import ACTION, ORDER_GAP
+from ..exceptions import URLError
+from ..forms import WebResourceForm
+from ..models import WebResource
+from ..signals import send_bulk_change
+from .url_helpers import check_urls
+
+
+MANIFEST_FORMATS = ('json', 'ndjson', 'csv')
+
+
+def read_manifest(manifest, manifest_format):
+    """
+    Read rows of web resources from the manifest.
+
+    Parameters
+    ----------
+    manifest : file
+        Manifest file with web resources.
+    manifest_format : str
+        Format of the manifest: `json`, `ndjson` or `csv`.
+
+    Returns
+    -------
+    list
+        Rows of web resources.
+
+    Raises
+    ------
+    ValueError
+        When manifest cannot be read.
+    """
+    if manifest_format == 'json':
+        rows = json.load(manifest)
+    elif manifest_format == 'ndjson':
+        rows = [json.loads(line) for line in manifest if line.strip()]
+    elif manifest_format == 'csv':
+        rows = list(csv.DictReader(manifest))
+    else:
+        raise ValueError('Manifest format must be JSON, NDJSON or CSV.')
+
+    if not isinstance(rows, list):
+        raise ValueError('Manifest must contain a list of web resources.')
+
+    return rows
+
+
+def import_webresources(project, creator, rows, batch_size=100, workers=8):
+    """
+    Import web resources to the project.
+
+    Rows are validated first, then URLs of valid rows are checked
+    concurrently. Web resources are created with `bulk_create`, each batch
+    in its own transaction.
+
+    Parameters
+    ----------
+    project : geokey.projects.models.Project
+        Project to import web resources to.
+    creator : geokey.users.models.User
+        User importing web resources.
+    rows : list
+        Rows of web resources: name, description, url, colour and order.
+    batch_size : int
+        Number of web resources created in one transaction.
+    workers : int
+        Maximum number of URLs checked at the same time.
+
+    Returns
+    -------
+    list
+        Report of each row: its number, name, ID of created web resource and
+        errors, if any.
+    """
+    report = []
+    webresources = []
+
+    last_order = project.webresources.aggregate(last=Max('order'))['last']
+    order = last_order if last_order is not None else -ORDER_GAP
+
+    for number, row in enumerate(rows, start=1):
+        result = {'row': number, 'name': None, 'id': None, 'errors': []}
+        report.append(result)
+
+        if not isinstance(row, dict):
+            result['errors'].append('Row must contain a web resource.')
+            continue
+
+        result['name'] = row.get('name')
+        data = dict(
+            (field, row.get(field))
+            for field in ('name', 'description', 'url', 'colour')
+        )
+        if not data['colour']:
+            data['colour'] = WebResource._meta.get_field('colour').default
+
+        form = WebResourceForm(data=data)
+        if not form.is_valid():
+            for field, errors in form.errors.items():
+                result['errors'].extend(
+                    '%s: %s' % (field, error) for error in errors
+                )
+            continue
+
+        webresource = form.save(commit=False)
+        webresource.project = project
+        webresource.creator = creator
+
+        try:
+            if row.get('order') in (None, ''):
+                order += ORDER_GAP
+                webresource.order = order
+            else:
+                webresource.order = int(row.get('order'))
+        except (TypeError, ValueError):
+            result['errors'].append('order: Enter a whole number.')
+            continue
+
+        webresources.append((result, webresource))
+
+    dataformats = check_urls(
+        [webresource.url for _, webresource in webresources],
+        workers=workers
+    )
+
+    valid = []
+    for (result, webresource), dataformat in zip(webresources, dataformats):
+        if isinstance(dataformat, URLError):
+            result['errors'].append(dataformat.message)
+            result['errors'].extend(dataformat.errors)
+        else:
+            webresource.dataformat = dataformat
+            webresource.url_checked = timezone.now()
+            valid.append((result, webresource))
+
+    for start in range(0, len(valid), batch_size):
+        batch = valid[start:start + batch_size]
+
+        with transaction.atomic():
+            created = WebResource.objects.bulk_create(
+                [webresource for _, webresource in batch]
+            )
+            send_bulk_change(
+                WebResource,
+                [(webresource.id, project.id) for webresource in created],
+                ACTION.created
+            )
+
+        for (result, _), webresource in zip(batch, created):
+            result['id'] = webresource.id
+
+    return report
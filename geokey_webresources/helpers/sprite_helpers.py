@@ -0,0 +1,358 @@
+"""All helpers for sprites of symbols."""
+
+import json
+import math
+import hashlib
+
+from io import BytesIO
+
+from PIL import Image
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+
+from ..base import STATUS
+from ..models import SymbolVariant, SymbolSprite
+from .storage_helpers import save_file
+
+
+def pack_rectangles(sizes):
+    """
+    Pack rectangles into a single area.
+
+    Rectangles are packed with the skyline bottom-left algorithm: the tallest
+    rectangles are placed first, each at the lowest (then leftmost) position
+    on top of already placed rectangles. Width of the area is the side of a
+    square with the total area of all rectangles, but never narrower than
+    the widest rectangle.
+
+    Parameters
+    ----------
+    sizes : list
+        Widths and heights of rectangles.
+
+    Returns
+    -------
+    tuple
+        Positions (x and y) of rectangles in the same order as sizes, width
+        and height of the area.
+    """
+    if not sizes:
+        return [], 0, 0
+
+    width = max(
+        max(size[0] for size in sizes),
+        int(math.ceil(math.sqrt(sum(w * h for w, h in sizes))))
+    )
+    skyline = [(0, 0, width)]
+    positions = [None] * len(sizes)
+    height = 0
+
+    for number in sorted(
+            range(len(sizes)),
+            key=lambda number: (-sizes[number][1], -sizes[number][0])):
+        w, h = sizes[number]
+        best = None
+
+        for start in range(len(skyline)):
+            x = skyline[start][0]
+            if x + w > width:
+                break
+
+            y = 0
+            end = start
+            while skyline[end][0] < x + w:
+                y = max(y, skyline[end][1])
+                end += 1
+
+                if end == len(skyline):
+                    break
+
+            if best is None or (y, x) < best:
+                best = (y, x)
+
+        y, x = best
+        positions[number] = (x, y)
+        height = max(height, y + h)
+
+        updated = []
+        for segment_x, segment_y, segment_width in skyline:
+            segment_end = segment_x + segment_width
+
+            if segment_end <= x or segment_x >= x + w:
+                updated.append((segment_x, segment_y, segment_width))
+                continue
+
+            if segment_x < x:
+                updated.append((segment_x, segment_y, x - segment_x))
+            if segment_end > x + w:
+                updated.append((x + w, segment_y, segment_end - x - w))
+
+        updated.append((x, y + h, w))
+        updated.sort()
+
+        skyline = []
+        for segment in updated:
+            if skyline and skyline[-1][1] == segment[1]:
+                skyline[-1] = (
+                    skyline[-1][0],
+                    segment[1],
+                    skyline[-1][2] + segment[2]
+                )
+            else:
+                skyline.append(segment)
+
+    return positions, width, height
+
+
+def _open_image(storage, name):
+    """Open and load an image from the storage."""
+    image_file = storage.open(name, 'rb')
+
+    try:
+        image = Image.open(image_file)
+        image.load()
+    finally:
+        image_file.close()
+
+    return image.convert('RGBA')
+
+
+def _entry(x, y, width, height, scale):
+    """Return a single entry of the index of a sprite."""
+    return {
+        'x': x,
+        'y': y,
+        'width': width,
+        'height': height,
+        'pixelRatio': scale
+    }
+
+
+def _build_sprite(symbols, scale):
+    """
+    Build a new sprite of symbols.
+
+    Parameters
+    ----------
+    symbols : dict
+        Names, widths and heights of symbol variants by web resource ID.
+    scale : int
+        Scale of symbol variants.
+
+    Returns
+    -------
+    tuple
+        Image and index of the sprite.
+    """
+    storage = SymbolVariant._meta.get_field('image').storage
+    keys = sorted(symbols, key=int)
+    positions, width, height = pack_rectangles(
+        [symbols[key][1:] for key in keys]
+    )
+
+    image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    index = {}
+
+    for key, (x, y) in zip(keys, positions):
+        name, symbol_width, symbol_height = symbols[key]
+
+        try:
+            image.paste(_open_image(storage, name), (x, y))
+        except IOError:
+            continue
+
+        index[key] = _entry(x, y, symbol_width, symbol_height, scale)
+
+    return image, index
+
+
+def _update_sprite(sprite, symbols):
+    """
+    Update an existing sprite of symbols.
+
+    Symbols that have not changed stay where they are. Changed and new
+    symbols are placed into slots left by changed and removed symbols,
+    the smallest slot that fits first.
+
+    Parameters
+    ----------
+    sprite : geokey_webresources.models.SymbolSprite
+        Existing sprite.
+    symbols : dict
+        Names, widths and heights of symbol variants by web resource ID.
+
+    Returns
+    -------
+    tuple
+        Image and index of the sprite, `None` if symbols do not fit into
+        free slots and the sprite must be built again.
+    """
+    storage = SymbolVariant._meta.get_field('image').storage
+    index = json.loads(sprite.index)
+    sources = json.loads(sprite.sources)
+
+    freed = []
+    for key, entry in list(index.items()):
+        if key not in symbols or symbols[key][0] != sources.get(key):
+            freed.append((
+                entry['x'],
+                entry['y'],
+                entry['width'],
+                entry['height']
+            ))
+            del index[key]
+
+    free = list(freed)
+    positions = {}
+
+    for key in sorted(
+            [key for key in symbols if key not in index],
+            key=lambda key: -symbols[key][1] * symbols[key][2]):
+        _, width, height = symbols[key]
+        fitting = [
+            slot for slot in free
+            if slot[2] >= width and slot[3] >= height
+        ]
+
+        if not fitting:
+            return None
+
+        slot = min(fitting, key=lambda slot: slot[2] * slot[3])
+        free.remove(slot)
+        positions[key] = slot
+
+    try:
+        image = _open_image(storage, sprite.image.name)
+    except IOError:
+        return None
+
+    for x, y, width, height in freed:
+        image.paste((0, 0, 0, 0), (x, y, x + width, y + height))
+
+    for key, (x, y, _, _) in positions.items():
+        name, width, height = symbols[key]
+
+        try:
+            image.paste(_open_image(storage, name), (x, y))
+        except IOError:
+            continue
+
+        index[key] = _entry(x, y, width, height, sprite.scale)
+
+    return image, index
+
+
+def delete_unused_sprites(names):
+    """
+    Delete files of sprites, which are not used anymore.
+
+    Parameters
+    ----------
+    names : iterable
+        Names of sprite files.
+    """
+    storage = SymbolSprite._meta.get_field('image').storage
+
+    for name in set(names):
+        if not SymbolSprite.objects.filter(image=name).exists():
+            storage.delete(name)
+
+
+def refresh_symbol_sprites(project_id):
+    """
+    Refresh sprites of symbols of all active web resources of a project.
+
+    A sprite is built for each scale of symbol variants, from their PNG
+    format. Sprites are stored with content-hashed names, together with an
+    index of positions of symbols by web resource ID. Nothing is done when
+    symbols have not changed; otherwise the existing sprite is updated in
+    place when possible, and built again when not.
+
+    Parameters
+    ----------
+    project_id : int
+        Identifies the project in the database.
+    """
+    symbols = {}
+    for webresource_id, scale, name, width, height in (
+            SymbolVariant.objects.filter(
+                webresource__project=project_id,
+                webresource__status=STATUS.active,
+                imageformat='png'
+            ).values_list('webresource', 'scale', 'image', 'width', 'height')):
+        symbols.setdefault(scale, {})[str(webresource_id)] = (
+            name,
+            width,
+            height
+        )
+
+    sprites = dict(
+        (sprite.scale, sprite)
+        for sprite in SymbolSprite.objects.filter(project=project_id)
+    )
+    storage = SymbolSprite._meta.get_field('image').storage
+    upload_to = SymbolSprite._meta.get_field('image').upload_to
+    unused = []
+
+    for scale in set(symbols) | set(sprites):
+        current = symbols.get(scale, {})
+        sources = dict((key, value[0]) for key, value in current.items())
+        sprite = sprites.get(scale)
+
+        if sprite is not None:
+            if json.loads(sprite.sources) == sources:
+                continue
+
+            unused.append(sprite.image.name)
+
+            if not current:
+                sprite.delete()
+                continue
+
+        built = None
+        if sprite is not None:
+            built = _update_sprite(sprite, current)
+        if built is None:
+            built = _build_sprite(current, scale)
+
+        image, index = built
+        content = BytesIO()
+        image.save(content, 'PNG', optimize=True)
+        content = content.getvalue()
+
+        checksum = hashlib.sha1(content).hexdigest()
+        name = '%s/%s.png' % (upload_to, checksum)
+        if not storage.exists(name):
+            name = save_file(storage, name, ContentFile(content))
+
+        if sprite is None:
+            sprite = SymbolSprite(project_id=project_id, scale=scale)
+
+        sprite.checksum = checksum
+        sprite.image = name
+        sprite.index = json.dumps(index, sort_keys=True)
+        sprite.sources = json.dumps(sources, sort_keys=True)
+        sprite.width, sprite.height = image.size
+        sprite.changed = timezone.now()
+        sprite.save()
+
+    delete_unused_sprites(unused)
+
+
+def schedule_symbol_sprites(project_id):
+    """
+    Refresh sprites of symbols of a project, once the transaction commits.
+
+    Sprites are not packed while rows changed by the transaction are locked,
+    nor when the transaction is rolled back. Refreshing sprites that have
+    not changed is cheap, so sprites changed many times in one transaction
+    are packed once.
+
+    Parameters
+    ----------
+    project_id : int
+        Identifies the project in the database.
+    """
+    transaction.on_commit(lambda: refresh_symbol_sprites(project_id))
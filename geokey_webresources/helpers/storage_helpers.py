@@ -0,0 +1,31 @@
+"""All helpers for stored files."""
+
+
+def save_file(storage, name, content):
+    """
+    Save a file under a content-addressed name.
+
+    When the same content is saved at the same time by another process,
+    the storage saves this file under another (suffixed) name. The copy is
+    deleted, so the content-addressed name is used and counted by all.
+
+    Parameters
+    ----------
+    storage : django.core.files.storage.Storage
+        Storage of the file.
+    name : str
+        Content-addressed name of the file.
+    content : django.core.files.File
+        Content of the file.
+
+    Returns
+    -------
+    str
+        Name of the stored file.
+    """
+    saved = storage.save(name, content)
+
+    if saved != name:
+        storage.delete(saved)
+
+    return name
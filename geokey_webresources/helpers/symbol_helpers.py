@@ -0,0 +1,352 @@
+"""All helpers for symbols."""
+
+import os
+import re
+import hashlib
+
+from io import BytesIO
+
+from PIL import Image
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+
+from ..base import ACTION, SYMBOL_SIZE, SYMBOL_SCALES, SYMBOL_FORMATS
+from ..models import WebResource, SymbolVariant
+from ..signals import send_bulk_change
+from .storage_helpers import save_file
+
+
+def _symbol_name(checksum, name):
+    """Return content-addressed name of a symbol file."""
+    return '%s/%s%s' % (
+        WebResource._meta.get_field('symbol').upload_to,
+        checksum,
+        os.path.splitext(name)[1].lower()
+    )
+
+
+def symbol_checksum(name):
+    """
+    Return the checksum of a symbol file from its name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the symbol file.
+
+    Returns
+    -------
+    str
+        Checksum of the symbol content, `None` if the file is not stored
+        under a content-addressed name.
+    """
+    match = re.match(
+        r'^%s/([0-9a-f]{40})(\.\w+)?$' % re.escape(
+            WebResource._meta.get_field('symbol').upload_to
+        ),
+        name or ''
+    )
+
+    return match.group(1) if match else None
+
+
+def store_symbol(content, name):
+    """
+    Store a symbol file under the hash of its content.
+
+    Identical symbols are written once, no matter how many times they are
+    uploaded.
+
+    Parameters
+    ----------
+    content : django.core.files.File
+        Content of the symbol.
+    name : str
+        Original name of the symbol, used for its extension.
+
+    Returns
+    -------
+    str
+        Name of the stored symbol file.
+    """
+    storage = WebResource._meta.get_field('symbol').storage
+    checksum = hashlib.sha1()
+
+    for chunk in content.chunks():
+        checksum.update(chunk)
+
+    name = _symbol_name(checksum.hexdigest(), name)
+
+    if not storage.exists(name):
+        content.seek(0)
+        name = save_file(storage, name, content)
+
+    return name
+
+
+def delete_unused_symbols(names):
+    """
+    Delete symbol files, which are not used anymore.
+
+    References to each file are counted among all web resources (including
+    deleted, but not yet archived), so shared files are kept as long as any
+    web resource uses them.
+
+    Parameters
+    ----------
+    names : iterable
+        Names of symbol files.
+    """
+    storage = WebResource._meta.get_field('symbol').storage
+
+    for name in set(names):
+        if name and not WebResource._base_manager.filter(
+                symbol=name).exists():
+            storage.delete(name)
+
+
+def deduplicate_symbols(batch_size=100):
+    """
+    Move existing symbol files to content-addressed names.
+
+    Files are processed in batches. All web resources (and variants) of
+    each batch are pointed to the new names in one transaction, then files
+    that are not used anymore are deleted. Files that cannot be read are
+    left as they are.
+
+    Parameters
+    ----------
+    batch_size : int
+        Number of symbol files processed in one transaction.
+
+    Returns
+    -------
+    tuple
+        Number of processed and deleted symbol files.
+    """
+    storage = WebResource._meta.get_field('symbol').storage
+    processed = 0
+    deleted = 0
+    last = ''
+
+    while True:
+        names = list(WebResource._base_manager.filter(
+            symbol__gt=last
+        ).values_list('symbol', flat=True).order_by(
+            'symbol'
+        ).distinct()[:batch_size])
+
+        if not names:
+            break
+
+        last = names[-1]
+        moved = {}
+
+        for name in names:
+            if symbol_checksum(name) is not None:
+                continue
+
+            try:
+                content = storage.open(name, 'rb')
+                try:
+                    moved[name] = store_symbol(content, name)
+                finally:
+                    content.close()
+            except (IOError, OSError):
+                continue
+
+        with transaction.atomic():
+            webresources = []
+            for name, target in moved.items():
+                webresources.extend(WebResource._base_manager.filter(
+                    symbol=name
+                ).values_list('pk', 'project'))
+                WebResource._base_manager.filter(symbol=name).update(
+                    symbol=target
+                )
+                SymbolVariant.objects.filter(source=name).update(
+                    source=target
+                )
+
+            send_bulk_change(WebResource, webresources, ACTION.updated)
+
+        for name in moved:
+            if not WebResource._base_manager.filter(symbol=name).exists():
+                storage.delete(name)
+                deleted += 1
+
+        processed += len(names)
+
+    return processed, deleted
+
+
+def render_variant(image, scale, imageformat):
+    """
+    Render a single resized variant of a symbol.
+
+    Symbol is scaled down (never up) to fit `SYMBOL_SIZE` at the given scale
+    and compressed losslessly.
+
+    Parameters
+    ----------
+    image : PIL.Image.Image
+        Original symbol.
+    scale : int
+        Scale of the variant.
+    imageformat : str
+        Format of the variant: `png` or `webp`.
+
+    Returns
+    -------
+    tuple
+        Content, width and height of the variant, or `None` if the format is
+        not supported by the installed Pillow.
+    """
+    size = SYMBOL_SIZE * scale
+
+    variant = image.copy()
+    variant.thumbnail((size, size), Image.LANCZOS)
+
+    content = BytesIO()
+
+    try:
+        if imageformat == 'webp':
+            variant.save(content, 'WEBP', lossless=True, method=6)
+        else:
+            variant.save(content, 'PNG', optimize=True)
+    except (IOError, KeyError):
+        return None
+
+    return content.getvalue(), variant.width, variant.height
+
+
+def delete_unused_variants(names):
+    """
+    Delete files of symbol variants, which are not used anymore.
+
+    Parameters
+    ----------
+    names : iterable
+        Names of variant files.
+    """
+    storage = SymbolVariant._meta.get_field('image').storage
+
+    for name in set(names):
+        if not SymbolVariant.objects.filter(image=name).exists():
+            storage.delete(name)
+
+
+def refresh_symbol_variants(webresource):
+    """
+    Create resized variants of the symbol of a web resource.
+
+    Variants are stored with content-hashed names, so identical variants are
+    stored once and can be cached forever. Nothing is done, when variants of
+    the current symbol already exist.
+
+    Parameters
+    ----------
+    webresource : geokey_webresources.models.WebResource
+        Web resource with the symbol.
+    """
+    symbol = webresource.symbol
+    source = symbol.name if symbol else ''
+    existing = list(webresource.symbol_variants.all())
+
+    if existing and all(variant.source == source for variant in existing):
+        return
+
+    if not existing and not source:
+        return
+
+    storage = SymbolVariant._meta.get_field('image').storage
+    upload_to = SymbolVariant._meta.get_field('image').upload_to
+    variants = []
+
+    if source:
+        symbol.open('rb')
+        try:
+            image = Image.open(symbol)
+            image.load()
+        finally:
+            symbol.close()
+
+        image = image.convert('RGBA')
+
+        for scale in SYMBOL_SCALES:
+            for imageformat in SYMBOL_FORMATS:
+                rendered = render_variant(image, scale, imageformat)
+                if rendered is None:
+                    continue
+
+                content, width, height = rendered
+                name = '%s/%s.%s' % (
+                    upload_to,
+                    hashlib.sha1(content).hexdigest(),
+                    imageformat
+                )
+                if not storage.exists(name):
+                    name = save_file(
+                        storage,
+                        name,
+                        ContentFile(content)
+                    )
+
+                variants.append(SymbolVariant(
+                    webresource=webresource,
+                    source=source,
+                    scale=scale,
+                    imageformat=imageformat,
+                    image=name,
+                    width=width,
+                    height=height
+                ))
+
+    _replace_variants(webresource, existing, variants)
+
+
+def _replace_variants(webresource, existing, variants):
+    """Replace existing variants of a symbol and delete unused files."""
+    with transaction.atomic():
+        webresource.symbol_variants.all().delete()
+        SymbolVariant.objects.bulk_create(variants)
+        send_bulk_change(
+            WebResource,
+            [(webresource.id, webresource.project_id)],
+            ACTION.updated
+        )
+
+    delete_unused_variants(variant.image.name for variant in existing)
+
+
+def schedule_symbol_variants(webresource_id):
+    """
+    Create resized variants of the symbol of a web resource, once the
+    transaction commits.
+
+    Variants are not rendered while rows changed by the transaction are
+    locked, nor when the transaction is rolled back. A symbol that cannot be
+    read as an image is kept, but variants of the previous symbol are
+    removed, so that clients use the symbol itself.
+
+    Parameters
+    ----------
+    webresource_id : int
+        Identifies the web resource in the database.
+    """
+    def refresh():
+        webresource = WebResource.objects.filter(pk=webresource_id).first()
+        if webresource is None:
+            return
+
+        try:
+            refresh_symbol_variants(webresource)
+        except (IOError, ValueError):
+            _replace_variants(
+                webresource,
+                list(webresource.symbol_variants.all()),
+                []
+            )
+
+    transaction.on_commit(refresh)
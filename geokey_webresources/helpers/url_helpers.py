@@ -1,17 +1,248 @@
 """All helpers for the URL."""
 
+import socket
+import httplib
 import urllib2
 
+from binascii import hexlify
 from mimetypes import MimeTypes
+from multiprocessing.pool import ThreadPool
 
 from ..base import FORMAT
 from ..exceptions import URLError
 
 
+# Networks of addresses, which are not public: this network, private,
+# shared, loopback, link-local (with cloud metadata), protocol assignments,
+# benchmarking, multicast and reserved ones, and their IPv6 counterparts
+BLOCKED_NETWORKS = (
+    '0.0.0.0/8',
+    '10.0.0.0/8',
+    '100.64.0.0/10',
+    '127.0.0.0/8',
+    '169.254.0.0/16',
+    '172.16.0.0/12',
+    '192.0.0.0/24',
+    '192.168.0.0/16',
+    '198.18.0.0/15',
+    '224.0.0.0/4',
+    '240.0.0.0/4',
+    '::/127',
+    'fc00::/7',
+    'fe80::/10',
+    'ff00::/8'
+)
+
+
+def _address_number(address):
+    """Return family, number and number of bits of an IP address."""
+    family = socket.AF_INET6 if ':' in address else socket.AF_INET
+    number = int(hexlify(socket.inet_pton(family, address.split('%')[0])), 16)
+
+    if family == socket.AF_INET6 and number >> 32 == 0xFFFF:
+        return socket.AF_INET, number & 0xFFFFFFFF, 32
+
+    return family, number, 32 if family == socket.AF_INET else 128
+
+
+def _network(network):
+    """Return family, number and prefix length of a network."""
+    address, _, prefix = network.partition('/')
+    family, number, _ = _address_number(address)
+
+    return family, number, int(prefix)
+
+
+_blocked = [_network(network) for network in BLOCKED_NETWORKS]
+
+
+def is_public_address(address):
+    """
+    Check if IP address is public.
+
+    IPv4 addresses mapped to IPv6 are checked as IPv4 addresses.
+
+    Parameters
+    ----------
+    address : str
+        IPv4 or IPv6 address.
+
+    Returns
+    -------
+    bool
+        Whether the address is public.
+    """
+    family, number, bits = _address_number(address)
+
+    for network_family, network, prefix in _blocked:
+        if (network_family == family and
+                number >> (bits - prefix) == network >> (bits - prefix)):
+            return False
+
+    return True
+
+
+def create_public_connection(address, timeout=None, source_address=None):
+    """
+    Connect to a host, only when all its addresses are public.
+
+    The host is resolved once and the connection is made to the resolved
+    address, so that it cannot resolve to another address in between.
+
+    Parameters
+    ----------
+    address : tuple
+        Host and port.
+    timeout : float
+        Number of seconds to wait for the connection.
+    source_address : tuple
+        Host and port to connect from.
+
+    Returns
+    -------
+    socket.socket
+        Connected socket.
+
+    Raises
+    ------
+    socket.error
+        When the host is not public, or cannot be connected to.
+    """
+    host, port = address
+    resolved = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
+    for _, _, _, _, sockaddr in resolved:
+        if not is_public_address(sockaddr[0]):
+            raise socket.error('%s is not a public address' % host)
+
+    error = socket.error('%s cannot be resolved' % host)
+    for family, socktype, proto, _, sockaddr in resolved:
+        sock = socket.socket(family, socktype, proto)
+
+        try:
+            if timeout is not None:
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+
+            sock.connect(sockaddr)
+            return sock
+        except socket.error, error:
+            sock.close()
+
+    raise error
+
+
+class PublicHTTPConnection(httplib.HTTPConnection):
+    """HTTP connection to public addresses only."""
+
+    def __init__(self, *args, **kwargs):
+        """Initiate connection."""
+        httplib.HTTPConnection.__init__(self, *args, **kwargs)
+        self._create_connection = create_public_connection
+
+
+class PublicHTTPSConnection(httplib.HTTPSConnection):
+    """HTTPS connection to public addresses only."""
+
+    def __init__(self, *args, **kwargs):
+        """Initiate connection."""
+        httplib.HTTPSConnection.__init__(self, *args, **kwargs)
+        self._create_connection = create_public_connection
+
+
+class PublicHTTPHandler(urllib2.HTTPHandler):
+    """Handler of HTTP URLs of public addresses only."""
+
+    def http_open(self, request):
+        """Open URL."""
+        return self.do_open(PublicHTTPConnection, request)
+
+
+class PublicHTTPSHandler(urllib2.HTTPSHandler):
+    """Handler of HTTPS URLs of public addresses only."""
+
+    def https_open(self, request):
+        """Open URL."""
+        return self.do_open(PublicHTTPSConnection, request)
+
+
+def build_public_opener():
+    """
+    Build opener of HTTP and HTTPS URLs of public addresses only.
+
+    Every connection (also after a redirect) is checked, other schemes
+    (e.g. `file`) are not supported and proxies are not used, as they would
+    connect to any address.
+
+    Returns
+    -------
+    urllib2.OpenerDirector
+        URL opener.
+    """
+    opener = urllib2.OpenerDirector()
+
+    for handler in (
+            PublicHTTPHandler,
+            PublicHTTPSHandler,
+            urllib2.HTTPRedirectHandler,
+            urllib2.HTTPDefaultErrorHandler,
+            urllib2.HTTPErrorProcessor,
+            urllib2.UnknownHandler):
+        opener.add_handler(handler())
+
+    return opener
+
+
+_opener = build_public_opener()
+
+
+def install_opener(opener=None):
+    """
+    Install opener of remote URLs (e.g. a mock in tests).
+
+    Parameters
+    ----------
+    opener : urllib2.OpenerDirector
+        URL opener, the opener of public addresses when not set.
+    """
+    global _opener
+    _opener = opener or build_public_opener()
+
+
+def open_url(url, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """
+    Open a remote URL, only when it is on a public address.
+
+    Parameters
+    ----------
+    url : str or urllib2.Request
+        URL to open.
+    timeout : float
+        Number of seconds to wait for the remote server.
+
+    Returns
+    -------
+    file
+        Response.
+
+    Raises
+    ------
+    urllib2.URLError
+        When URL cannot be opened.
+    """
+    return _opener.open(url, timeout=timeout)
+
+
 def check_url(url):
     """
     Check if URL is accessible and what data format it is.
 
+    URL is opened with the default opener of urllib2, so that proxies are
+    used and URLs on internal hosts can be added by administrators. Only
+    data fetched by the server (`cache_helpers.download`) is limited to
+    public addresses.
+
     Parameters
     ----------
     url : str
@@ -58,3 +289,37 @@ def check_url(url):
         raise URLError('The URL cannot be used due to:', errors)
 
     return dataformat
+
+
+def check_urls(urls, workers=8):
+    """
+    Check multiple URLs concurrently.
+
+    Parameters
+    ----------
+    urls : list
+        URLs to check.
+    workers : int
+        Maximum number of URLs checked at the same time.
+
+    Returns
+    -------
+    list
+        Data format of each URL, or `URLError` when the URL cannot be used.
+    """
+    def check(url):
+        try:
+            return check_url(url)
+        except URLError, error:
+            return error
+
+    if not urls:
+        return []
+
+    pool = ThreadPool(min(workers, len(urls)))
+
+    try:
+        return pool.map(check, urls)
+    finally:
+        pool.close()
+        pool.join()
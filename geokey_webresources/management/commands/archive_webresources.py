@@ -0,0 +1,62 @@
+"""Command `archive_webresources`."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import ArchivedWebResource
+from ...helpers.archive_helpers import (
+    archive_webresources,
+    restore_webresource
+)
+
+
+class Command(BaseCommand):
+    """A command to archive deleted web resources, or restore them."""
+
+    help = 'Archive web resources deleted before the retention window.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=30,
+            help='Number of days, for which deleted web resources are kept.'
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0,
+            help='Seconds to wait between batches.'
+        )
+        parser.add_argument(
+            '--restore',
+            nargs='+',
+            type=int,
+            help='IDs of archived web resources to restore.'
+        )
+
+    def handle(self, *args, **options):
+        """Archive or restore web resources."""
+        if options['restore']:
+            for webresource_id in options['restore']:
+                try:
+                    restore_webresource(webresource_id)
+                except ArchivedWebResource.DoesNotExist:
+                    raise CommandError(
+                        'Archived web resource %s does not exist.' %
+                        webresource_id
+                    )
+
+            self.stdout.write('%s web resources restored.' % len(
+                options['restore']
+            ))
+            return
+
+        archived = archive_webresources(
+            options['days'],
+            batch_size=options['batch_size'],
+            pause=options['sleep']
+        )
+
+        self.stdout.write('%s web resources archived.' % archived)
@@ -0,0 +1,67 @@
+"""Command `check_webresource_snapshots`."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...base import STATUS
+from ...models import WebResource, ProjectSummary
+from ...serializers import render_snapshot
+
+
+class Command(BaseCommand):
+    """A command to check that snapshots match `WebResourceSerializer`."""
+
+    help = 'Check that stored snapshots of web resources are up to date.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Refresh snapshots that are out of date.'
+        )
+
+    def handle(self, *args, **options):
+        """Check snapshots."""
+        webresource_ids = [
+            webresource.id
+            for webresource in WebResource.objects.iterator()
+            if webresource.snapshot != render_snapshot(webresource)
+        ]
+
+        project_ids = []
+        for summary in ProjectSummary.objects.iterator():
+            expected = '[%s]' % ','.join(
+                render_snapshot(webresource)
+                for webresource in WebResource.objects.filter(
+                    project=summary.project_id,
+                    status=STATUS.active
+                ).order_by('order', 'pk').iterator()
+            )
+
+            if summary.snapshot != expected:
+                project_ids.append(summary.project_id)
+
+        message = (
+            '%s web resource snapshots and %s project snapshots are out '
+            'of date.' % (len(webresource_ids), len(project_ids))
+        )
+
+        if not options['fix']:
+            if webresource_ids or project_ids:
+                raise CommandError(message)
+
+            self.stdout.write('All snapshots are up to date.')
+            return
+
+        for start in range(0, len(webresource_ids), 500):
+            WebResource.objects.refresh_snapshots(
+                webresource_ids[start:start + 500]
+            )
+
+        ProjectSummary.objects.refresh(project_ids + list(
+            WebResource.objects.filter(
+                pk__in=webresource_ids
+            ).values_list('project', flat=True).order_by().distinct()
+        ))
+
+        self.stdout.write(message + ' All of them were refreshed.')
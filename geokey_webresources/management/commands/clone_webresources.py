@@ -0,0 +1,76 @@
+"""Command `clone_webresources`."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from geokey.projects.models import Project
+from geokey.users.models import User
+
+from ...models import WebResource
+from ...helpers.clone_helpers import clone_webresources
+
+
+class Command(BaseCommand):
+    """A command to clone web resources from one project to another."""
+
+    help = 'Clone web resources from one project to another.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument('source_id', type=int)
+        parser.add_argument('target_id', type=int)
+        parser.add_argument(
+            '--ids',
+            nargs='+',
+            type=int,
+            help='IDs of web resources to clone, all if not set.'
+        )
+        parser.add_argument(
+            '--checked-within',
+            type=int,
+            help='Seconds within which URLs are not checked again.'
+        )
+        parser.add_argument(
+            '--creator',
+            type=int,
+            help='ID of the user set as creator, target creator if not set.'
+        )
+        parser.add_argument('--workers', type=int, default=8)
+
+    def handle(self, *args, **options):
+        """Clone web resources."""
+        try:
+            source = Project.objects.get(pk=options['source_id'])
+            target = Project.objects.get(pk=options['target_id'])
+            creator = target.creator
+            if options['creator'] is not None:
+                creator = User.objects.get(pk=options['creator'])
+        except (Project.DoesNotExist, User.DoesNotExist), error:
+            raise CommandError(str(error))
+
+        if target.islocked:
+            raise CommandError('The target project is locked.')
+
+        try:
+            report = clone_webresources(
+                source,
+                target,
+                creator,
+                ids=options['ids'],
+                checked_within=options['checked_within'],
+                workers=options['workers']
+            )
+        except WebResource.DoesNotExist, error:
+            raise CommandError(str(error))
+
+        for result in report:
+            if result['errors']:
+                self.stderr.write('Web resource %s (%s): %s' % (
+                    result['source'],
+                    result['name'],
+                    ' '.join(result['errors'])
+                ))
+
+        self.stdout.write('%s of %s web resources cloned.' % (
+            len([result for result in report if result['id']]),
+            len(report)
+        ))
@@ -0,0 +1,28 @@
+"""Command `deduplicate_symbols`."""
+
+from django.core.management.base import BaseCommand
+
+from ...helpers.symbol_helpers import deduplicate_symbols
+
+
+class Command(BaseCommand):
+    """A command to move existing symbols to content-addressed names."""
+
+    help = 'Store existing symbols under the hash of their content.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument('--batch-size', type=int, default=100)
+
+    def handle(self, *args, **options):
+        """Deduplicate symbols."""
+        processed, deleted = deduplicate_symbols(
+            batch_size=options['batch_size']
+        )
+
+        self.stdout.write(
+            '%s symbol files processed, %s old files deleted.' % (
+                processed,
+                deleted
+            )
+        )
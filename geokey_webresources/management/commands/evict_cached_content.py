@@ -0,0 +1,38 @@
+"""Command `evict_cached_content`."""
+
+from django.core.management.base import BaseCommand
+
+from ...helpers.cache_helpers import evict_cached_content, get_stats
+
+
+class Command(BaseCommand):
+    """A command to evict cached remote content over the size limits."""
+
+    help = 'Evict the least recently used cached data of web resources.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            '--max-size',
+            type=int,
+            help='Maximum total size (in bytes) of cached data.'
+        )
+        parser.add_argument(
+            '--project-max-size',
+            type=int,
+            help='Maximum size (in bytes) of data used by a single project.'
+        )
+
+    def handle(self, *args, **options):
+        """Evict cached content and report statistics of the cache."""
+        evicted = evict_cached_content(
+            max_size=options['max_size'],
+            project_max_size=options['project_max_size']
+        )
+        stats = get_stats()
+
+        self.stdout.write('%s cached entries evicted.' % evicted)
+        self.stdout.write(
+            'Cached: %(entries)s entries, %(size)s bytes. Hits: %(hits)s, '
+            'misses: %(misses)s, evictions: %(evictions)s.' % stats
+        )
@@ -0,0 +1,65 @@
+"""Command `export_webresources`."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from geokey.projects.models import Project
+
+from ...models import WebResource
+from ...helpers.export_helpers import (
+    EXPORT_FORMATS,
+    export_webresources,
+    stream_ndjson,
+    stream_json,
+    stream_archive
+)
+
+
+class Command(BaseCommand):
+    """A command to export web resources of one or many projects."""
+
+    help = 'Export web resources of projects as NDJSON, JSON or zip archive.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument('project_ids', nargs='+', type=int)
+        parser.add_argument(
+            '--format',
+            choices=EXPORT_FORMATS,
+            default='ndjson'
+        )
+        parser.add_argument(
+            '--output',
+            help='File to write to, standard output if not set.'
+        )
+
+    def handle(self, *args, **options):
+        """Export web resources."""
+        project_ids = set(options['project_ids'])
+        found = set(Project.objects.filter(
+            pk__in=project_ids
+        ).values_list('pk', flat=True))
+
+        if found != project_ids:
+            raise CommandError('Projects %s do not exist.' % ', '.join(
+                str(project_id) for project_id in project_ids - found
+            ))
+
+        webresources = WebResource.objects.filter(project__in=project_ids)
+
+        if options['format'] == 'ndjson':
+            content = stream_ndjson(export_webresources(webresources))
+        elif options['format'] == 'json':
+            content = stream_json(export_webresources(webresources))
+        else:
+            if options['output'] is None:
+                raise CommandError('Zip archive must be written to a file.')
+
+            content = stream_archive(webresources)
+
+        if options['output'] is None:
+            for chunk in content:
+                self.stdout.write(chunk, ending='')
+        else:
+            with open(options['output'], 'wb') as output:
+                for chunk in content:
+                    output.write(chunk)
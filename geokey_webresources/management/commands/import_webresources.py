@@ -0,0 +1,79 @@
+"""Command `import_webresources`."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from geokey.projects.models import Project
+from geokey.users.models import User
+
+from ...helpers.import_helpers import (
+    MANIFEST_FORMATS,
+    read_manifest,
+    import_webresources
+)
+
+
+class Command(BaseCommand):
+    """A command to import web resources from a JSON or CSV manifest."""
+
+    help = 'Import web resources to a project from a JSON or CSV manifest.'
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('manifest')
+        parser.add_argument(
+            '--format',
+            choices=MANIFEST_FORMATS,
+            help='Format of the manifest, guessed from its name if not set.'
+        )
+        parser.add_argument(
+            '--creator',
+            type=int,
+            help='ID of the user set as creator, project creator if not set.'
+        )
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--workers', type=int, default=8)
+
+    def handle(self, *args, **options):
+        """Import web resources."""
+        try:
+            project = Project.objects.get(pk=options['project_id'])
+            creator = project.creator
+            if options['creator'] is not None:
+                creator = User.objects.get(pk=options['creator'])
+        except (Project.DoesNotExist, User.DoesNotExist), error:
+            raise CommandError(str(error))
+
+        if project.islocked:
+            raise CommandError('The project is locked.')
+
+        manifest_format = options['format']
+        if manifest_format is None:
+            manifest_format = options['manifest'].rsplit('.', 1)[-1].lower()
+
+        try:
+            with open(options['manifest'], 'rb') as manifest:
+                rows = read_manifest(manifest, manifest_format)
+        except (IOError, ValueError), error:
+            raise CommandError(str(error))
+
+        report = import_webresources(
+            project,
+            creator,
+            rows,
+            batch_size=options['batch_size'],
+            workers=options['workers']
+        )
+
+        for result in report:
+            if result['errors']:
+                self.stderr.write('Row %s (%s): %s' % (
+                    result['row'],
+                    result['name'],
+                    ' '.join(result['errors'])
+                ))
+
+        self.stdout.write('%s of %s web resources imported.' % (
+            len([result for result in report if result['id']]),
+            len(report)
+        ))
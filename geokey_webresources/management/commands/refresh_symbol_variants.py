@@ -0,0 +1,29 @@
+"""Command `refresh_symbol_variants`."""
+
+from django.core.management.base import BaseCommand
+
+from ...models import WebResource
+from ...helpers.symbol_helpers import refresh_symbol_variants
+
+
+class Command(BaseCommand):
+    """A command to create resized variants of existing symbols."""
+
+    help = 'Create resized variants of symbols of all web resources.'
+
+    def handle(self, *args, **options):
+        """Create variants of symbols."""
+        refreshed = 0
+
+        for webresource in WebResource.objects.exclude(symbol='').exclude(
+                symbol__isnull=True).iterator():
+            try:
+                refresh_symbol_variants(webresource)
+                refreshed += 1
+            except IOError, error:
+                self.stderr.write('Web resource %s: %s' % (
+                    webresource.id,
+                    error
+                ))
+
+        self.stdout.write('Symbols of %s web resources refreshed.' % refreshed)
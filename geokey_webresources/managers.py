@@ -1,8 +1,32 @@
 """All managers for the extension."""
 
-from django.db import models
+import hashlib
 
-from .base import STATUS
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import models, transaction, IntegrityError
+from django.db.models import (
+    Q,
+    Case,
+    When,
+    Value,
+    IntegerField,
+    TextField,
+    Count,
+    Max
+)
+from django.utils import timezone
+
+from .base import (
+    STATUS,
+    ACTION,
+    ORDER_GAP,
+    PAGE_SIZE,
+    CHANGES_LIMIT,
+    CHANGES_GRACE
+)
+from .signals import bulk_change, send_bulk_change
 
 
 class WebResourceManager(models.Manager):
@@ -21,3 +45,558 @@ class WebResourceManager(models.Manager):
             WebResourceManager,
             self
         ).get_queryset().exclude(status=STATUS.deleted)
+
+    def page(self, query=None, after=None, size=PAGE_SIZE):
+        """
+        Return a single page of web resources.
+
+        Pages are read by seeking past the last web resource of the previous
+        page, so reading further pages is as fast as reading the first one.
+        Web resources are searched by the beginning of their name or URL (with
+        or without the scheme), which uses expression indexes.
+
+        Parameters
+        ----------
+        query : str
+            Text, with which name or URL of web resources should start.
+        after : geokey_webresources.models.WebResource
+            Last web resource of the previous page, first page if not set.
+        size : int
+            Maximum number of web resources on the page.
+
+        Returns
+        -------
+        tuple
+            Web resources on the page, together with their creators, and
+            whether there are more web resources after them.
+        """
+        webresources = self.get_queryset()
+
+        if query:
+            webresources = webresources.filter(
+                Q(name__istartswith=query) |
+                Q(url__istartswith=query) |
+                Q(url__istartswith='http://' + query) |
+                Q(url__istartswith='https://' + query)
+            )
+
+        if after is not None:
+            webresources = webresources.filter(
+                Q(order__gt=after.order) |
+                Q(order=after.order, pk__gt=after.pk)
+            )
+
+        webresources = list(
+            webresources.select_related('creator').order_by('order', 'pk')
+            [:size + 1]
+        )
+
+        return webresources[:size], len(webresources) > size
+
+    def refresh_snapshots(self, ids):
+        """
+        Refresh JSON snapshots of web resources.
+
+        Snapshots are rendered with `render_snapshot` and written with a
+        single `UPDATE` statement.
+
+        Parameters
+        ----------
+        ids : iterable
+            IDs of web resources to refresh.
+        """
+        # Serializers depend on models, which depend on this module
+        from .serializers import render_snapshot
+
+        webresources = list(
+            self.filter(pk__in=ids).prefetch_related('symbol_variants')
+        )
+
+        if webresources:
+            self.filter(
+                pk__in=[webresource.pk for webresource in webresources]
+            ).update(snapshot=Case(
+                *[When(
+                    pk=webresource.pk,
+                    then=Value(render_snapshot(webresource))
+                ) for webresource in webresources],
+                output_field=TextField()
+            ))
+
+    def reorder(self, order):
+        """
+        Reorder web resources.
+
+        All web resources are fetched with one query and their new positions
+        are written with a single `UPDATE` statement, which only changes the
+        `order` column. Positions are spread by `ORDER_GAP`, so that web
+        resources can be moved afterwards without renumbering others.
+
+        Parameters
+        ----------
+        order : list
+            IDs of web resources, in the new order.
+
+        Raises
+        ------
+        TypeError
+            When order is not a list.
+        ValueError
+            When IDs are not integers, or some are repeated.
+        DoesNotExist
+            When one or more web resources were not found.
+        """
+        if not isinstance(order, (list, tuple)):
+            raise TypeError('Order must be a list of web resource IDs.')
+
+        order = [int(webresource_id) for webresource_id in order]
+
+        if len(set(order)) != len(order):
+            raise ValueError('Web resource IDs must not be repeated.')
+
+        with transaction.atomic():
+            webresources = self.filter(pk__in=order)
+            projects = dict(webresources.values_list('pk', 'project'))
+
+            if set(projects.keys()) != set(order):
+                raise self.model.DoesNotExist(
+                    'One or more web resources were not found.'
+                )
+
+            if order:
+                webresources.update(order=Case(
+                    *[When(
+                        pk=webresource_id,
+                        then=Value(position * ORDER_GAP)
+                    ) for position, webresource_id in enumerate(order)],
+                    output_field=IntegerField()
+                ))
+                send_bulk_change(
+                    self.model,
+                    projects.items(),
+                    ACTION.reordered
+                )
+
+    def move(self, webresource, before=None, after=None):
+        """
+        Move web resource next to another one.
+
+        New position is computed between the positions of new neighbours, so
+        only the moved web resource is updated. When there is no gap left
+        between neighbours, all web resources are rebalanced.
+
+        Parameters
+        ----------
+        webresource : geokey_webresources.models.WebResource
+            Web resource that is being moved.
+        before : int
+            Identifies the web resource, which should follow the moved one.
+        after : int
+            Identifies the web resource, which should precede the moved one.
+
+        Raises
+        ------
+        DoesNotExist
+            When neighbour web resource was not found.
+        """
+        if (before is None) == (after is None):
+            raise ValueError('Either before or after must be set.')
+
+        neighbour_id = int(before if before is not None else after)
+
+        with transaction.atomic():
+            positions = list(
+                self.exclude(pk=webresource.pk)
+                .order_by('order', 'pk')
+                .values_list('pk', 'order')
+            )
+            ids = [webresource_id for webresource_id, _ in positions]
+
+            if neighbour_id not in ids:
+                raise self.model.DoesNotExist(
+                    'Neighbour web resource was not found.'
+                )
+
+            index = ids.index(neighbour_id)
+            if after is not None:
+                index += 1
+
+            lower = positions[index - 1][1] if index > 0 else None
+            upper = positions[index][1] if index < len(positions) else None
+
+            if lower is None:
+                order = upper - ORDER_GAP
+            elif upper is None:
+                order = lower + ORDER_GAP
+            elif upper - lower > 1:
+                order = (lower + upper) // 2
+            else:
+                order = None
+
+            if order is None:
+                ids.insert(index, webresource.pk)
+                self.reorder(ids)
+                order = index * ORDER_GAP
+            else:
+                self.filter(pk=webresource.pk).update(order=order)
+                send_bulk_change(
+                    self.model,
+                    [(webresource.pk, webresource.project_id)],
+                    ACTION.reordered
+                )
+
+            webresource.order = order
+
+    def update_status(self, ids, status):
+        """
+        Update status of web resources.
+
+        All web resources are fetched with one query and updated with a single
+        `UPDATE` statement. Web resources that already have the status are
+        left untouched.
+
+        Parameters
+        ----------
+        ids : list
+            IDs of web resources to update.
+        status : str
+            New status of web resources.
+
+        Returns
+        -------
+        list
+            Updated web resources.
+
+        Raises
+        ------
+        DoesNotExist
+            When one or more web resources were not found.
+        """
+        ids = [int(webresource_id) for webresource_id in ids]
+
+        with transaction.atomic():
+            webresources = list(self.filter(pk__in=ids))
+
+            found = set(webresource.id for webresource in webresources)
+            if found != set(ids):
+                raise self.model.DoesNotExist(
+                    'One or more web resources were not found.'
+                )
+
+            now = timezone.now()
+            self.filter(pk__in=ids).exclude(status=status).update(
+                status=status,
+                status_changed=now,
+                modified=now
+            )
+            send_bulk_change(
+                self.model,
+                [(webresource.id, webresource.project_id)
+                 for webresource in webresources
+                 if webresource.status != status],
+                ACTION.deleted if status == STATUS.deleted else ACTION.updated
+            )
+
+        for webresource in webresources:
+            if webresource.status != status:
+                webresource.status = status
+                webresource.status_changed = now
+                webresource.modified = now
+
+        return webresources
+
+    def mark_deleted(self):
+        """
+        Mark all web resources as deleted.
+
+        Web resources are not loaded, but marked with a single `UPDATE`
+        statement. Their IDs are only read when the `bulk_change` signal has
+        receivers. Use on a related manager (e.g. `project.webresources`) to
+        mark web resources of a single project only.
+
+        Returns
+        -------
+        int
+            Number of web resources marked as deleted.
+        """
+        with transaction.atomic():
+            webresources = []
+            if bulk_change.has_listeners(self.model):
+                webresources = list(self.values_list('pk', 'project'))
+
+            now = timezone.now()
+            count = self.update(
+                status=STATUS.deleted,
+                status_changed=now,
+                modified=now
+            )
+            send_bulk_change(self.model, webresources, ACTION.deleted)
+
+        return count
+
+
+class SymbolSpriteManager(models.Manager):
+    """Manage a sprite of symbols of a project."""
+
+    def version(self, project_id):
+        """
+        Return the version of sprites of a project.
+
+        Version is a hash of checksums of sprites at all scales, so it
+        changes whenever any of them changes.
+
+        Parameters
+        ----------
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        str
+            Version of sprites, `None` if the project has no sprites.
+        """
+        checksums = list(self.filter(
+            project=project_id
+        ).order_by('scale').values_list('checksum', flat=True))
+
+        if not checksums:
+            return None
+
+        return hashlib.sha1(':'.join(checksums)).hexdigest()
+
+
+class ProjectSummaryManager(models.Manager):
+    """Manage a summary of web resources of a single project."""
+
+    def refresh(self, project_ids):
+        """
+        Refresh summaries of projects.
+
+        Web resources of all projects are counted with one query. Snapshots
+        of active web resources are joined into a JSON array for each project,
+        which is left empty when any of them has no snapshot yet. Missing
+        summaries are created within a savepoint, and updated instead when a
+        concurrent refresh has created them meanwhile.
+
+        Parameters
+        ----------
+        project_ids : iterable
+            IDs of projects to refresh.
+        """
+        project_ids = set(project_ids)
+        webresources = apps.get_model('geokey_webresources', 'WebResource')
+
+        counts = dict(
+            (count['project'], count)
+            for count in webresources.objects.filter(
+                project__in=project_ids
+            ).values('project').annotate(
+                active=Count(Case(When(status=STATUS.active, then=1))),
+                inactive=Count(Case(When(status=STATUS.inactive, then=1)))
+            ).order_by()
+        )
+
+        snapshots = {}
+        for project_id, snapshot in webresources.objects.filter(
+            project__in=project_ids,
+            status=STATUS.active
+        ).order_by('order', 'pk').values_list('project', 'snapshot'):
+            snapshots.setdefault(project_id, []).append(snapshot)
+
+        now = timezone.now()
+
+        with transaction.atomic():
+            existing = set(self.filter(
+                project__in=project_ids
+            ).values_list('project', flat=True))
+
+            summaries = []
+            for project_id in project_ids:
+                count = counts.get(project_id, {})
+                snapshot = snapshots.get(project_id, [])
+                values = {
+                    'active': count.get('active', 0),
+                    'inactive': count.get('inactive', 0),
+                    'snapshot': (
+                        '' if '' in snapshot
+                        else '[%s]' % ','.join(snapshot)
+                    ),
+                    'changed': now
+                }
+
+                if project_id in existing:
+                    self.filter(project=project_id).update(**values)
+                else:
+                    summaries.append(
+                        self.model(project_id=project_id, **values)
+                    )
+
+            try:
+                with transaction.atomic():
+                    self.bulk_create(summaries)
+            except IntegrityError:
+                # Summaries were created by a concurrent refresh meanwhile,
+                # so they are updated instead
+                for summary in summaries:
+                    self.update_or_create(
+                        project_id=summary.project_id,
+                        defaults=dict(
+                            (name, getattr(summary, name))
+                            for name in ('active', 'inactive', 'snapshot',
+                                         'changed')
+                        )
+                    )
+
+    def schedule_refresh(self, project_id):
+        """
+        Refresh summary of a project, once the transaction commits.
+
+        Refreshing a summary reads snapshots of all active web resources of
+        the project, so summaries scheduled many times within a transaction
+        (e.g. when many web resources are saved one by one) are refreshed
+        once. Outside of a transaction, the summary is refreshed straight
+        away.
+
+        Parameters
+        ----------
+        project_id : int
+            Identifies the project in the database.
+        """
+        connection = transaction.get_connection(self.db)
+
+        if not connection.in_atomic_block:
+            self.refresh([project_id])
+            return
+
+        # Callbacks are replaced with a new list when the transaction is
+        # committed or rolled back, which starts a new set of projects
+        callbacks, scheduled = getattr(
+            connection,
+            'webresources_summaries',
+            (None, None)
+        )
+        if callbacks is not connection.run_on_commit:
+            scheduled = set()
+            connection.webresources_summaries = (
+                connection.run_on_commit,
+                scheduled
+            )
+
+        if project_id not in scheduled:
+            scheduled.add(project_id)
+            transaction.on_commit(
+                lambda: self.refresh([project_id]),
+                using=self.db
+            )
+
+
+class WebResourceChangeManager(models.Manager):
+    """Manage a log of changes of web resources."""
+
+    def log(self, webresources, action):
+        """
+        Log changes of web resources.
+
+        ID of the web resource is kept with the change, so that the change
+        is reported even after the web resource is deleted permanently.
+
+        Parameters
+        ----------
+        webresources : iterable
+            Pairs of web resource ID and project ID.
+        action : str
+            What has changed: web resources were created, updated, reordered
+            or deleted.
+        """
+        self.bulk_create([
+            self.model(
+                webresource_id=webresource_id,
+                webresource_key=webresource_id,
+                project_id=project_id,
+                action=action
+            ) for webresource_id, project_id in webresources
+        ])
+
+    def cursor(self, project_id, grace=CHANGES_GRACE):
+        """
+        Return the cursor of the latest change of web resources.
+
+        Changes logged within the grace period are not settled yet, so the
+        cursor stays before them.
+
+        Parameters
+        ----------
+        project_id : int
+            Identifies the project in the database.
+        grace : int
+            Number of seconds, after which a change is settled.
+
+        Returns
+        -------
+        int
+            Cursor of the latest change, 0 if there are no changes.
+        """
+        return self.filter(
+            project=project_id,
+            changed__lte=timezone.now() - timedelta(seconds=grace)
+        ).aggregate(cursor=Max('pk'))['cursor'] or 0
+
+    def since(self, project_id, cursor, limit=CHANGES_LIMIT,
+              grace=CHANGES_GRACE):
+        """
+        Return changes of web resources that follow the cursor.
+
+        Only the latest change of each web resource is returned, together
+        with the current state of the web resource (`None` when deleted
+        permanently).
+
+        IDs of changes are assigned when they are logged, not when they are
+        committed, so a change with a lower ID can become visible after
+        others. Changes are therefore returned only once settled (logged
+        before the grace period), up to the first one that is not, and the
+        cursor never passes a change that is still being committed.
+
+        Parameters
+        ----------
+        project_id : int
+            Identifies the project in the database.
+        cursor : int
+            Cursor of the last change already seen.
+        limit : int
+            Maximum number of changes read at once.
+        grace : int
+            Number of seconds, after which a change is settled.
+
+        Returns
+        -------
+        tuple
+            Changes, cursor of the last of them and whether there are more
+            changes after it.
+        """
+        changes = list(
+            self.filter(project=project_id, pk__gt=cursor)
+            .select_related('webresource')
+            .prefetch_related('webresource__symbol_variants')
+            .order_by('pk')[:limit + 1]
+        )
+
+        more = len(changes) > limit
+        changes = changes[:limit]
+
+        settled = timezone.now() - timedelta(seconds=grace)
+        for index, change in enumerate(changes):
+            if change.changed > settled:
+                changes = changes[:index]
+                more = False
+                break
+
+        if changes:
+            cursor = changes[-1].pk
+
+        latest = dict(
+            (change.webresource_key, change) for change in changes
+        )
+
+        changes = sorted(latest.values(), key=lambda change: change.pk)
+
+        return changes, cursor, more
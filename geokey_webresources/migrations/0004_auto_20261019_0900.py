@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 09:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0003_auto_20160324_1615'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webresource',
+            index=models.Index(fields=['project', 'status', 'order'], name='wr_project_status_order_idx'),
+        ),
+        # Partial index for the live (not deleted) web resources of a project,
+        # matches the default manager that always excludes deleted ones.
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX wr_project_order_live_idx '
+                'ON geokey_webresources_webresource (project_id, "order") '
+                'WHERE status <> \'deleted\';'
+            ),
+            reverse_sql='DROP INDEX IF EXISTS wr_project_order_live_idx;',
+        ),
+    ]
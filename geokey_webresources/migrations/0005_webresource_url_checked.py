@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0004_auto_20261019_0900'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webresource',
+            name='url_checked',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
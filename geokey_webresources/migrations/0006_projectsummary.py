@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 11:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models import Case, When, Count
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def create_summaries(apps, schema_editor):
+    """Create summaries for all projects that have web resources."""
+    WebResource = apps.get_model('geokey_webresources', 'WebResource')
+    ProjectSummary = apps.get_model('geokey_webresources', 'ProjectSummary')
+
+    counts = WebResource.objects.exclude(
+        status='deleted'
+    ).values('project').annotate(
+        active=Count(Case(When(status='active', then=1))),
+        inactive=Count(Case(When(status='inactive', then=1)))
+    ).order_by()
+
+    ProjectSummary.objects.bulk_create([
+        ProjectSummary(
+            project_id=count['project'],
+            active=count['active'],
+            inactive=count['inactive']
+        ) for count in counts
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_auto_20160122_1409'),
+        ('geokey_webresources', '0005_webresource_url_checked'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSummary',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='webresources_summary', serialize=False, to='projects.Project')),
+                ('active', models.PositiveIntegerField(default=0)),
+                ('inactive', models.PositiveIntegerField(default=0)),
+                ('changed', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(create_summaries, migrations.RunPython.noop),
+    ]
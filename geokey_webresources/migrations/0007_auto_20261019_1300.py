@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 13:00
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0006_projectsummary'),
+    ]
+
+    operations = [
+        # Expression indexes for the case-insensitive prefix search of live
+        # web resources by name and URL (`istartswith` compares
+        # `UPPER(column::text)` with `LIKE`).
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX wr_project_name_search_idx '
+                'ON geokey_webresources_webresource '
+                '(project_id, UPPER(name::text) text_pattern_ops) '
+                'WHERE status <> \'deleted\';'
+            ),
+            reverse_sql='DROP INDEX IF EXISTS wr_project_name_search_idx;',
+        ),
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX wr_project_url_search_idx '
+                'ON geokey_webresources_webresource '
+                '(project_id, UPPER(url::text) text_pattern_ops) '
+                'WHERE status <> \'deleted\';'
+            ),
+            reverse_sql='DROP INDEX IF EXISTS wr_project_url_search_idx;',
+        ),
+    ]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 14:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_auto_20160122_1409'),
+        ('geokey_webresources', '0007_auto_20261019_1300'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebResourceChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('created', 'created'), ('updated', 'updated'), ('reordered', 'reordered'), ('deleted', 'deleted')], max_length=10)),
+                ('changed', models.DateTimeField(default=django.utils.timezone.now)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='webresource_changes', to='projects.Project')),
+                ('webresource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='geokey_webresources.WebResource')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='webresourcechange',
+            index=models.Index(fields=['project', 'id'], name='wr_change_project_id_idx'),
+        ),
+    ]
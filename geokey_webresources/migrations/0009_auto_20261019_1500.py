@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 15:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0008_webresourcechange'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectsummary',
+            name='snapshot',
+            field=models.TextField(blank=True, default=b''),
+        ),
+        migrations.AddField(
+            model_name='webresource',
+            name='snapshot',
+            field=models.TextField(blank=True, default=b''),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 16:00
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0007_auto_20160122_1409'),
+        ('geokey_webresources', '0009_auto_20261019_1500'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedWebResource',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('webresource_id', models.IntegerField(unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('dataformat', models.CharField(choices=[(b'GeoJSON', b'GeoJSON'), (b'KML', b'KML')], max_length=10)),
+                ('url', models.URLField(max_length=250)),
+                ('order', models.IntegerField(default=0)),
+                ('colour', models.TextField(default=b'#0033ff')),
+                ('created', models.DateTimeField()),
+                ('deleted', models.DateTimeField()),
+                ('archived', models.DateTimeField(default=django.utils.timezone.now)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_webresources', to='projects.Project')),
+            ],
+            options={
+                'ordering': ['webresource_id'],
+            },
+        ),
+        # Partial index for deleted web resources waiting to be archived
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX wr_deleted_status_changed_idx '
+                'ON geokey_webresources_webresource (status_changed) '
+                'WHERE status = \'deleted\';'
+            ),
+            reverse_sql='DROP INDEX IF EXISTS wr_deleted_status_changed_idx;',
+        ),
+    ]
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 17:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0010_archivedwebresource'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SymbolVariant',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=500)),
+                ('scale', models.PositiveSmallIntegerField()),
+                ('imageformat', models.CharField(max_length=10)),
+                ('image', models.ImageField(max_length=500, upload_to=b'webresources/symbols/variants')),
+                ('width', models.PositiveSmallIntegerField()),
+                ('height', models.PositiveSmallIntegerField()),
+                ('webresource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='symbol_variants', to='geokey_webresources.WebResource')),
+            ],
+            options={
+                'ordering': ['scale', 'imageformat'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='symbolvariant',
+            unique_together=set([('webresource', 'scale', 'imageformat')]),
+        ),
+    ]
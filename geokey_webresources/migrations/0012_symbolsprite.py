@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 18:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_auto_20160122_1409'),
+        ('geokey_webresources', '0011_symbolvariant'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SymbolSprite',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scale', models.PositiveSmallIntegerField()),
+                ('checksum', models.CharField(max_length=40)),
+                ('image', models.ImageField(max_length=500, upload_to=b'webresources/symbols/sprites')),
+                ('index', models.TextField(default=b'{}')),
+                ('sources', models.TextField(default=b'{}')),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('changed', models.DateTimeField(default=django.utils.timezone.now)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='symbol_sprites', to='projects.Project')),
+            ],
+            options={
+                'ordering': ['scale'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='symbolsprite',
+            unique_together=set([('project', 'scale')]),
+        ),
+    ]
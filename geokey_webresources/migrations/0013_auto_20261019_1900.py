@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 19:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0012_symbolsprite'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webresource',
+            index=models.Index(fields=['symbol'], name='wr_symbol_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 20:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0013_auto_20261019_1900'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CachedContent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.CharField(max_length=500, unique=True)),
+                ('checksum', models.CharField(db_index=True, max_length=40)),
+                ('content', models.FileField(max_length=500, upload_to=b'webresources/cache')),
+                ('content_type', models.CharField(blank=True, max_length=100)),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('etag', models.CharField(blank=True, max_length=200)),
+                ('last_modified', models.CharField(blank=True, max_length=100)),
+                ('fetched', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['url'],
+            },
+        ),
+        migrations.AddField(
+            model_name='webresource',
+            name='cached_content',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='webresources', to='geokey_webresources.CachedContent'),
+        ),
+    ]
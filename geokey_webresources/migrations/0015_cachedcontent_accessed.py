@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 21:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0014_cachedcontent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedcontent',
+            name='accessed',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 22:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def set_stored_size(apps, schema_editor):
+    """Set stored size of content cached before, which is not compressed."""
+    CachedContent = apps.get_model('geokey_webresources', 'CachedContent')
+    CachedContent.objects.update(stored_size=models.F('size'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0015_cachedcontent_accessed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedcontent',
+            name='encoding',
+            field=models.CharField(blank=True, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='cachedcontent',
+            name='brotli',
+            field=models.FileField(blank=True, max_length=500, upload_to=b'webresources/cache'),
+        ),
+        migrations.AddField(
+            model_name='cachedcontent',
+            name='stored_size',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(set_stored_size, migrations.RunPython.noop),
+    ]
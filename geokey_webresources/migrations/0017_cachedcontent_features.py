@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 23:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0016_auto_20261019_2200'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedcontent',
+            name='features',
+            field=models.FileField(blank=True, max_length=500, upload_to=b'webresources/cache'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-20 00:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0017_cachedcontent_features'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedcontent',
+            name='flatgeobuf',
+            field=models.FileField(blank=True, max_length=500, upload_to=b'webresources/cache'),
+        ),
+    ]
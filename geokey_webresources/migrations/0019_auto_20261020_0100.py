@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-20 01:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_webresource_key(apps, schema_editor):
+    """Keep ID of the web resource of changes logged before."""
+    WebResourceChange = apps.get_model(
+        'geokey_webresources',
+        'WebResourceChange'
+    )
+    WebResourceChange.objects.update(
+        webresource_key=models.F('webresource_id')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geokey_webresources', '0018_cachedcontent_flatgeobuf'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webresourcechange',
+            name='webresource_key',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.RunPython(set_webresource_key, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='webresourcechange',
+            name='webresource_key',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='webresourcechange',
+            name='webresource',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='changes', to='geokey_webresources.WebResource'),
+        ),
+    ]
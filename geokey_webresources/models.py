@@ -3,13 +3,22 @@
 from django.conf import settings
 from django.dispatch import receiver
 from django.db import models
+from django.utils import timezone
 
 from model_utils.models import StatusModel, TimeStampedModel
 
-from geokey.projects.models import Project
+from geokey.projects.models import Project, Admins
+from geokey.users.models import UserGroup
 
-from .base import STATUS, FORMAT
-from .managers import WebResourceManager
+from .base import STATUS, FORMAT, ACTION
+from .managers import (
+    WebResourceManager,
+    SymbolSpriteManager,
+    ProjectSummaryManager,
+    WebResourceChangeManager
+)
+from .signals import bulk_change
+from .helpers.access_helpers import invalidate_access
 
 
 class WebResource(StatusModel, TimeStampedModel):
@@ -22,6 +31,7 @@ class WebResource(StatusModel, TimeStampedModel):
     description = models.TextField(null=True, blank=True)
     dataformat = models.CharField(max_length=10, null=False, choices=FORMAT)
     url = models.URLField(max_length=250)
+    url_checked = models.DateTimeField(null=True, blank=True)
     order = models.IntegerField(default=0)
     colour = models.TextField(default='#0033ff')
     symbol = models.ImageField(
@@ -36,6 +46,14 @@ class WebResource(StatusModel, TimeStampedModel):
         related_name='webresources'
     )
     creator = models.ForeignKey(settings.AUTH_USER_MODEL)
+    snapshot = models.TextField(blank=True, default='')
+    cached_content = models.ForeignKey(
+        'CachedContent',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='webresources'
+    )
 
     objects = WebResourceManager()
 
@@ -43,6 +61,13 @@ class WebResource(StatusModel, TimeStampedModel):
         """Model meta."""
 
         ordering = ['order']
+        indexes = [
+            models.Index(
+                fields=['project', 'status', 'order'],
+                name='wr_project_status_order_idx'
+            ),
+            models.Index(fields=['symbol'], name='wr_symbol_idx'),
+        ]
 
     def delete(self):
         """Delete the web resource by setting its status to `deleted`."""
@@ -50,8 +75,261 @@ class WebResource(StatusModel, TimeStampedModel):
         self.save()
 
 
+class SymbolVariant(models.Model):
+    """Store a single resized variant of a symbol of a web resource."""
+
+    webresource = models.ForeignKey(
+        'WebResource',
+        related_name='symbol_variants'
+    )
+    source = models.CharField(max_length=500)
+    scale = models.PositiveSmallIntegerField()
+    imageformat = models.CharField(max_length=10)
+    image = models.ImageField(
+        upload_to='webresources/symbols/variants',
+        max_length=500
+    )
+    width = models.PositiveSmallIntegerField()
+    height = models.PositiveSmallIntegerField()
+
+    class Meta:
+        """Model meta."""
+
+        ordering = ['scale', 'imageformat']
+        unique_together = ('webresource', 'scale', 'imageformat')
+
+
+class SymbolSprite(models.Model):
+    """Store a sprite of symbols of all active web resources of a project."""
+
+    project = models.ForeignKey(
+        'projects.Project',
+        related_name='symbol_sprites'
+    )
+    scale = models.PositiveSmallIntegerField()
+    checksum = models.CharField(max_length=40)
+    image = models.ImageField(
+        upload_to='webresources/symbols/sprites',
+        max_length=500
+    )
+    index = models.TextField(default='{}')
+    sources = models.TextField(default='{}')
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    changed = models.DateTimeField(default=timezone.now)
+
+    objects = SymbolSpriteManager()
+
+    class Meta:
+        """Model meta."""
+
+        ordering = ['scale']
+        unique_together = ('project', 'scale')
+
+
+class ArchivedWebResource(models.Model):
+    """Store a single web resource, which was deleted and archived."""
+
+    FORMAT = FORMAT
+
+    webresource_id = models.IntegerField(unique=True)
+    name = models.CharField(max_length=100)
+    description = models.TextField(null=True, blank=True)
+    dataformat = models.CharField(max_length=10, null=False, choices=FORMAT)
+    url = models.URLField(max_length=250)
+    order = models.IntegerField(default=0)
+    colour = models.TextField(default='#0033ff')
+    created = models.DateTimeField()
+    deleted = models.DateTimeField()
+    archived = models.DateTimeField(default=timezone.now)
+
+    project = models.ForeignKey(
+        'projects.Project',
+        related_name='archived_webresources'
+    )
+    creator = models.ForeignKey(settings.AUTH_USER_MODEL)
+
+    class Meta:
+        """Model meta."""
+
+        ordering = ['webresource_id']
+
+
+class CachedContent(models.Model):
+    """Store content of a single URL, fetched from the remote server."""
+
+    url = models.CharField(max_length=500, unique=True)
+    checksum = models.CharField(max_length=40, db_index=True)
+    content = models.FileField(upload_to='webresources/cache', max_length=500)
+    encoding = models.CharField(max_length=10, blank=True)
+    brotli = models.FileField(
+        upload_to='webresources/cache',
+        max_length=500,
+        blank=True
+    )
+    features = models.FileField(
+        upload_to='webresources/cache',
+        max_length=500,
+        blank=True
+    )
+    flatgeobuf = models.FileField(
+        upload_to='webresources/cache',
+        max_length=500,
+        blank=True
+    )
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveIntegerField(default=0)
+    stored_size = models.PositiveIntegerField(default=0)
+    etag = models.CharField(max_length=200, blank=True)
+    last_modified = models.CharField(max_length=100, blank=True)
+    fetched = models.DateTimeField(default=timezone.now)
+    accessed = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        """Model meta."""
+
+        ordering = ['url']
+
+
+class ProjectSummary(models.Model):
+    """Store a summary of web resources of a single project."""
+
+    project = models.OneToOneField(
+        'projects.Project',
+        primary_key=True,
+        related_name='webresources_summary'
+    )
+    active = models.PositiveIntegerField(default=0)
+    inactive = models.PositiveIntegerField(default=0)
+    snapshot = models.TextField(blank=True, default='')
+    changed = models.DateTimeField(default=timezone.now)
+
+    objects = ProjectSummaryManager()
+
+
+class WebResourceChange(models.Model):
+    """Store a single change of a web resource."""
+
+    ACTION = ACTION
+
+    project = models.ForeignKey(
+        'projects.Project',
+        related_name='webresource_changes'
+    )
+    webresource = models.ForeignKey(
+        'WebResource',
+        related_name='changes',
+        null=True,
+        on_delete=models.SET_NULL
+    )
+    webresource_key = models.IntegerField()
+    action = models.CharField(max_length=10, choices=ACTION)
+    changed = models.DateTimeField(default=timezone.now)
+
+    objects = WebResourceChangeManager()
+
+    class Meta:
+        """Model meta."""
+
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['project', 'id'],
+                name='wr_change_project_id_idx'
+            ),
+        ]
+
+
+@receiver(models.signals.post_save, sender=WebResource)
+def post_save_webresource(sender, instance, created, **kwargs):
+    """Refresh snapshots, summary, sprites and cache, and log the change."""
+    from .helpers.sprite_helpers import schedule_symbol_sprites
+    from .helpers.cache_helpers import (
+        release_cached_content,
+        release_changed_content
+    )
+
+    WebResource.objects.refresh_snapshots([instance.id])
+    ProjectSummary.objects.schedule_refresh(instance.project_id)
+    schedule_symbol_sprites(instance.project_id)
+
+    if created:
+        action = ACTION.created
+    elif instance.status == STATUS.deleted:
+        action = ACTION.deleted
+        release_cached_content([instance.cached_content_id])
+    else:
+        action = ACTION.updated
+
+        if instance.cached_content_id is not None:
+            release_changed_content([instance.id])
+
+    WebResourceChange.objects.log(
+        [(instance.id, instance.project_id)],
+        action
+    )
+
+
+@receiver(bulk_change, sender=WebResource)
+def bulk_change_webresources(sender, project_id, ids, action, **kwargs):
+    """Refresh snapshots, summary, sprites and cache, and log the changes."""
+    from .helpers.sprite_helpers import schedule_symbol_sprites
+    from .helpers.cache_helpers import release_cached_content
+
+    if action != ACTION.reordered:
+        WebResource.objects.refresh_snapshots(ids)
+        schedule_symbol_sprites(project_id)
+
+    if action == ACTION.deleted:
+        release_cached_content(WebResource._base_manager.filter(
+            pk__in=ids
+        ).values_list('cached_content', flat=True))
+
+    ProjectSummary.objects.refresh([project_id])
+    WebResourceChange.objects.log(
+        [(webresource_id, project_id) for webresource_id in ids],
+        action
+    )
+
+
 @receiver(models.signals.post_save, sender=Project)
 def post_save_project(sender, instance, **kwargs):
-    """Remove associated web resources when the project gets deleted."""
+    """Mark associated web resources deleted when the project gets deleted."""
     if instance.status == 'deleted':
-        WebResource.objects.filter(project=instance).delete()
+        instance.webresources.mark_deleted()
+
+
+@receiver(models.signals.post_save, sender=Project)
+@receiver(models.signals.post_delete, sender=Project)
+def invalidate_project_access(sender, instance, **kwargs):
+    """Invalidate cached access when project gets changed or deleted."""
+    invalidate_access(instance.id)
+
+
+@receiver(models.signals.post_save, sender=Admins)
+@receiver(models.signals.post_delete, sender=Admins)
+@receiver(models.signals.post_save, sender=UserGroup)
+@receiver(models.signals.post_delete, sender=UserGroup)
+def invalidate_membership_access(sender, instance, **kwargs):
+    """Invalidate cached access when administrators or groups get changed."""
+    invalidate_access(instance.project_id)
+
+
+@receiver(models.signals.m2m_changed, sender=UserGroup.users.through)
+def invalidate_usergroup_access(sender, instance, action, reverse, pk_set,
+                                **kwargs):
+    """Invalidate cached access when users of groups get changed."""
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+
+    if not reverse:
+        invalidate_access(instance.project_id)
+        return
+
+    if pk_set is None:
+        projects = Project.objects.filter(usergroups__users=instance)
+    else:
+        projects = Project.objects.filter(usergroups__in=pk_set)
+
+    for project_id in set(projects.values_list('pk', flat=True)):
+        invalidate_access(project_id)
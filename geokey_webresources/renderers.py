@@ -0,0 +1,38 @@
+"""All renderers for the extension."""
+
+from rest_framework.renderers import JSONRenderer
+
+
+class RawJSON(unicode):
+    """JSON that has already been rendered."""
+
+
+class SnapshotJSONRenderer(JSONRenderer):
+    """Renderer for JSON, which passes already rendered JSON through."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON.
+
+        Parameters
+        ----------
+        data : object
+            Data to render, or already rendered `RawJSON`.
+        accepted_media_type : str
+            Accepted media type.
+        renderer_context : dict
+            Context of the renderer.
+
+        Returns
+        -------
+        bytes
+            Rendered JSON.
+        """
+        if isinstance(data, RawJSON):
+            return data.encode('utf-8')
+
+        return super(SnapshotJSONRenderer, self).render(
+            data,
+            accepted_media_type,
+            renderer_context
+        )
@@ -1,34 +1,100 @@
 """All serializers for the extension."""
 
+import os
+import hashlib
+
+from django.core.urlresolvers import reverse
+
+from rest_framework.renderers import JSONRenderer
 from rest_framework.serializers import SerializerMethodField
 
 from geokey.core.serializers import FieldSelectorSerializer
 
 from .models import WebResource
+from .helpers.symbol_helpers import symbol_checksum
 
 
 class WebResourceSerializer(FieldSelectorSerializer):
     """Serializer for a web resource."""
 
     symbol = SerializerMethodField()
+    symbol_variants = SerializerMethodField()
 
     def get_symbol(self, webresource):
         """
         Get URL of a symbol.
 
+        Symbols are served via API under immutable URLs. Symbols stored under
+        content-addressed names are versioned by the name itself, others by
+        the `v` query parameter, which changes with the web resource.
+
         Parameters
         ----------
         webresource : geokey_webresources.models.WebResource
             Web resource that is being serialised.
         """
-        if webresource.symbol:
+        if not webresource.symbol:
+            return None
+
+        name = webresource.symbol.name
+        directory, filename = os.path.split(name)
+
+        if directory != WebResource._meta.get_field('symbol').upload_to:
             return webresource.symbol.url
 
-        return None
+        url = reverse(
+            'geokey_webresources:api_symbol',
+            kwargs={'name': filename}
+        )
+
+        if symbol_checksum(name) is None:
+            url += '?v=%s' % hashlib.sha1('%s:%s' % (
+                name,
+                webresource.modified.isoformat()
+            )).hexdigest()[:12]
+
+        return url
+
+    def get_symbol_variants(self, webresource):
+        """
+        Get resized variants of a symbol.
+
+        Parameters
+        ----------
+        webresource : geokey_webresources.models.WebResource
+            Web resource that is being serialised.
+        """
+        return [{
+            'scale': variant.scale,
+            'format': variant.imageformat,
+            'width': variant.width,
+            'height': variant.height,
+            'url': variant.image.url
+        } for variant in webresource.symbol_variants.all()]
 
     class Meta:
         """Serializer meta."""
 
         model = WebResource
         fields = ('id', 'status', 'name', 'description', 'created', 'modified',
-                  'dataformat', 'url', 'colour', 'symbol')
+                  'dataformat', 'url', 'colour', 'symbol', 'symbol_variants')
+
+
+def render_snapshot(webresource):
+    """
+    Render JSON snapshot of a web resource.
+
+    Parameters
+    ----------
+    webresource : geokey_webresources.models.WebResource
+        Web resource to render.
+
+    Returns
+    -------
+    unicode
+        Web resource, serialized with `WebResourceSerializer` and rendered
+        as JSON.
+    """
+    return JSONRenderer().render(
+        WebResourceSerializer(webresource).data
+    ).decode('utf-8')
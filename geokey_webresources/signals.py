@@ -0,0 +1,36 @@
+"""All signals for the extension."""
+
+from django.dispatch import Signal
+
+
+# Sent when web resources are changed in bulk (without calling `save`), once
+# for each affected project
+bulk_change = Signal(providing_args=['project_id', 'ids', 'action'])
+
+
+def send_bulk_change(sender, webresources, action):
+    """
+    Send `bulk_change` signal for web resources, grouped by project.
+
+    Parameters
+    ----------
+    sender : class
+        Model of web resources.
+    webresources : iterable
+        Pairs of web resource ID and project ID.
+    action : str
+        What has changed: web resources were created, updated, reordered or
+        deleted.
+    """
+    projects = {}
+
+    for webresource_id, project_id in webresources:
+        projects.setdefault(project_id, []).append(webresource_id)
+
+    for project_id, ids in projects.items():
+        bulk_change.send(
+            sender=sender,
+            project_id=project_id,
+            ids=ids,
+            action=action
+        )
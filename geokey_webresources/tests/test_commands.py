@@ -0,0 +1,419 @@
+"""All tests for commands."""
+
+import os
+import json
+import urllib2
+import tempfile
+
+from datetime import timedelta
+from StringIO import StringIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from nose.tools import raises
+
+from geokey.core.tests.helpers import image_helpers
+from geokey.projects.tests.model_factories import ProjectFactory
+
+from .url_mocks import MixedURLHTTPHandler
+from .model_factories import WebResourceFactory
+from ..base import STATUS, ACTION
+from ..models import (
+    WebResource,
+    SymbolVariant,
+    ArchivedWebResource,
+    CachedContent,
+    ProjectSummary,
+    WebResourceChange
+)
+from ..helpers.symbol_helpers import refresh_symbol_variants
+from ..serializers import render_snapshot
+
+
+class ImportWebResourcesTest(TestCase):
+    """Test command `import_webresources`."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+
+        manifest, self.manifest = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(manifest, 'w') as manifest:
+            json.dump([
+                {
+                    'name': 'Public Houses',
+                    'url': 'http://london.co.uk/public-houses.json'
+                },
+                {
+                    'name': 'Train Stations',
+                    'url': 'http://germany.de/missing.json'
+                }
+            ], manifest)
+
+        urllib2.install_opener(urllib2.build_opener(MixedURLHTTPHandler))
+
+    def tearDown(self):
+        """Tear down test."""
+        os.remove(self.manifest)
+
+    def test_command(self):
+        """Test importing web resources."""
+        stdout = StringIO()
+        stderr = StringIO()
+        call_command(
+            'import_webresources',
+            self.project.id,
+            self.manifest,
+            stdout=stdout,
+            stderr=stderr
+        )
+
+        self.assertIn('1 of 2 web resources imported.', stdout.getvalue())
+        self.assertIn('Row 2 (Train Stations)', stderr.getvalue())
+
+        webresource = self.project.webresources.get()
+        self.assertEqual(webresource.name, 'Public Houses')
+        self.assertEqual(webresource.creator, self.project.creator)
+
+    @raises(CommandError)
+    def test_command_when_project_is_locked(self):
+        """Test importing web resources, when project is locked."""
+        self.project.islocked = True
+        self.project.save()
+
+        call_command('import_webresources', self.project.id, self.manifest)
+
+    @raises(CommandError)
+    def test_command_when_no_manifest(self):
+        """Test importing web resources, when manifest does not exist."""
+        call_command('import_webresources', self.project.id, 'missing.json')
+
+
+class ExportWebResourcesTest(TestCase):
+    """Test command `export_webresources`."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project_1 = ProjectFactory.create()
+        self.project_2 = ProjectFactory.create()
+        self.webresource_1 = WebResourceFactory.create(project=self.project_1)
+        self.webresource_2 = WebResourceFactory.create(project=self.project_2)
+        WebResourceFactory.create()
+
+    def test_command(self):
+        """Test exporting web resources of many projects."""
+        stdout = StringIO()
+        call_command(
+            'export_webresources',
+            self.project_1.id,
+            self.project_2.id,
+            stdout=stdout
+        )
+
+        exported = [
+            json.loads(line) for line in stdout.getvalue().splitlines()
+        ]
+        self.assertEqual(
+            [webresource['name'] for webresource in exported],
+            [self.webresource_1.name, self.webresource_2.name]
+        )
+
+    @raises(CommandError)
+    def test_command_when_no_project(self):
+        """Test exporting web resources, when project does not exist."""
+        self.project_2.delete()
+
+        call_command(
+            'export_webresources',
+            self.project_1.id,
+            self.project_2.id
+        )
+
+    @raises(CommandError)
+    def test_command_when_zip_without_output(self):
+        """Test exporting web resources as zip archive without output."""
+        call_command(
+            'export_webresources',
+            self.project_1.id,
+            format='zip'
+        )
+
+
+class CloneWebResourcesTest(TestCase):
+    """Test command `clone_webresources`."""
+
+    def setUp(self):
+        """Set up test."""
+        self.source = ProjectFactory.create()
+        self.target = ProjectFactory.create()
+        self.webresource = WebResourceFactory.create(project=self.source)
+
+        urllib2.install_opener(urllib2.build_opener(MixedURLHTTPHandler))
+
+    def test_command(self):
+        """Test cloning web resources."""
+        stdout = StringIO()
+        call_command(
+            'clone_webresources',
+            self.source.id,
+            self.target.id,
+            stdout=stdout
+        )
+
+        self.assertIn('1 of 1 web resources cloned.', stdout.getvalue())
+
+        clone = self.target.webresources.get()
+        self.assertEqual(clone.name, self.webresource.name)
+        self.assertEqual(clone.creator, self.target.creator)
+
+    @raises(CommandError)
+    def test_command_when_target_is_locked(self):
+        """Test cloning web resources, when target project is locked."""
+        self.target.islocked = True
+        self.target.save()
+
+        call_command('clone_webresources', self.source.id, self.target.id)
+
+
+class CheckWebResourceSnapshotsTest(TestCase):
+    """Test command `check_webresource_snapshots`."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+        self.webresource = WebResourceFactory.create(project=self.project)
+
+    def test_command(self):
+        """Test checking snapshots, when they are up to date."""
+        stdout = StringIO()
+        call_command('check_webresource_snapshots', stdout=stdout)
+
+        self.assertIn('All snapshots are up to date.', stdout.getvalue())
+
+    @raises(CommandError)
+    def test_command_when_out_of_date(self):
+        """Test checking snapshots, when they are out of date."""
+        WebResource.objects.filter(pk=self.webresource.id).update(
+            name='Renamed'
+        )
+        call_command('check_webresource_snapshots', stdout=StringIO())
+
+    def test_command_when_fixing(self):
+        """Test fixing snapshots, when they are out of date."""
+        WebResource.objects.filter(pk=self.webresource.id).update(
+            name='Renamed'
+        )
+        call_command('check_webresource_snapshots', '--fix', stdout=StringIO())
+
+        webresource = WebResource.objects.get(pk=self.webresource.id)
+        self.assertEqual(webresource.snapshot, render_snapshot(webresource))
+        self.assertEqual(
+            ProjectSummary.objects.get(project=self.project).snapshot,
+            '[%s]' % webresource.snapshot
+        )
+
+
+class ArchiveWebResourcesTest(TestCase):
+    """Test command `archive_webresources`."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+        self.live = WebResourceFactory.create(project=self.project)
+        self.deleted = WebResourceFactory.create(
+            project=self.project,
+            symbol=image_helpers.get_image(file_name='test_symbol.png')
+        )
+        self.deleted_recently = WebResourceFactory.create(
+            project=self.project
+        )
+
+        self.deleted.delete()
+        self.deleted_recently.delete()
+        WebResource._base_manager.filter(pk=self.deleted.id).update(
+            status_changed=timezone.now() - timedelta(days=60)
+        )
+
+    def tearDown(self):
+        """Tear down test."""
+        for webresource in WebResource._base_manager.all():
+            if webresource.symbol:
+                webresource.symbol.delete()
+
+    def test_command(self):
+        """Test archiving web resources."""
+        symbol = self.deleted.symbol
+        stdout = StringIO()
+        call_command(
+            'archive_webresources',
+            '--days', 30,
+            '--batch-size', 1,
+            stdout=stdout
+        )
+
+        self.assertIn('1 web resources archived.', stdout.getvalue())
+        self.assertEqual(
+            set(WebResource._base_manager.values_list('id', flat=True)),
+            set([self.live.id, self.deleted_recently.id])
+        )
+        self.assertEqual(
+            ArchivedWebResource.objects.get(
+                webresource_id=self.deleted.id
+            ).name,
+            self.deleted.name
+        )
+        self.assertFalse(symbol.storage.exists(symbol.name))
+
+        changes = WebResourceChange.objects.filter(
+            webresource_key=self.deleted.id
+        )
+        self.assertEqual(changes.last().action, ACTION.deleted)
+        self.assertFalse(changes.filter(webresource__isnull=False).exists())
+
+    def test_command_when_restoring(self):
+        """Test restoring archived web resources."""
+        call_command('archive_webresources', stdout=StringIO())
+        call_command(
+            'archive_webresources',
+            '--restore', self.deleted.id,
+            stdout=StringIO()
+        )
+
+        webresource = WebResource.objects.get(pk=self.deleted.id)
+        self.assertEqual(webresource.status, STATUS.inactive)
+        self.assertEqual(webresource.created, self.deleted.created)
+        self.assertFalse(webresource.symbol)
+        self.assertFalse(webresource.symbol_variants.exists())
+        self.assertFalse(ArchivedWebResource.objects.exists())
+        self.assertEqual(
+            WebResourceChange.objects.filter(
+                webresource_key=self.deleted.id
+            ).last().action,
+            ACTION.created
+        )
+
+    @raises(CommandError)
+    def test_command_when_restoring_not_archived(self):
+        """Test restoring web resources, when they are not archived."""
+        call_command(
+            'archive_webresources',
+            '--restore', self.deleted.id,
+            stdout=StringIO()
+        )
+
+
+class DeduplicateSymbolsTest(TestCase):
+    """Test command `deduplicate_symbols`."""
+
+    def setUp(self):
+        """Set up test."""
+        self.webresources = [
+            WebResourceFactory.create(
+                symbol=image_helpers.get_image(file_name='test_symbol.png')
+            )
+            for number in range(3)
+        ]
+        self.webresources[2].delete()
+
+        for webresource in self.webresources:
+            refresh_symbol_variants(webresource)
+
+    def tearDown(self):
+        """Tear down test."""
+        for variant in SymbolVariant.objects.all():
+            variant.image.delete(save=False)
+
+        for webresource in WebResource._base_manager.all():
+            if webresource.symbol:
+                webresource.symbol.delete()
+
+    def test_command(self):
+        """Test deduplicating symbols."""
+        names = [webresource.symbol.name for webresource in self.webresources]
+        self.assertEqual(len(set(names)), 3)
+
+        stdout = StringIO()
+        call_command(
+            'deduplicate_symbols',
+            '--batch-size', 2,
+            stdout=stdout
+        )
+
+        self.assertIn(
+            '3 symbol files processed, 3 old files deleted.',
+            stdout.getvalue()
+        )
+
+        symbols = set(WebResource._base_manager.values_list(
+            'symbol',
+            flat=True
+        ))
+        self.assertEqual(len(symbols), 1)
+        self.assertEqual(
+            set(SymbolVariant.objects.values_list('source', flat=True)),
+            symbols
+        )
+
+        storage = WebResource._meta.get_field('symbol').storage
+        self.assertTrue(storage.exists(symbols.pop()))
+        for name in names:
+            self.assertFalse(storage.exists(name))
+
+        for webresource in WebResource.objects.all():
+            self.assertIn(
+                os.path.basename(webresource.symbol.name),
+                webresource.snapshot
+            )
+
+    def test_command_when_already_deduplicated(self):
+        """Test deduplicating symbols again."""
+        call_command('deduplicate_symbols', stdout=StringIO())
+
+        stdout = StringIO()
+        call_command('deduplicate_symbols', stdout=stdout)
+
+        self.assertIn(
+            '1 symbol files processed, 0 old files deleted.',
+            stdout.getvalue()
+        )
+
+
+class EvictCachedContentTest(TestCase):
+    """Test command `evict_cached_content`."""
+
+    def setUp(self):
+        """Set up test."""
+        cache.clear()
+
+        for number in range(2):
+            CachedContent.objects.create(
+                url='http://domain.com/%s.json' % number,
+                checksum=str(number) * 40,
+                content=ContentFile('x' * 10, name=str(number) * 40),
+                size=10,
+                stored_size=10
+            )
+
+    def tearDown(self):
+        """Tear down test."""
+        for cached in CachedContent.objects.all():
+            cached.content.delete(save=False)
+
+    def test_command(self):
+        """Test evicting cached content."""
+        stdout = StringIO()
+        call_command(
+            'evict_cached_content',
+            '--max-size', 10,
+            stdout=stdout
+        )
+
+        self.assertIn('1 cached entries evicted.', stdout.getvalue())
+        self.assertIn('Cached: 1 entries, 10 bytes.', stdout.getvalue())
+        self.assertIn('evictions: 1.', stdout.getvalue())
+        self.assertEqual(CachedContent.objects.count(), 1)
@@ -0,0 +1,331 @@
+"""All tests for managers."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from nose.tools import raises
+
+from geokey.projects.tests.model_factories import ProjectFactory
+
+from .model_factories import WebResourceFactory
+from ..base import STATUS, ACTION, ORDER_GAP, CHANGES_GRACE
+from ..models import WebResource, WebResourceChange
+
+
+class WebResourceManagerTest(TestCase):
+    """Test web resource manager."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+        self.webresource_1 = WebResourceFactory.create(project=self.project)
+        self.webresource_2 = WebResourceFactory.create(project=self.project)
+        self.webresource_3 = WebResourceFactory.create(project=self.project)
+
+    def test_reorder(self):
+        """Test reordering web resources."""
+        WebResource.objects.reorder([
+            self.webresource_3.id,
+            self.webresource_1.id,
+            self.webresource_2.id
+        ])
+
+        self.assertEqual(
+            list(self.project.webresources.values_list('id', 'order')),
+            [
+                (self.webresource_3.id, 0),
+                (self.webresource_1.id, ORDER_GAP),
+                (self.webresource_2.id, 2 * ORDER_GAP)
+            ]
+        )
+
+    @raises(WebResource.DoesNotExist)
+    def test_reorder_when_webresource_of_other_project(self):
+        """Test reordering web resources, when one is of other project."""
+        webresource = WebResourceFactory.create()
+        self.project.webresources.reorder([
+            self.webresource_1.id,
+            webresource.id
+        ])
+
+    @raises(TypeError)
+    def test_reorder_when_order_is_not_list(self):
+        """Test reordering web resources, when order is a string."""
+        self.project.webresources.reorder('%s%s' % (
+            self.webresource_1.id,
+            self.webresource_2.id
+        ))
+
+    @raises(ValueError)
+    def test_reorder_when_webresource_is_repeated(self):
+        """Test reordering web resources, when one is repeated."""
+        self.project.webresources.reorder([
+            self.webresource_1.id,
+            self.webresource_2.id,
+            self.webresource_1.id
+        ])
+
+    def test_move_to_the_start(self):
+        """Test moving web resource to the start."""
+        WebResource.objects.reorder([
+            self.webresource_1.id,
+            self.webresource_2.id,
+            self.webresource_3.id
+        ])
+        self.project.webresources.move(
+            self.webresource_3,
+            before=self.webresource_1.id
+        )
+
+        self.assertEqual(self.webresource_3.order, -ORDER_GAP)
+        self.assertEqual(
+            list(self.project.webresources.values_list('id', flat=True)),
+            [
+                self.webresource_3.id,
+                self.webresource_1.id,
+                self.webresource_2.id
+            ]
+        )
+
+    def test_move_to_the_end(self):
+        """Test moving web resource to the end."""
+        WebResource.objects.reorder([
+            self.webresource_1.id,
+            self.webresource_2.id,
+            self.webresource_3.id
+        ])
+        self.project.webresources.move(
+            self.webresource_1,
+            after=self.webresource_3.id
+        )
+
+        self.assertEqual(self.webresource_1.order, 3 * ORDER_GAP)
+        self.assertEqual(
+            list(self.project.webresources.values_list('id', flat=True)),
+            [
+                self.webresource_2.id,
+                self.webresource_3.id,
+                self.webresource_1.id
+            ]
+        )
+
+    @raises(WebResource.DoesNotExist)
+    def test_move_next_to_itself(self):
+        """Test moving web resource next to itself."""
+        self.project.webresources.move(
+            self.webresource_1,
+            after=self.webresource_1.id
+        )
+
+    def test_page(self):
+        """Test getting pages of web resources."""
+        WebResource.objects.reorder([
+            self.webresource_2.id,
+            self.webresource_1.id,
+            self.webresource_3.id
+        ])
+
+        webresources, more = self.project.webresources.page(size=2)
+        self.assertEqual(
+            webresources,
+            [self.webresource_2, self.webresource_1]
+        )
+        self.assertTrue(more)
+
+        webresources, more = self.project.webresources.page(
+            after=webresources[-1],
+            size=2
+        )
+        self.assertEqual(webresources, [self.webresource_3])
+        self.assertFalse(more)
+
+    def test_page_when_searching(self):
+        """Test getting pages of web resources, when searching."""
+        self.webresource_1.name = 'Rivers'
+        self.webresource_1.save()
+        self.webresource_2.url = 'https://rivers.com/all.json'
+        self.webresource_2.save()
+
+        webresources, more = self.project.webresources.page(query='river')
+        self.assertEqual(
+            set(webresources),
+            set([self.webresource_1, self.webresource_2])
+        )
+        self.assertFalse(more)
+
+        webresources, more = self.project.webresources.page(query='lakes')
+        self.assertEqual(webresources, [])
+        self.assertFalse(more)
+
+    def test_mark_deleted(self):
+        """Test marking web resources of a project as deleted."""
+        webresource = WebResourceFactory.create()
+
+        self.assertEqual(self.project.webresources.mark_deleted(), 3)
+        self.assertEqual(self.project.webresources.count(), 0)
+        self.assertEqual(
+            WebResource._base_manager.filter(
+                project=self.project,
+                status=STATUS.deleted
+            ).count(),
+            3
+        )
+        self.assertEqual(
+            WebResourceChange.objects.filter(
+                project=self.project,
+                action=ACTION.deleted
+            ).count(),
+            3
+        )
+        self.assertEqual(
+            WebResource.objects.get(pk=webresource.id).status,
+            webresource.status
+        )
+
+
+class WebResourceChangeManagerTest(TestCase):
+    """Test web resource change manager."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+        self.webresource_1 = WebResourceFactory.create(project=self.project)
+        self.webresource_2 = WebResourceFactory.create(project=self.project)
+
+    def _settle(self):
+        """Make all changes older than the grace period."""
+        WebResourceChange.objects.update(
+            changed=timezone.now() - timedelta(seconds=CHANGES_GRACE)
+        )
+
+    def test_cursor(self):
+        """Test getting cursor of the latest change."""
+        self._settle()
+        self.assertEqual(
+            WebResourceChange.objects.cursor(self.project.id),
+            WebResourceChange.objects.filter(project=self.project).last().id
+        )
+
+    def test_cursor_when_not_settled(self):
+        """Test getting cursor of the latest change, when it is recent."""
+        self._settle()
+        cursor = WebResourceChange.objects.cursor(self.project.id)
+        self.webresource_1.save()
+
+        self.assertEqual(
+            WebResourceChange.objects.cursor(self.project.id),
+            cursor
+        )
+
+    def test_cursor_when_no_changes(self):
+        """Test getting cursor of the latest change, when there are none."""
+        project = ProjectFactory.create()
+        self.assertEqual(WebResourceChange.objects.cursor(project.id), 0)
+
+    def test_since(self):
+        """Test getting changes since the cursor."""
+        self._settle()
+        cursor = WebResourceChange.objects.cursor(self.project.id)
+        self.webresource_1.save()
+        self.webresource_2.delete()
+        self.webresource_1.delete()
+        self._settle()
+
+        changes, new_cursor, more = WebResourceChange.objects.since(
+            self.project.id,
+            cursor
+        )
+
+        self.assertEqual(
+            [(change.webresource, change.action) for change in changes],
+            [
+                (self.webresource_2, ACTION.deleted),
+                (self.webresource_1, ACTION.deleted)
+            ]
+        )
+        self.assertEqual(new_cursor, changes[-1].id)
+        self.assertFalse(more)
+
+    def test_since_when_limited(self):
+        """Test getting changes since the cursor, when there are more."""
+        self._settle()
+        changes, cursor, more = WebResourceChange.objects.since(
+            self.project.id,
+            0,
+            limit=1
+        )
+
+        self.assertEqual(
+            [change.webresource for change in changes],
+            [self.webresource_1]
+        )
+        self.assertEqual(cursor, changes[0].id)
+        self.assertTrue(more)
+
+    def test_since_when_not_settled(self):
+        """
+        Test getting changes since the cursor, when some are recent.
+
+        Changes up to the first recent one are returned, so that a change
+        committed later with a lower ID is not passed.
+        """
+        self._settle()
+        cursor = WebResourceChange.objects.cursor(self.project.id)
+        self.webresource_1.save()
+        self._settle()
+        self.webresource_2.save()
+        self.webresource_1.delete()
+        WebResourceChange.objects.filter(
+            webresource_key=self.webresource_1.id,
+            action=ACTION.deleted
+        ).update(changed=timezone.now() - timedelta(seconds=CHANGES_GRACE))
+
+        changes, new_cursor, more = WebResourceChange.objects.since(
+            self.project.id,
+            cursor
+        )
+
+        self.assertEqual(
+            [(change.webresource, change.action) for change in changes],
+            [(self.webresource_1, ACTION.updated)]
+        )
+        self.assertEqual(new_cursor, changes[-1].id)
+        self.assertFalse(more)
+
+    def test_since_when_deleted_permanently(self):
+        """Test getting changes, when web resource is deleted permanently."""
+        self._settle()
+        cursor = WebResourceChange.objects.cursor(self.project.id)
+        webresource_id = self.webresource_1.id
+        self.webresource_1.delete()
+        WebResource._base_manager.filter(pk=webresource_id).delete()
+        self._settle()
+
+        changes, new_cursor, more = WebResourceChange.objects.since(
+            self.project.id,
+            cursor
+        )
+
+        self.assertEqual(
+            [
+                (change.webresource, change.webresource_key, change.action)
+                for change in changes
+            ],
+            [(None, webresource_id, ACTION.deleted)]
+        )
+
+    def test_since_when_no_changes(self):
+        """Test getting changes since the cursor, when there are none."""
+        self._settle()
+        cursor = WebResourceChange.objects.cursor(self.project.id)
+
+        changes, new_cursor, more = WebResourceChange.objects.since(
+            self.project.id,
+            cursor
+        )
+
+        self.assertEqual(changes, [])
+        self.assertEqual(new_cursor, cursor)
+        self.assertFalse(more)
@@ -1,5 +1,6 @@
 """All tests for models."""
 
+from django.db import connection
 from django.test import TestCase
 
 from nose.tools import raises
@@ -8,7 +9,14 @@ from geokey.projects.models import Project
 from geokey.projects.tests.model_factories import ProjectFactory
 
 from .model_factories import WebResourceFactory
-from ..models import WebResource, post_save_project
+from ..base import STATUS, ACTION
+from ..serializers import render_snapshot
+from ..models import (
+    WebResource,
+    ProjectSummary,
+    WebResourceChange,
+    post_save_project
+)
 
 
 class WebResourceTest(TestCase):
@@ -22,6 +30,138 @@ class WebResourceTest(TestCase):
         WebResource.objects.get(pk=webresource.id)
 
 
+class ProjectSummaryTest(TestCase):
+    """Test project summary model."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+
+    def _run_on_commit(self):
+        """Run callbacks waiting for the transaction to commit."""
+        # Test transaction is never committed, so run waiting callbacks
+        callbacks = connection.run_on_commit
+        connection.run_on_commit = []
+        for _, callback in callbacks:
+            callback()
+
+    def test_refresh_when_saving_webresource(self):
+        """Test refreshing summary when web resources are saved."""
+        webresource = WebResourceFactory.create(project=self.project)
+        WebResourceFactory.create(
+            project=self.project,
+            status=STATUS.inactive
+        )
+        self._run_on_commit()
+
+        summary = ProjectSummary.objects.get(project=self.project)
+        self.assertEqual(summary.active, 1)
+        self.assertEqual(summary.inactive, 1)
+
+        webresource.delete()
+        self._run_on_commit()
+
+        summary = ProjectSummary.objects.get(project=self.project)
+        self.assertEqual(summary.active, 0)
+        self.assertEqual(summary.inactive, 1)
+
+    def test_refresh_once_when_saving_many_webresources(self):
+        """Test summary is refreshed once, when the transaction commits."""
+        WebResourceFactory.create_batch(3, project=self.project)
+
+        self.assertFalse(
+            ProjectSummary.objects.filter(project=self.project).exists()
+        )
+        self.assertEqual(len(connection.webresources_summaries[1]), 1)
+
+        self._run_on_commit()
+
+        summary = ProjectSummary.objects.get(project=self.project)
+        self.assertEqual(summary.active, 3)
+
+    def test_refresh_when_updating_webresources_in_bulk(self):
+        """Test refreshing summary when web resources are updated in bulk."""
+        webresources = WebResourceFactory.create_batch(3, project=self.project)
+        self.project.webresources.update_status(
+            [webresource.id for webresource in webresources[:2]],
+            STATUS.inactive
+        )
+
+        summary = ProjectSummary.objects.get(project=self.project)
+        self.assertEqual(summary.active, 1)
+        self.assertEqual(summary.inactive, 2)
+
+    def test_refresh_snapshots(self):
+        """Test refreshing snapshots when web resources are saved."""
+        webresource_1 = WebResourceFactory.create(project=self.project)
+        webresource_2 = WebResourceFactory.create(project=self.project)
+        webresource_1.name = 'Rivers'
+        webresource_1.save()
+        self.project.webresources.update_status(
+            [webresource_2.id],
+            STATUS.inactive
+        )
+
+        webresource_1 = WebResource.objects.get(pk=webresource_1.id)
+        webresource_2 = WebResource.objects.get(pk=webresource_2.id)
+        for webresource in [webresource_1, webresource_2]:
+            self.assertEqual(
+                webresource.snapshot,
+                render_snapshot(webresource)
+            )
+
+        summary = ProjectSummary.objects.get(project=self.project)
+        self.assertEqual(summary.snapshot, '[%s]' % webresource_1.snapshot)
+
+    def test_refresh_when_no_webresources(self):
+        """Test refreshing summary of project without web resources."""
+        ProjectSummary.objects.refresh([self.project.id])
+
+        summary = ProjectSummary.objects.get(project=self.project)
+        self.assertEqual(summary.active, 0)
+        self.assertEqual(summary.inactive, 0)
+
+
+class WebResourceChangeTest(TestCase):
+    """Test web resource change model."""
+
+    def setUp(self):
+        """Set up test."""
+        self.project = ProjectFactory.create()
+
+    def _get_actions(self):
+        """Get logged actions of the project."""
+        return list(WebResourceChange.objects.filter(
+            project=self.project
+        ).values_list('webresource', 'action'))
+
+    def test_log_when_saving_webresource(self):
+        """Test logging changes when web resource is saved."""
+        webresource = WebResourceFactory.create(project=self.project)
+        webresource.name = 'Rivers'
+        webresource.save()
+        webresource.delete()
+
+        self.assertEqual(self._get_actions(), [
+            (webresource.id, ACTION.created),
+            (webresource.id, ACTION.updated),
+            (webresource.id, ACTION.deleted)
+        ])
+
+    def test_log_when_changing_webresources_in_bulk(self):
+        """Test logging changes when web resources are changed in bulk."""
+        webresource_1 = WebResourceFactory.create(project=self.project)
+        webresource_2 = WebResourceFactory.create(project=self.project)
+        WebResourceChange.objects.all().delete()
+
+        self.project.webresources.reorder([webresource_2.id, webresource_1.id])
+
+        self.assertEqual(set(self._get_actions()), set([
+            (webresource_1.id, ACTION.reordered),
+            (webresource_2.id, ACTION.reordered)
+        ]))
+
+
 class PostSaveProjectTest(TestCase):
     """Test post save for project."""
 
@@ -39,3 +179,28 @@ class PostSaveProjectTest(TestCase):
         post_save_project(Project, instance=project)
 
         WebResource.objects.get(pk=webresource.id)
+
+    def test_post_save_project_when_deleting_many(self):
+        """
+        Test delete project with many web resources.
+
+        Web resources should be marked as deleted, not removed.
+        """
+        project = ProjectFactory.create(status='active')
+        webresources = WebResourceFactory.create_batch(3, project=project)
+        project.delete()
+
+        self.assertEqual(
+            set(WebResource._base_manager.filter(
+                project=project
+            ).values_list('id', 'status')),
+            set((webresource.id, STATUS.deleted)
+                for webresource in webresources)
+        )
+        self.assertEqual(
+            WebResourceChange.objects.filter(
+                project=project,
+                action=ACTION.deleted
+            ).count(),
+            3
+        )
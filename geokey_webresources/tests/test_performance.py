@@ -0,0 +1,728 @@
+"""All tests for performance of views and helpers."""
+
+import os
+import json
+import time
+import gzip
+
+from io import BytesIO
+from unittest import skipIf, skipUnless
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.http import HttpRequest
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.auth.models import AnonymousUser
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from geokey.users.tests.model_factories import UserFactory
+from geokey.projects.tests.model_factories import ProjectFactory
+
+from ..base import STATUS, ACTION, ORDER_GAP
+from ..models import WebResource, CachedContent, ProjectSummary
+from ..signals import send_bulk_change
+from ..helpers.cache_helpers import compress
+from ..helpers.feature_helpers import (
+    FeatureStore,
+    build_features,
+    open_features,
+    stream_features,
+    np
+)
+from ..helpers.flatgeobuf_helpers import FlatGeobufReader, write_flatgeobuf
+from ..views import (
+    IndexPage,
+    AllWebResourcesPage,
+    SingleWebResourcePage,
+    AllWebResourcesAjax,
+    ExportWebResourcesAjax,
+    UpdateWebResourcesAjax,
+    AllWebResourcesAPI,
+    SingleWebResourceAPI
+)
+
+
+class QueryCountTestCase(TestCase):
+    """
+    Base test case for the number of queries made by views.
+
+    Each view is requested for projects with a different number of web
+    resources. The number of queries must be the same for all of them and
+    must not exceed the budget of the view, set as `queries`.
+    """
+
+    sizes = (10, 100, 1000)
+    queries = None
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.admin = UserFactory.create()
+
+    def _seed(self, size):
+        """
+        Create a project of the admin with a number of web resources.
+
+        Web resources are created in bulk, so the `bulk_change` signal is sent
+        to render their snapshots and the summary of the project, as it is
+        when they are imported.
+        """
+        project = ProjectFactory.create(add_admins=[self.admin])
+
+        WebResource.objects.bulk_create([
+            WebResource(
+                status=STATUS.active if number % 2 else STATUS.inactive,
+                name='Web Resource %s' % number,
+                description='Web Resource %s description.' % number,
+                dataformat='GeoJSON',
+                url='https://domain.com/%d.json' % number,
+                order=number * ORDER_GAP,
+                project=project,
+                creator=UserFactory.create() if number < 10 else self.admin
+            )
+            for number in range(size)
+        ])
+        send_bulk_change(
+            WebResource,
+            project.webresources.values_list('pk', 'project'),
+            ACTION.created
+        )
+
+        return project
+
+    def _page_request(self):
+        """Make request for a page."""
+        request = HttpRequest()
+        request.method = 'GET'
+        request.user = self.admin
+
+        setattr(request, 'session', 'session')
+        messages = FallbackStorage(request)
+        setattr(request, '_messages', messages)
+
+        return request
+
+    def _count_queries(self, make_request):
+        """Count queries of the request for each size of the project."""
+        counts = []
+
+        for size in self.sizes:
+            project = self._seed(size)
+
+            with CaptureQueriesContext(connection) as queries:
+                response = make_request(project)
+                self.assertEqual(response.status_code, 200)
+
+            counts.append(len(queries))
+
+        return counts
+
+    def assertWithinBudget(self, counts):
+        """Assert that the numbers of queries do not exceed the budget."""
+        self.assertLessEqual(
+            max(counts),
+            self.queries,
+            'Queries made: %s, budget: %s.' % (
+                ', '.join(str(count) for count in counts),
+                self.queries
+            )
+        )
+
+    def assertConstantQueries(self, make_request):
+        """Assert that the number of queries does not grow with the size."""
+        counts = self._count_queries(make_request)
+
+        self.assertEqual(
+            len(set(counts)),
+            1,
+            'Queries made for %s web resources: %s.' % (
+                ', '.join(str(size) for size in self.sizes),
+                ', '.join(str(count) for count in counts)
+            )
+        )
+        self.assertWithinBudget(counts)
+
+
+class IndexPageQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by the index page."""
+
+    queries = 4
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = IndexPage.as_view()
+
+        def make_request(project):
+            return view(self._page_request()).render()
+
+        self.assertConstantQueries(make_request)
+
+    def test_get_with_admin_when_many_projects(self):
+        """Test GET with with admin, when there are many projects."""
+        view = IndexPage.as_view()
+        counts = []
+
+        for size in (1, 5, 10):
+            for number in range(size):
+                self._seed(10)
+
+            with CaptureQueriesContext(connection) as queries:
+                view(self._page_request()).render()
+
+            counts.append(len(queries))
+
+        self.assertEqual(len(set(counts)), 1, counts)
+        self.assertWithinBudget(counts)
+
+
+class AllWebResourcesPageQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by all web resources page."""
+
+    queries = 6
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = AllWebResourcesPage.as_view()
+
+        def make_request(project):
+            return view(
+                self._page_request(),
+                project_id=project.id
+            ).render()
+
+        self.assertConstantQueries(make_request)
+
+
+class SingleWebResourcePageQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by single web resource page."""
+
+    queries = 7
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = SingleWebResourcePage.as_view()
+
+        def make_request(project):
+            return view(
+                self._page_request(),
+                project_id=project.id,
+                webresource_id=project.webresources.last().id
+            ).render()
+
+        self.assertConstantQueries(make_request)
+
+
+class AllWebResourcesAjaxQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by all web resources via Ajax."""
+
+    queries = 6
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = AllWebResourcesAjax.as_view()
+
+        def make_request(project):
+            request = self.factory.get(
+                reverse(
+                    'geokey_webresources:ajax_all_webresources',
+                    kwargs={'project_id': project.id}
+                ),
+                {'after': project.webresources.first().id}
+            )
+            force_authenticate(request, user=self.admin)
+
+            return view(request, project_id=project.id).render()
+
+        self.assertConstantQueries(make_request)
+
+
+class ExportWebResourcesAjaxQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by export of web resources."""
+
+    queries = 6
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = ExportWebResourcesAjax.as_view()
+
+        def make_request(project):
+            request = self.factory.get(reverse(
+                'geokey_webresources:ajax_webresources_export',
+                kwargs={'project_id': project.id}
+            ))
+            force_authenticate(request, user=self.admin)
+
+            response = view(request, project_id=project.id)
+            ''.join(response.streaming_content)
+
+            return response
+
+        self.assertConstantQueries(make_request)
+
+
+class UpdateWebResourcesAjaxQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by update of web resources."""
+
+    queries = 25
+
+    def test_put_with_admin(self):
+        """Test PUT with with admin."""
+        view = UpdateWebResourcesAjax.as_view()
+
+        def make_request(project):
+            request = self.factory.put(
+                reverse(
+                    'geokey_webresources:ajax_webresources_update',
+                    kwargs={'project_id': project.id}
+                ),
+                {
+                    'ids': list(
+                        project.webresources.values_list('id', flat=True)
+                    ),
+                    'status': STATUS.active
+                },
+                format='json'
+            )
+            force_authenticate(request, user=self.admin)
+
+            return view(request, project_id=project.id).render()
+
+        self.assertConstantQueries(make_request)
+
+
+class AllWebResourcesAPIQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by API of all web resources."""
+
+    queries = 5
+
+    def _seed(self, size):
+        """Create a project, which web resources are served from summary."""
+        project = super(AllWebResourcesAPIQueryCountTest, self)._seed(size)
+        self.assertTrue(ProjectSummary.objects.get(project=project).snapshot)
+
+        return project
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = AllWebResourcesAPI.as_view()
+
+        def make_request(project):
+            request = self.factory.get(reverse(
+                'geokey_webresources:api_all_webresources',
+                kwargs={'project_id': project.id}
+            ))
+            force_authenticate(request, user=self.admin)
+
+            return view(request, project_id=project.id).render()
+
+        self.assertConstantQueries(make_request)
+
+
+class SingleWebResourceAPIQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made by API of single web resource."""
+
+    queries = 5
+
+    def test_get_with_admin(self):
+        """Test GET with with admin."""
+        view = SingleWebResourceAPI.as_view()
+
+        def make_request(project):
+            webresource = project.webresources.filter(
+                status=STATUS.active
+            ).last()
+
+            request = self.factory.get(reverse(
+                'geokey_webresources:api_single_webresource',
+                kwargs={
+                    'project_id': project.id,
+                    'webresource_id': webresource.id
+                }
+            ))
+            force_authenticate(request, user=self.admin)
+
+            return view(
+                request,
+                project_id=project.id,
+                webresource_id=webresource.id
+            ).render()
+
+        self.assertConstantQueries(make_request)
+
+
+class PublicAPIAccessQueryCountTest(TestCase):
+    """Test the number of queries saved by cached access to projects."""
+
+    def setUp(self):
+        """Set up test."""
+        cache.clear()
+
+        self.factory = APIRequestFactory()
+        self.view = AllWebResourcesAPI.as_view()
+        self.user = UserFactory.create()
+
+    def _count_queries(self, project, user):
+        """Count queries of the first and the second request."""
+        counts = []
+
+        for attempt in range(2):
+            request = self.factory.get(reverse(
+                'geokey_webresources:api_all_webresources',
+                kwargs={'project_id': project.id}
+            ))
+            force_authenticate(request, user=user)
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.view(request, project_id=project.id).render()
+                self.assertEqual(response.status_code, 200)
+
+            counts.append(len(queries))
+
+        return counts
+
+    def test_get_with_anonymous(self):
+        """Test GET with with anonymous, when project is public."""
+        project = ProjectFactory.create(isprivate=False)
+        first, second = self._count_queries(project, AnonymousUser())
+
+        self.assertLess(second, first)
+
+    def test_get_with_admin(self):
+        """Test GET with with admin, when project is private."""
+        project = ProjectFactory.create(
+            isprivate=True,
+            add_admins=[self.user]
+        )
+        first, second = self._count_queries(project, self.user)
+
+        self.assertLess(second, first)
+
+
+class DeleteProjectQueryCountTest(QueryCountTestCase):
+    """Test the number of queries made when deleting a project."""
+
+    queries = 30
+
+    def test_delete(self):
+        """Test deleting project."""
+        counts = []
+
+        for size in self.sizes:
+            project = self._seed(size)
+
+            with CaptureQueriesContext(connection) as queries:
+                project.delete()
+
+            counts.append(len(queries))
+
+        self.assertEqual(len(set(counts)), 1, counts)
+        self.assertWithinBudget(counts)
+
+
+class CPUTestCase(TestCase):
+    """
+    Base test case for CPU time saved by helpers.
+
+    Timing depends on the load of the machine, so CPU time is only compared
+    when the `WEBRESOURCES_TIMING` environment variable is set.
+    """
+
+    requests = 20
+    bbox = (1.0, 2.0, 1.5, 3.0)
+
+    @staticmethod
+    def _content(geometry):
+        """Build GeoJSON of 20000 features with geometry of each number."""
+        return json.dumps({
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'geometry': geometry(number),
+                    'properties': {'name': 'Feature %s' % number}
+                }
+                for number in range(20000)
+            ]
+        })
+
+    @staticmethod
+    def _line(number):
+        """Build line geometry of the number."""
+        return {
+            'type': 'LineString',
+            'coordinates': [
+                [number * 0.001, number * 0.002],
+                [number * 0.001 + 0.01, number * 0.002 + 0.01]
+            ]
+        }
+
+    def _parsed(self):
+        """Filter features parsed from JSON on each request."""
+        west, south, east, north = self.bbox
+        features = []
+
+        for feature in json.loads(self.content)['features']:
+            xs = [point[0] for point in feature['geometry']['coordinates']]
+            ys = [point[1] for point in feature['geometry']['coordinates']]
+
+            if (min(xs) <= east and max(xs) >= west and
+                    min(ys) <= north and max(ys) >= south):
+                features.append(feature)
+
+        return features
+
+    def _cpu_time(self, query):
+        """Measure CPU time of running the query on each request."""
+        started = time.clock()
+        for attempt in range(self.requests):
+            query()
+
+        return time.clock() - started
+
+    def assertCheaper(self, cheaper, costlier, description):
+        """Assert that the first query takes less CPU time than the second."""
+        cheaper_time = self._cpu_time(cheaper)
+        costlier_time = self._cpu_time(costlier)
+
+        self.assertLess(
+            cheaper_time,
+            costlier_time,
+            'CPU time of %s requests: %.3fs %s, %.3fs %s.' % (
+                self.requests,
+                cheaper_time,
+                description[0],
+                costlier_time,
+                description[1]
+            )
+        )
+
+
+timing = skipUnless(
+    os.environ.get('WEBRESOURCES_TIMING'),
+    'Set WEBRESOURCES_TIMING to compare CPU time.'
+)
+
+
+class CompressedContentCPUTest(CPUTestCase):
+    """Test CPU time saved by storing cached content compressed."""
+
+    def setUp(self):
+        """Set up test."""
+        self.content = self._content(lambda number: {
+            'type': 'Point',
+            'coordinates': [number * 0.001, number * 0.002]
+        })
+        self.name, self.brotli_name, _ = compress(
+            ContentFile(self.content),
+            'performance'
+        )
+        self.storage = CachedContent._meta.get_field('content').storage
+
+    def tearDown(self):
+        """Tear down test."""
+        for name in (self.name, self.brotli_name):
+            if name:
+                self.storage.delete(name)
+
+    def _stored(self):
+        """Serve content compressed once, when stored."""
+        stored = self.storage.open(self.name, 'rb')
+
+        try:
+            return ''.join(iter(lambda: stored.read(64 * 1024), ''))
+        finally:
+            stored.close()
+
+    def _compressed_per_request(self):
+        """Serve content compressed on each request."""
+        compressed = BytesIO()
+
+        with gzip.GzipFile(mode='wb', fileobj=compressed) as gzip_file:
+            gzip_file.write(self.content)
+
+        return compressed.getvalue()
+
+    def test_size(self):
+        """Test stored content is compressed."""
+        self.assertLess(
+            len(self._stored()),
+            len(self.content) / 5
+        )
+
+    @timing
+    def test_cpu_time(self):
+        """Test serving stored content is cheaper than compressing it."""
+        self.assertCheaper(
+            self._stored,
+            self._compressed_per_request,
+            ('stored', 'compressed per request')
+        )
+
+
+class FeatureStoreCPUTest(CPUTestCase):
+    """Test CPU time saved by filtering features of the feature store."""
+
+    def setUp(self):
+        """Set up test."""
+        self.content = self._content(self._line)
+        self.storage = CachedContent._meta.get_field('features').storage
+        self.name = self.storage.save(
+            'webresources/cache/performance.features',
+            ContentFile(build_features(self.content))
+        )
+
+    def tearDown(self):
+        """Tear down test."""
+        self.storage.delete(self.name)
+
+    def _stored(self):
+        """Filter features of the memory-mapped feature store."""
+        store = open_features(self.name)
+        return ''.join(stream_features(store, store.intersecting(self.bbox)))
+
+    def _parsed_json(self):
+        """Filter features parsed from JSON and serialize them again."""
+        return json.dumps({
+            'type': 'FeatureCollection',
+            'features': self._parsed()
+        })
+
+    def test_features(self):
+        """Test filtering the feature store finds the same features."""
+        self.assertEqual(
+            json.loads(self._stored()),
+            json.loads(self._parsed_json())
+        )
+
+    @timing
+    def test_cpu_time(self):
+        """Test filtering the feature store is cheaper than parsing JSON."""
+        self.assertCheaper(
+            self._stored,
+            self._parsed_json,
+            ('feature store', 'parsed JSON')
+        )
+
+
+class FlatGeobufCPUTest(CPUTestCase):
+    """Test size and CPU time saved by reading features from FlatGeobuf."""
+
+    def setUp(self):
+        """Set up test."""
+        self.content = self._content(self._line)
+        self.flatgeobuf = ''.join(write_flatgeobuf(
+            FeatureStore(build_features(self.content))
+        ))
+
+    def _indexed(self):
+        """Read features found with the index of FlatGeobuf."""
+        reader = FlatGeobufReader(self.flatgeobuf)
+
+        return [
+            reader.feature(offset)
+            for offset in reader.search(self.bbox)
+        ]
+
+    def test_size(self):
+        """Test FlatGeobuf is smaller than GeoJSON."""
+        self.assertLess(
+            len(self.flatgeobuf),
+            len(self.content),
+            'Size: %s bytes FlatGeobuf, %s bytes GeoJSON.' % (
+                len(self.flatgeobuf),
+                len(self.content)
+            )
+        )
+
+    def test_features(self):
+        """Test reading indexed features finds the same features."""
+        def key(feature):
+            return json.dumps(feature, sort_keys=True)
+
+        self.assertEqual(
+            sorted(self._indexed(), key=key),
+            sorted(self._parsed(), key=key)
+        )
+
+    @timing
+    def test_cpu_time(self):
+        """Test reading indexed features is cheaper than parsing JSON."""
+        self.assertCheaper(
+            self._indexed,
+            self._parsed,
+            ('FlatGeobuf index', 'parsed JSON')
+        )
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class FeatureStoreVectorisedCPUTest(CPUTestCase):
+    """Test CPU time saved by vectorised operations on the feature store."""
+
+    requests = 1
+    features = 1000
+    vertices = 100
+    bbox = (-10.0, -10.0, 10.0, 10.0)
+
+    def setUp(self):
+        """Set up test."""
+        random = np.random.RandomState(0)
+
+        self.store = FeatureStore(build_features(json.dumps({
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'geometry': {
+                        'type': 'LineString',
+                        'coordinates': random.uniform(
+                            -180,
+                            180,
+                            (self.vertices, 2)
+                        ).tolist()
+                    }
+                }
+                for number in range(self.features)
+            ]
+        })))
+        self.points = [
+            point
+            for index in range(len(self.store))
+            for point in self.store.geometry(index)['coordinates']
+        ]
+
+    def _looped(self):
+        """Compute bounding box and vertices within it in Python loops."""
+        west, south, east, north = self.bbox
+        xs = [x for x, y in self.points]
+        ys = [y for x, y in self.points]
+        inside = [
+            west <= x <= east and south <= y <= north
+            for x, y in self.points
+        ]
+
+        return (min(xs), min(ys), max(xs), max(ys)), sum(inside)
+
+    def _vectorised(self):
+        """Compute bounding box and vertices within it with NumPy."""
+        return (
+            self.store.extent(),
+            int(self.store.points_in_bbox(self.bbox).sum())
+        )
+
+    def test_results(self):
+        """Test vectorised operations compute the same results."""
+        self.assertEqual(self._vectorised(), self._looped())
+
+    @timing
+    def test_cpu_time(self):
+        """Test vectorised operations are cheaper than Python loops."""
+        self.assertCheaper(
+            self._vectorised,
+            self._looped,
+            ('vectorised', 'looped')
+        )
@@ -5,6 +5,7 @@ from django.test import TestCase
 from geokey.core.tests.helpers import image_helpers
 
 from .model_factories import WebResourceFactory
+from ..helpers.symbol_helpers import store_symbol
 from ..serializers import WebResourceSerializer
 
 
@@ -27,3 +28,36 @@ class WebResourceSerializerTest(TestCase):
         self.assertIn('test_serializer.png', reference)
 
         webresource_2.symbol.delete()
+
+    def test_get_symbol_when_content_addressed(self):
+        """Test getting immutable URL for content-addressed symbol."""
+        name = store_symbol(image_helpers.get_image(), 'test_symbol.png')
+        webresource = WebResourceFactory.create(symbol=name)
+
+        serializer = WebResourceSerializer(webresource)
+        reference = serializer.get_symbol(webresource)
+        self.assertEqual(
+            reference,
+            '/api/webresources/symbols/%s' % name.split('/')[-1]
+        )
+
+        webresource.symbol.delete()
+
+    def test_get_symbol_when_not_content_addressed(self):
+        """Test getting versioned URL for symbol stored before."""
+        webresource = WebResourceFactory.create(
+            symbol=image_helpers.get_image(file_name='test_serializer.png')
+        )
+
+        serializer = WebResourceSerializer(webresource)
+        reference = serializer.get_symbol(webresource)
+        self.assertTrue(reference.startswith(
+            '/api/webresources/symbols/%s?v=' % (
+                webresource.symbol.name.split('/')[-1]
+            )
+        ))
+
+        webresource.save()
+        self.assertNotEqual(serializer.get_symbol(webresource), reference)
+
+        webresource.symbol.delete()
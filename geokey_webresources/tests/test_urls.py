@@ -9,10 +9,21 @@ from ..views import (
     AddWebResourcePage,
     SingleWebResourcePage,
     RemoveWebResourcePage,
+    AllWebResourcesAjax,
+    ImportWebResourcesAjax,
+    ExportWebResourcesAjax,
+    CloneWebResourcesAjax,
     ReorderWebResourcesAjax,
+    MoveWebResourceAjax,
     UpdateWebResourceAjax,
+    UpdateWebResourcesAjax,
     AllWebResourcesAPI,
-    SingleWebResourceAPI
+    SingleWebResourceAPI,
+    WebResourceDataAPI,
+    WebResourceFlatGeobufAPI,
+    SymbolSpriteAPI,
+    SymbolAPI,
+    WebResourceChangesAPI
 )
 
 
@@ -110,6 +121,83 @@ class UrlsTest(TestCase):
     # TEST ADMIN AJAX
     # ###########################
 
+    def test_all_web_resources_ajax_reverse(self):
+        """Test reverser for all web resources Ajax."""
+        reversed_url = reverse(
+            'geokey_webresources:ajax_all_webresources',
+            kwargs={'project_id': 1}
+        )
+        self.assertEqual(reversed_url, '/ajax/projects/1/webresources/')
+
+    def test_all_web_resources_ajax_resolve(self):
+        """Test resolver for all web resources Ajax."""
+        resolved_url = resolve('/ajax/projects/1/webresources/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            AllWebResourcesAjax.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+
+    def test_import_web_resources_ajax_reverse(self):
+        """Test reverser for importing web resources Ajax."""
+        reversed_url = reverse(
+            'geokey_webresources:ajax_webresources_import',
+            kwargs={'project_id': 1}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/ajax/projects/1/webresources/import/'
+        )
+
+    def test_import_web_resources_ajax_resolve(self):
+        """Test resolver for importing web resources Ajax."""
+        resolved_url = resolve('/ajax/projects/1/webresources/import/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            ImportWebResourcesAjax.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+
+    def test_export_web_resources_ajax_reverse(self):
+        """Test reverser for exporting web resources Ajax."""
+        reversed_url = reverse(
+            'geokey_webresources:ajax_webresources_export',
+            kwargs={'project_id': 1}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/ajax/projects/1/webresources/export/'
+        )
+
+    def test_export_web_resources_ajax_resolve(self):
+        """Test resolver for exporting web resources Ajax."""
+        resolved_url = resolve('/ajax/projects/1/webresources/export/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            ExportWebResourcesAjax.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+
+    def test_clone_web_resources_ajax_reverse(self):
+        """Test reverser for cloning web resources Ajax."""
+        reversed_url = reverse(
+            'geokey_webresources:ajax_webresources_clone',
+            kwargs={'project_id': 1}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/ajax/projects/1/webresources/clone/'
+        )
+
+    def test_clone_web_resources_ajax_resolve(self):
+        """Test resolver for cloning web resources Ajax."""
+        resolved_url = resolve('/ajax/projects/1/webresources/clone/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            CloneWebResourcesAjax.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+
     def test_reorder_web_resources_ajax_reverse(self):
         """Test reverser for reordering web resources Ajax."""
         reversed_url = reverse(
@@ -130,6 +218,27 @@ class UrlsTest(TestCase):
         )
         self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
 
+    def test_move_web_resource_ajax_reverse(self):
+        """Test reverser for moving web resource Ajax."""
+        reversed_url = reverse(
+            'geokey_webresources:ajax_webresource_move',
+            kwargs={'project_id': 1, 'webresource_id': 5}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/ajax/projects/1/webresources/5/move/'
+        )
+
+    def test_move_web_resource_ajax_resolve(self):
+        """Test resolver for moving web resource Ajax."""
+        resolved_url = resolve('/ajax/projects/1/webresources/5/move/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            MoveWebResourceAjax.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+        self.assertEqual(int(resolved_url.kwargs['webresource_id']), 5)
+
     def test_update_web_resource_ajax_reverse(self):
         """Test reverser for updating web resource Ajax."""
         reversed_url = reverse(
@@ -151,6 +260,26 @@ class UrlsTest(TestCase):
         self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
         self.assertEqual(int(resolved_url.kwargs['webresource_id']), 5)
 
+    def test_update_web_resources_ajax_reverse(self):
+        """Test reverser for updating multiple web resources Ajax."""
+        reversed_url = reverse(
+            'geokey_webresources:ajax_webresources_update',
+            kwargs={'project_id': 1}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/ajax/projects/1/webresources/bulk/'
+        )
+
+    def test_update_web_resources_ajax_resolve(self):
+        """Test resolver for updating multiple web resources Ajax."""
+        resolved_url = resolve('/ajax/projects/1/webresources/bulk/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            UpdateWebResourcesAjax.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+
     # ###########################
     # TEST PUBLIC API
     # ###########################
@@ -192,3 +321,117 @@ class UrlsTest(TestCase):
         )
         self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
         self.assertEqual(int(resolved_url.kwargs['webresource_id']), 5)
+
+    def test_web_resource_data_api_reverse(self):
+        """Test reverser for data of web resource API."""
+        reversed_url = reverse(
+            'geokey_webresources:api_webresource_data',
+            kwargs={'project_id': 1, 'webresource_id': 5}
+        )
+        self.assertEqual(reversed_url, '/api/projects/1/webresources/5/data/')
+
+    def test_web_resource_data_api_resolve(self):
+        """Test resolver for data of web resource API."""
+        resolved_url = resolve('/api/projects/1/webresources/5/data/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            WebResourceDataAPI.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+        self.assertEqual(int(resolved_url.kwargs['webresource_id']), 5)
+
+    def test_web_resource_flatgeobuf_api_reverse(self):
+        """Test reverser for data of web resource in FlatGeobuf API."""
+        reversed_url = reverse(
+            'geokey_webresources:api_webresource_flatgeobuf',
+            kwargs={'project_id': 1, 'webresource_id': 5}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/api/projects/1/webresources/5/data.fgb'
+        )
+
+    def test_web_resource_flatgeobuf_api_resolve(self):
+        """Test resolver for data of web resource in FlatGeobuf API."""
+        resolved_url = resolve('/api/projects/1/webresources/5/data.fgb')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            WebResourceFlatGeobufAPI.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+        self.assertEqual(int(resolved_url.kwargs['webresource_id']), 5)
+
+    def test_symbol_sprite_api_reverse(self):
+        """Test reverser for sprite of symbols API."""
+        version = 'a' * 40
+        reversed_url = reverse(
+            'geokey_webresources:api_symbol_sprite',
+            kwargs={'project_id': 1, 'version': version, 'extension': 'json'}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/api/projects/1/webresources/sprites/%s.json' % version
+        )
+
+        reversed_url = reverse(
+            'geokey_webresources:api_symbol_sprite',
+            kwargs={
+                'project_id': 1,
+                'version': version,
+                'scale': 2,
+                'extension': 'png'
+            }
+        )
+        self.assertEqual(
+            reversed_url,
+            '/api/projects/1/webresources/sprites/%s@2x.png' % version
+        )
+
+    def test_symbol_sprite_api_resolve(self):
+        """Test resolver for sprite of symbols API."""
+        version = 'a' * 40
+        resolved_url = resolve(
+            '/api/projects/1/webresources/sprites/%s@2x.png' % version
+        )
+        self.assertEqual(
+            resolved_url.func.__name__,
+            SymbolSpriteAPI.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
+        self.assertEqual(resolved_url.kwargs['version'], version)
+        self.assertEqual(int(resolved_url.kwargs['scale']), 2)
+        self.assertEqual(resolved_url.kwargs['extension'], 'png')
+
+    def test_symbol_api_reverse(self):
+        """Test reverser for symbol API."""
+        reversed_url = reverse(
+            'geokey_webresources:api_symbol',
+            kwargs={'name': 'symbol.png'}
+        )
+        self.assertEqual(reversed_url, '/api/webresources/symbols/symbol.png')
+
+    def test_symbol_api_resolve(self):
+        """Test resolver for symbol API."""
+        resolved_url = resolve('/api/webresources/symbols/symbol.png')
+        self.assertEqual(resolved_url.func.__name__, SymbolAPI.__name__)
+        self.assertEqual(resolved_url.kwargs['name'], 'symbol.png')
+
+    def test_web_resource_changes_api_reverse(self):
+        """Test reverser for changes of web resources API."""
+        reversed_url = reverse(
+            'geokey_webresources:api_webresource_changes',
+            kwargs={'project_id': 1}
+        )
+        self.assertEqual(
+            reversed_url,
+            '/api/projects/1/webresources/changes/'
+        )
+
+    def test_web_resource_changes_api_resolve(self):
+        """Test resolver for changes of web resources API."""
+        resolved_url = resolve('/api/projects/1/webresources/changes/')
+        self.assertEqual(
+            resolved_url.func.__name__,
+            WebResourceChangesAPI.__name__
+        )
+        self.assertEqual(int(resolved_url.kwargs['project_id']), 1)
@@ -2,16 +2,26 @@
 
 import os
 import json
+import zlib
 import urllib2
+import zipfile
 
+from StringIO import StringIO
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.http import HttpRequest
 from django.template.loader import render_to_string
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.messages import get_messages
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.sites.shortcuts import get_current_site
+from django.utils import timezone
 
 from rest_framework.test import APIRequestFactory, force_authenticate
 
@@ -23,12 +33,26 @@ from geokey.projects.tests.model_factories import ProjectFactory
 from .url_mocks import (
     ValidURLHTTPHandler,
     NoCORSHTTPHandler,
-    InvalidURLHTTPHandler
+    InvalidURLHTTPHandler,
+    MixedURLHTTPHandler,
+    GeoJSONHTTPHandler
 )
 from .model_factories import WebResourceFactory
 from ..helpers.context_helpers import does_not_exist_msg
-from ..base import STATUS, FORMAT
-from ..models import WebResource
+from ..base import STATUS, FORMAT, ORDER_GAP, CHANGES_GRACE
+from ..helpers.symbol_helpers import store_symbol, refresh_symbol_variants
+from ..helpers.sprite_helpers import refresh_symbol_sprites
+from ..helpers.flatgeobuf_helpers import FlatGeobufReader
+from ..helpers.url_helpers import install_opener
+from ..helpers.cache_helpers import _fetch_key
+from ..models import (
+    WebResource,
+    SymbolVariant,
+    SymbolSprite,
+    CachedContent,
+    ProjectSummary,
+    WebResourceChange
+)
 from ..forms import WebResourceForm
 from ..views import (
     IndexPage,
@@ -36,10 +60,21 @@ from ..views import (
     AddWebResourcePage,
     SingleWebResourcePage,
     RemoveWebResourcePage,
+    AllWebResourcesAjax,
+    ImportWebResourcesAjax,
+    ExportWebResourcesAjax,
+    CloneWebResourcesAjax,
     ReorderWebResourcesAjax,
+    MoveWebResourceAjax,
     UpdateWebResourceAjax,
+    UpdateWebResourcesAjax,
     AllWebResourcesAPI,
-    SingleWebResourceAPI
+    SingleWebResourceAPI,
+    WebResourceDataAPI,
+    WebResourceFlatGeobufAPI,
+    SymbolSpriteAPI,
+    SymbolAPI,
+    WebResourceChangesAPI
 )
 
 
@@ -78,6 +113,17 @@ class IndexPageTest(TestCase):
         wr_to_delete = WebResourceFactory.create(project=self.project_3)
         wr_to_delete.delete()
 
+        # Test transaction is never committed, so refresh summaries waiting
+        # for it
+        callbacks = connection.run_on_commit
+        connection.run_on_commit = []
+        for _, callback in callbacks:
+            callback()
+
+        self.project_1.webresources_count = 0
+        self.project_2.webresources_count = 1
+        self.project_3.webresources_count = 0
+
         setattr(self.request, 'session', 'session')
         messages = FallbackStorage(self.request)
         setattr(self.request, '_messages', messages)
@@ -196,6 +242,24 @@ class IndexPageTest(TestCase):
             rendered
         )
 
+    def test_get_with_user_when_no_summary(self):
+        """
+        Test GET with with user, when project has no summary.
+
+        It should check if web resources exist instead of using the summary.
+        """
+        ProjectSummary.objects.filter(project=self.project_2).delete()
+
+        self.request.user = self.user
+        self.request.GET['filter'] = 'with-web-resources-only'
+        response = self.view(self.request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(response.context_data['projects']),
+            [self.project_2]
+        )
+
 
 class AllWebResourcesPageTest(TestCase):
     """Test all web resources page."""
@@ -303,7 +367,8 @@ class AllWebResourcesPageTest(TestCase):
                 'PLATFORM_NAME': get_current_site(self.request).name,
                 'user': self.request.user,
                 'messages': get_messages(self.request),
-                'project': self.project
+                'project': self.project,
+                'webresources': []
             }
         )
 
@@ -1972,6 +2037,173 @@ class RemoveWebResourcePageTest(TestCase):
 # TESTS FOR ADMIN AJAX
 # ###########################
 
+class AllWebResourcesAjaxTest(TestCase):
+    """Test all web resources via Ajax."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = AllWebResourcesAjax.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource_1 = WebResourceFactory.create(
+            name='Rivers',
+            order=0,
+            project=self.project
+        )
+        self.webresource_2 = WebResourceFactory.create(
+            name='Lakes',
+            order=ORDER_GAP,
+            project=self.project
+        )
+
+        self.url = reverse(
+            'geokey_webresources:ajax_all_webresources',
+            kwargs={
+                'project_id': self.project.id
+            }
+        )
+
+    def _get(self, data, user):
+        """Make test GET method."""
+        request = self.factory.get(self.url, data)
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id
+        ).render()
+
+    def test_get_with_anonymous(self):
+        """
+        Test GET with with anonymous.
+
+        It should return 404 response.
+        """
+        response = self._get({}, AnonymousUser())
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_with_user(self):
+        """
+        Test GET with with user.
+
+        It should return 404 response.
+        """
+        response = self._get({}, self.user)
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_with_contributor(self):
+        """
+        Test GET with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._get({}, self.contributor)
+        self.assertEqual(response.status_code, 403)
+
+    def test_get_with_admin(self):
+        """
+        Test GET with with admin.
+
+        It should return 200 response with rendered web resources.
+        """
+        response = self._get({}, self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertFalse(content['more'])
+        self.assertEqual(
+            content['html'],
+            render_to_string(
+                'snippets/wr_webresource_list.html',
+                {
+                    'project': self.project,
+                    'webresources': [self.webresource_1, self.webresource_2]
+                }
+            )
+        )
+
+    def test_get_with_admin_when_json(self):
+        """
+        Test GET with with admin, when output is JSON.
+
+        It should return 200 response with serialized web resources.
+        """
+        response = self._get({'output': 'json'}, self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertFalse(content['more'])
+        self.assertEqual(
+            [webresource['id'] for webresource in content['webresources']],
+            [self.webresource_1.id, self.webresource_2.id]
+        )
+
+    def test_get_with_admin_when_after(self):
+        """
+        Test GET with with admin, when reading the next page.
+
+        It should return 200 response with web resources that follow.
+        """
+        response = self._get(
+            {'output': 'json', 'after': self.webresource_1.id},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(
+            [webresource['id'] for webresource in content['webresources']],
+            [self.webresource_2.id]
+        )
+
+    def test_get_with_admin_when_searching(self):
+        """
+        Test GET with with admin, when searching.
+
+        It should return 200 response with matching web resources only.
+        """
+        response = self._get(
+            {'output': 'json', 'search': 'lake'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(
+            [webresource['id'] for webresource in content['webresources']],
+            [self.webresource_2.id]
+        )
+
+    def test_get_with_admin_when_wrong_output(self):
+        """
+        Test GET with with admin, when output is not supported.
+
+        It should return 400 response.
+        """
+        response = self._get({'output': 'xml'}, self.admin)
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_with_admin_when_after_does_not_exist(self):
+        """
+        Test GET with with admin, when web resource to follow does not exist.
+
+        It should return 404 response.
+        """
+        response = self._get(
+            {'after': self.webresource_2.id + 123},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 404)
+
+
 class ReorderWebResourcesAjaxTest(TestCase):
     """Test reorder web resources via Ajax."""
 
@@ -2096,6 +2328,79 @@ class ReorderWebResourcesAjaxTest(TestCase):
         self.assertEqual(reference[0], self.webresource_2)
         self.assertEqual(reference[1], self.webresource_1)
 
+    def test_post_with_admin_when_many_webresources(self):
+        """
+        Test POST with with admin, when there are many web resources.
+
+        It should return 200 response. The number of queries must not depend
+        on the number of web resources being reordered.
+        """
+        with CaptureQueriesContext(connection) as few_queries:
+            response = self._post(
+                json.dumps({
+                    'order': [
+                        self.webresource_2.id,
+                        self.webresource_1.id
+                    ]
+                }),
+                self.admin
+            )
+        self.assertEqual(response.status_code, 200)
+
+        WebResourceFactory.create_batch(20, project=self.project)
+        order = [webresource.id for webresource in reversed(
+            self.project.webresources.all()
+        )]
+
+        with CaptureQueriesContext(connection) as many_queries:
+            response = self._post(json.dumps({'order': order}), self.admin)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(many_queries), len(few_queries))
+
+        reference = self.project.webresources.all()
+        self.assertEqual(
+            [webresource.id for webresource in reference],
+            order
+        )
+
+    def test_post_when_order_is_not_list(self):
+        """
+        Test POST with with admin, when order is not a list of IDs.
+
+        It should return 400 response.
+        """
+        for order in ('wrong', '%s%s' % (
+                self.webresource_1.id,
+                self.webresource_2.id)):
+            response = self._post(json.dumps({'order': order}), self.admin)
+            self.assertEqual(response.status_code, 400)
+
+        reference = self.project.webresources.all()
+        self.assertEqual(reference[0].order, 0)
+        self.assertEqual(reference[1].order, 0)
+
+    def test_post_when_webresource_id_is_repeated(self):
+        """
+        Test POST with with admin, when web resource ID is repeated.
+
+        It should return 400 response.
+        """
+        response = self._post(
+            json.dumps({
+                'order': [
+                    self.webresource_2.id,
+                    self.webresource_1.id,
+                    self.webresource_2.id
+                ]
+            }),
+            self.admin
+        )
+        self.assertEqual(response.status_code, 400)
+
+        reference = self.project.webresources.all()
+        self.assertEqual(reference[0].order, 0)
+        self.assertEqual(reference[1].order, 0)
+
     def test_post_when_wrong_webresource_id(self):
         """
         Test POST with with admin, when web resource ID is wrong.
@@ -2181,13 +2486,13 @@ class ReorderWebResourcesAjaxTest(TestCase):
         self.assertEqual(reference[1].order, 0)
 
 
-class UpdateWebResourceAjaxTest(TestCase):
-    """Test update web resource via Ajax."""
+class ImportWebResourcesAjaxTest(TestCase):
+    """Test import web resources via Ajax."""
 
     def setUp(self):
         """Set up test."""
         self.factory = APIRequestFactory()
-        self.view = UpdateWebResourceAjax.as_view()
+        self.view = ImportWebResourcesAjax.as_view()
 
         self.user = UserFactory.create()
         self.contributor = UserFactory.create()
@@ -2197,203 +2502,1835 @@ class UpdateWebResourceAjaxTest(TestCase):
             add_admins=[self.admin],
             add_contributors=[self.contributor]
         )
-        self.webresource = WebResourceFactory.create(
-            status=STATUS.active,
-            project=self.project
-        )
+
+        self.webresources = [
+            {
+                'name': 'Public Houses',
+                'description': 'All public houses in London.',
+                'url': 'http://london.co.uk/public-houses.json',
+                'colour': '#000000'
+            },
+            {
+                'name': 'Train Stations',
+                'url': 'http://germany.de/missing.json',
+            },
+            {
+                'description': 'Without name.',
+                'url': 'http://london.co.uk/without-name.json'
+            },
+            {
+                'name': 'Parks',
+                'url': 'http://london.co.uk/parks.json',
+                'order': 5
+            }
+        ]
 
         self.url = reverse(
-            'geokey_webresources:ajax_webresource_update',
+            'geokey_webresources:ajax_webresources_import',
             kwargs={
-                'project_id': self.project.id,
-                'webresource_id': self.webresource.id
+                'project_id': self.project.id
             }
         )
 
-    def _put(self, data, user):
-        """Make test PUT method."""
-        request = self.factory.put(self.url, data)
+        urllib2.install_opener(urllib2.build_opener(MixedURLHTTPHandler))
+
+    def _post(self, data, user, format='json'):
+        """Make test POST method."""
+        request = self.factory.post(self.url, data, format=format)
         force_authenticate(request, user=user)
 
         return self.view(
             request,
-            project_id=self.project.id,
-            webresource_id=self.webresource.id
+            project_id=self.project.id
         ).render()
 
-    def test_put_with_anonymous(self):
+    def test_post_with_anonymous(self):
         """
-        Test PUT with with anonymous.
+        Test POST with with anonymous.
 
         It should return 404 response.
         """
-        response = self._put(
-            {'status': 'inactive'},
+        response = self._post(
+            {'webresources': self.webresources},
             AnonymousUser()
         )
         self.assertEqual(response.status_code, 404)
-        self.assertEqual(
-            WebResource.objects.get(pk=self.webresource.id).status,
-            self.webresource.status
-        )
+        self.assertEqual(WebResource.objects.count(), 0)
 
-    def test_put_with_user(self):
+    def test_post_with_user(self):
         """
-        Test PUT with with user.
+        Test POST with with user.
 
         It should return 404 response.
         """
-        response = self._put(
-            {'status': 'inactive'},
-            self.user
-        )
+        response = self._post({'webresources': self.webresources}, self.user)
         self.assertEqual(response.status_code, 404)
-        self.assertEqual(
-            WebResource.objects.get(pk=self.webresource.id).status,
-            self.webresource.status
-        )
+        self.assertEqual(WebResource.objects.count(), 0)
 
-    def test_put_with_contributor(self):
+    def test_post_with_contributor(self):
         """
-        Test PUT with with contributor.
+        Test POST with with contributor.
 
         It should return 403 response.
         """
-        response = self._put(
-            {'status': 'inactive'},
+        response = self._post(
+            {'webresources': self.webresources},
             self.contributor
         )
         self.assertEqual(response.status_code, 403)
-        self.assertEqual(
-            WebResource.objects.get(pk=self.webresource.id).status,
-            self.webresource.status
-        )
+        self.assertEqual(WebResource.objects.count(), 0)
 
-    def test_put_with_admin(self):
+    def test_post_with_admin(self):
         """
-        Test PUT with with admin.
+        Test POST with with admin.
 
-        It should return 200 response.
+        It should return 200 response with a report of each row. Only valid
+        web resources should be imported.
         """
-        response = self._put(
-            {'status': 'inactive'},
-            self.admin
-        )
+        WebResourceFactory.create(project=self.project, order=100)
+
+        response = self._post({'webresources': self.webresources}, self.admin)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            WebResource.objects.get(pk=self.webresource.id).status,
-            STATUS.inactive
-        )
 
-    def test_put_when_wrong_status(self):
+        report = json.loads(response.content)
+        self.assertEqual([row['row'] for row in report], [1, 2, 3, 4])
+        self.assertEqual(report[0]['errors'], [])
+        self.assertNotEqual(report[1]['errors'], [])
+        self.assertNotEqual(report[2]['errors'], [])
+        self.assertEqual(report[3]['errors'], [])
+        self.assertIsNone(report[1]['id'])
+        self.assertIsNone(report[2]['id'])
+
+        webresource = WebResource.objects.get(pk=report[0]['id'])
+        self.assertEqual(webresource.name, 'Public Houses')
+        self.assertEqual(webresource.project, self.project)
+        self.assertEqual(webresource.creator, self.admin)
+        self.assertEqual(webresource.dataformat, FORMAT.GeoJSON)
+        self.assertEqual(webresource.colour, '#000000')
+        self.assertEqual(webresource.order, 100 + ORDER_GAP)
+
+        webresource = WebResource.objects.get(pk=report[3]['id'])
+        self.assertEqual(webresource.name, 'Parks')
+        self.assertEqual(webresource.colour, '#0033ff')
+        self.assertEqual(webresource.order, 5)
+
+        self.assertEqual(self.project.webresources.count(), 3)
+
+    def test_post_with_admin_when_csv_manifest(self):
         """
-        Test PUT with with admin, when status is wrong.
+        Test POST with with admin, when CSV manifest file is uploaded.
 
-        It should return 400 response.
+        It should return 200 response with a report of each row.
         """
-        response = self._put(
-            {'status': 'wrong'},
+        manifest = SimpleUploadedFile(
+            'manifest.csv',
+            'name,description,url,colour,order\n'
+            'Public Houses,,http://london.co.uk/public-houses.json,#000000,\n'
+            'Train Stations,,http://germany.de/missing.json,,\n'
+        )
+
+        response = self._post({'manifest': manifest}, self.admin, 'multipart')
+        self.assertEqual(response.status_code, 200)
+
+        report = json.loads(response.content)
+        self.assertEqual(len(report), 2)
+        self.assertIsNotNone(report[0]['id'])
+        self.assertIsNone(report[1]['id'])
+        self.assertEqual(self.project.webresources.count(), 1)
+
+    def test_post_when_wrong_manifest_format(self):
+        """
+        Test POST with with admin, when manifest format is not supported.
+
+        It should return 400 response.
+        """
+        manifest = SimpleUploadedFile('manifest.txt', 'Public Houses')
+
+        response = self._post({'manifest': manifest}, self.admin, 'multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(WebResource.objects.count(), 0)
+
+    def test_post_when_no_webresources(self):
+        """
+        Test POST with with admin, when web resources are not provided.
+
+        It should return 400 response.
+        """
+        response = self._post({}, self.admin)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(WebResource.objects.count(), 0)
+
+    def test_post_when_project_is_locked(self):
+        """
+        Test POST with with admin, when project is locked.
+
+        It should return 403 response.
+        """
+        self.project.islocked = True
+        self.project.save()
+
+        response = self._post({'webresources': self.webresources}, self.admin)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(WebResource.objects.count(), 0)
+
+
+class ExportWebResourcesAjaxTest(TestCase):
+    """Test export web resources via Ajax."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = ExportWebResourcesAjax.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource_1 = WebResourceFactory.create(
+            project=self.project,
+            order=0,
+            symbol=image_helpers.get_image(file_name='test_export.png')
+        )
+        self.webresource_2 = WebResourceFactory.create(
+            project=self.project,
+            order=1,
+            status=STATUS.inactive
+        )
+        WebResourceFactory.create(project=self.project, status=STATUS.deleted)
+        WebResourceFactory.create()
+
+        self.url = reverse(
+            'geokey_webresources:ajax_webresources_export',
+            kwargs={
+                'project_id': self.project.id
+            }
+        )
+
+    def tearDown(self):
+        """Tear down test."""
+        self.webresource_1.symbol.delete()
+
+    def _get(self, output, user):
+        """Make test GET method."""
+        request = self.factory.get(self.url, {'output': output})
+        force_authenticate(request, user=user)
+
+        return self.view(request, project_id=self.project.id)
+
+    def test_get_with_anonymous(self):
+        """
+        Test GET with with anonymous.
+
+        It should return 404 response.
+        """
+        response = self._get('ndjson', AnonymousUser()).render()
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_with_contributor(self):
+        """
+        Test GET with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._get('ndjson', self.contributor).render()
+        self.assertEqual(response.status_code, 403)
+
+    def test_get_with_admin_as_ndjson(self):
+        """
+        Test GET with with admin, when exporting as NDJSON.
+
+        It should stream all web resources of the project, one per line.
+        """
+        response = self._get('ndjson', self.admin)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = ''.join(response.streaming_content).splitlines()
+        exported = [json.loads(line) for line in lines]
+        self.assertEqual(
+            [webresource['name'] for webresource in exported],
+            [self.webresource_1.name, self.webresource_2.name]
+        )
+        self.assertEqual(exported[0]['url'], self.webresource_1.url)
+        self.assertEqual(exported[0]['project'], self.project.id)
+        self.assertEqual(exported[0]['symbol'], self.webresource_1.symbol.name)
+        self.assertEqual(exported[1]['status'], STATUS.inactive)
+        self.assertIsNone(exported[1]['symbol'])
+
+    def test_get_with_admin_as_json(self):
+        """
+        Test GET with with admin, when exporting as JSON.
+
+        It should stream all web resources of the project as an array.
+        """
+        response = self._get('json', self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        exported = json.loads(''.join(response.streaming_content))
+        self.assertEqual(
+            [webresource['name'] for webresource in exported],
+            [self.webresource_1.name, self.webresource_2.name]
+        )
+
+    def test_get_with_admin_as_zip(self):
+        """
+        Test GET with with admin, when exporting as zip archive.
+
+        It should stream all web resources of the project with symbols.
+        """
+        response = self._get('zip', self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        archive = zipfile.ZipFile(
+            StringIO(''.join(response.streaming_content))
+        )
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(
+            sorted(archive.namelist()),
+            sorted(['webresources.ndjson', self.webresource_1.symbol.name])
+        )
+        self.assertEqual(
+            len(archive.read('webresources.ndjson').splitlines()),
+            2
+        )
+
+    def test_get_when_wrong_output(self):
+        """
+        Test GET with with admin, when output is not supported.
+
+        It should return 400 response.
+        """
+        response = self._get('xml', self.admin).render()
+        self.assertEqual(response.status_code, 400)
+
+
+class CloneWebResourcesAjaxTest(TestCase):
+    """Test clone web resources via Ajax."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = CloneWebResourcesAjax.as_view()
+
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.source = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource_1 = WebResourceFactory.create(
+            project=self.source,
+            order=0,
+            symbol=image_helpers.get_image(file_name='test_clone.png')
+        )
+        self.webresource_2 = WebResourceFactory.create(
+            project=self.source,
+            order=1,
+            url_checked=timezone.now()
+        )
+
+        self.url = reverse(
+            'geokey_webresources:ajax_webresources_clone',
+            kwargs={
+                'project_id': self.project.id
+            }
+        )
+
+        urllib2.install_opener(urllib2.build_opener(ValidURLHTTPHandler))
+
+    def tearDown(self):
+        """Tear down test."""
+        self.webresource_1.symbol.delete()
+
+    def _post(self, data, user):
+        """Make test POST method."""
+        request = self.factory.post(
+            self.url,
+            json.dumps(data),
+            content_type='application/json'
+        )
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id
+        ).render()
+
+    def test_post_with_contributor(self):
+        """
+        Test POST with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._post({'source': self.source.id}, self.contributor)
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(self.project.webresources.exists())
+
+    def test_post_with_admin(self):
+        """
+        Test POST with with admin.
+
+        It should return 200 response. All web resources must be cloned and
+        symbols must be reused.
+        """
+        response = self._post({'source': self.source.id}, self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        report = json.loads(response.content)
+        self.assertEqual(
+            [result['source'] for result in report],
+            [self.webresource_1.id, self.webresource_2.id]
+        )
+
+        clones = self.project.webresources.all()
+        self.assertEqual(len(clones), 2)
+        self.assertEqual(clones[0].id, report[0]['id'])
+        self.assertEqual(clones[0].name, self.webresource_1.name)
+        self.assertEqual(clones[0].url, self.webresource_1.url)
+        self.assertEqual(clones[0].creator, self.admin)
+        self.assertEqual(clones[0].symbol.name, self.webresource_1.symbol.name)
+        self.assertIsNotNone(clones[0].url_checked)
+        self.assertEqual(clones[1].name, self.webresource_2.name)
+        self.assertEqual(self.source.webresources.count(), 2)
+
+    def test_post_with_admin_when_ids(self):
+        """
+        Test POST with with admin, when only some web resources are cloned.
+
+        It should return 200 response.
+        """
+        response = self._post(
+            {'source': self.source.id, 'ids': [self.webresource_2.id]},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.project.webresources.get().name,
+            self.webresource_2.name
+        )
+
+    def test_post_with_admin_when_checked_within(self):
+        """
+        Test POST with with admin, when URLs were checked recently.
+
+        It should return 200 response. Recently checked URLs must not be
+        checked again.
+        """
+        urllib2.install_opener(urllib2.build_opener(InvalidURLHTTPHandler))
+
+        response = self._post(
+            {'source': self.source.id, 'checked_within': 3600},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+
+        report = json.loads(response.content)
+        self.assertIsNone(report[0]['id'])
+        self.assertNotEqual(report[0]['errors'], [])
+        self.assertEqual(report[1]['errors'], [])
+        self.assertEqual(
+            self.project.webresources.get().name,
+            self.webresource_2.name
+        )
+
+    def test_post_when_wrong_webresource_id(self):
+        """
+        Test POST with with admin, when web resource ID is wrong.
+
+        It should return 400 response.
+        """
+        response = self._post(
+            {'source': self.source.id, 'ids': [self.webresource_2.id + 123]},
             self.admin
         )
         self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.project.webresources.exists())
+
+    def test_post_when_no_source(self):
+        """
+        Test POST with with admin, when source project does not exist.
+
+        It should return 404 response.
+        """
+        self.source.delete()
+
+        response = self._post({'source': self.source.id}, self.admin)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(self.project.webresources.exists())
+
+    def test_post_when_project_is_locked(self):
+        """
+        Test POST with with admin, when project is locked.
+
+        It should return 403 response.
+        """
+        self.project.islocked = True
+        self.project.save()
+
+        response = self._post({'source': self.source.id}, self.admin)
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(self.project.webresources.exists())
+
+
+class MoveWebResourceAjaxTest(TestCase):
+    """Test move web resource via Ajax."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = MoveWebResourceAjax.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource_1 = WebResourceFactory.create(
+            project=self.project,
+            order=0
+        )
+        self.webresource_2 = WebResourceFactory.create(
+            project=self.project,
+            order=1024
+        )
+        self.webresource_3 = WebResourceFactory.create(
+            project=self.project,
+            order=2048
+        )
+
+        self.url = reverse(
+            'geokey_webresources:ajax_webresource_move',
+            kwargs={
+                'project_id': self.project.id,
+                'webresource_id': self.webresource_3.id
+            }
+        )
+
+    def _post(self, data, user):
+        """Make test POST method."""
+        request = self.factory.post(
+            self.url,
+            data,
+            content_type='application/json'
+        )
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id,
+            webresource_id=self.webresource_3.id
+        ).render()
+
+    def _get_order(self):
+        """Get IDs of web resources in the current order."""
+        return [
+            webresource.id for webresource in self.project.webresources.all()
+        ]
+
+    def test_post_with_anonymous(self):
+        """
+        Test POST with with anonymous.
+
+        It should return 404 response.
+        """
+        response = self._post(
+            json.dumps({'before': self.webresource_1.id}),
+            AnonymousUser()
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_3.id).order,
+            2048
+        )
+
+    def test_post_with_user(self):
+        """
+        Test POST with with user.
+
+        It should return 404 response.
+        """
+        response = self._post(
+            json.dumps({'before': self.webresource_1.id}),
+            self.user
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_3.id).order,
+            2048
+        )
+
+    def test_post_with_contributor(self):
+        """
+        Test POST with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._post(
+            json.dumps({'before': self.webresource_1.id}),
+            self.contributor
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_3.id).order,
+            2048
+        )
+
+    def test_post_with_admin_before(self):
+        """
+        Test POST with with admin, when moving before other web resource.
+
+        It should return 200 response. Only the moved web resource must be
+        updated.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self._post(
+                json.dumps({'before': self.webresource_2.id}),
+                self.admin
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            len([query for query in queries
+                 if query['sql'].startswith('UPDATE')]),
+            1
+        )
+        self.assertEqual(
+            self._get_order(),
+            [
+                self.webresource_1.id,
+                self.webresource_3.id,
+                self.webresource_2.id
+            ]
+        )
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_1.id).order,
+            0
+        )
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_2.id).order,
+            1024
+        )
+
+    def test_post_with_admin_after(self):
+        """
+        Test POST with with admin, when moving after other web resource.
+
+        It should return 200 response.
+        """
+        response = self._post(
+            json.dumps({'after': self.webresource_1.id}),
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._get_order(),
+            [
+                self.webresource_1.id,
+                self.webresource_3.id,
+                self.webresource_2.id
+            ]
+        )
+
+    def test_post_when_no_gap(self):
+        """
+        Test POST with with admin, when there is no gap between neighbours.
+
+        It should return 200 response. All web resources must be rebalanced.
+        """
+        self.webresource_2.order = 1
+        self.webresource_2.save()
+
+        response = self._post(
+            json.dumps({'after': self.webresource_1.id}),
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._get_order(),
+            [
+                self.webresource_1.id,
+                self.webresource_3.id,
+                self.webresource_2.id
+            ]
+        )
+        self.assertEqual(
+            [webresource.order for webresource in
+             self.project.webresources.all()],
+            [0, 1024, 2048]
+        )
+
+    def test_post_when_no_neighbour(self):
+        """
+        Test POST with with admin, when neighbour is not set.
+
+        It should return 400 response.
+        """
+        response = self._post(json.dumps({}), self.admin)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_3.id).order,
+            2048
+        )
+
+    def test_post_when_wrong_neighbour_id(self):
+        """
+        Test POST with with admin, when neighbour ID is wrong.
+
+        It should return 400 response.
+        """
+        response = self._post(
+            json.dumps({'before': self.webresource_1.id + 123}),
+            self.admin
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_3.id).order,
+            2048
+        )
+
+    def test_post_when_no_webresource(self):
+        """
+        Test POST with with admin, when web resource does not exist.
+
+        It should return 404 response.
+        """
+        self.webresource_3.delete()
+
+        response = self._post(
+            json.dumps({'before': self.webresource_1.id}),
+            self.admin
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_post_when_project_is_locked(self):
+        """
+        Test POST with with admin, when project is locked.
+
+        It should return 403 response.
+        """
+        self.project.islocked = True
+        self.project.save()
+
+        response = self._post(
+            json.dumps({'before': self.webresource_1.id}),
+            self.admin
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource_3.id).order,
+            2048
+        )
+
+
+class UpdateWebResourceAjaxTest(TestCase):
+    """Test update web resource via Ajax."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = UpdateWebResourceAjax.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project
+        )
+
+        self.url = reverse(
+            'geokey_webresources:ajax_webresource_update',
+            kwargs={
+                'project_id': self.project.id,
+                'webresource_id': self.webresource.id
+            }
+        )
+
+    def _put(self, data, user):
+        """Make test PUT method."""
+        request = self.factory.put(self.url, data)
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id,
+            webresource_id=self.webresource.id
+        ).render()
+
+    def test_put_with_anonymous(self):
+        """
+        Test PUT with with anonymous.
+
+        It should return 404 response.
+        """
+        response = self._put(
+            {'status': 'inactive'},
+            AnonymousUser()
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource.id).status,
+            self.webresource.status
+        )
+
+    def test_put_with_user(self):
+        """
+        Test PUT with with user.
+
+        It should return 404 response.
+        """
+        response = self._put(
+            {'status': 'inactive'},
+            self.user
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource.id).status,
+            self.webresource.status
+        )
+
+    def test_put_with_contributor(self):
+        """
+        Test PUT with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._put(
+            {'status': 'inactive'},
+            self.contributor
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource.id).status,
+            self.webresource.status
+        )
+
+    def test_put_with_admin(self):
+        """
+        Test PUT with with admin.
+
+        It should return 200 response.
+        """
+        response = self._put(
+            {'status': 'inactive'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource.id).status,
+            STATUS.inactive
+        )
+
+    def test_put_when_wrong_status(self):
+        """
+        Test PUT with with admin, when status is wrong.
+
+        It should return 400 response.
+        """
+        response = self._put(
+            {'status': 'wrong'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource.id).status,
+            self.webresource.status
+        )
+
+    def test_put_when_no_project(self):
+        """
+        Test PUT with with admin, when project does not exist.
+
+        It should return 404 response.
+        """
+        self.project.delete()
+
+        response = self._put(
+            {'status': 'inactive'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_put_when_no_webresource(self):
+        """
+        Test PUT with with admin, when web resource does not exist.
+
+        It should return 404 response.
+        """
+        self.webresource.delete()
+
+        response = self._put(
+            {'status': 'inactive'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_put_when_project_is_locked(self):
+        """
+        Test PUT with with admin, when project is locked.
+
+        It should return 403 response.
+        """
+        self.project.islocked = True
+        self.project.save()
+
+        response = self._put(
+            {'status': 'inactive'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            WebResource.objects.get(pk=self.webresource.id).status,
+            self.webresource.status
+        )
+
+
+class UpdateWebResourcesAjaxTest(TestCase):
+    """Test update multiple web resources via Ajax."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = UpdateWebResourcesAjax.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource_1 = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project
+        )
+        self.webresource_2 = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project
+        )
+        self.ids = [self.webresource_1.id, self.webresource_2.id]
+
+        self.url = reverse(
+            'geokey_webresources:ajax_webresources_update',
+            kwargs={
+                'project_id': self.project.id
+            }
+        )
+
+    def _request(self, method, data, user):
+        """Make test request."""
+        request = getattr(self.factory, method)(
+            self.url,
+            json.dumps(data),
+            content_type='application/json'
+        )
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id
+        ).render()
+
+    def _get_statuses(self):
+        """Get current statuses of web resources."""
+        return [
+            WebResource._base_manager.get(pk=webresource_id).status
+            for webresource_id in self.ids
+        ]
+
+    def test_put_with_anonymous(self):
+        """
+        Test PUT with with anonymous.
+
+        It should return 404 response.
+        """
+        response = self._request(
+            'put',
+            {'ids': self.ids, 'status': 'inactive'},
+            AnonymousUser()
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_put_with_user(self):
+        """
+        Test PUT with with user.
+
+        It should return 404 response.
+        """
+        response = self._request(
+            'put',
+            {'ids': self.ids, 'status': 'inactive'},
+            self.user
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_put_with_contributor(self):
+        """
+        Test PUT with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._request(
+            'put',
+            {'ids': self.ids, 'status': 'inactive'},
+            self.contributor
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_put_with_admin(self):
+        """
+        Test PUT with with admin.
+
+        It should return 200 response with all updated web resources.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self._request(
+                'put',
+                {'ids': self.ids, 'status': 'inactive'},
+                self.admin
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_statuses(), [STATUS.inactive] * 2)
+        self.assertEqual(
+            len([query for query in queries
+                 if query['sql'].startswith('UPDATE')]),
+            1
+        )
+
+        data = json.loads(response.content)
+        self.assertEqual(
+            sorted(webresource['id'] for webresource in data),
+            sorted(self.ids)
+        )
+        for webresource in data:
+            self.assertEqual(webresource['status'], STATUS.inactive)
+
+    def test_put_when_wrong_status(self):
+        """
+        Test PUT with with admin, when status is wrong.
+
+        It should return 400 response.
+        """
+        for wrong_status in ['wrong', STATUS.deleted, None]:
+            response = self._request(
+                'put',
+                {'ids': self.ids, 'status': wrong_status},
+                self.admin
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_put_when_wrong_webresource_id(self):
+        """
+        Test PUT with with admin, when web resource ID is wrong.
+
+        It should return 404 response.
+        """
+        response = self._request(
+            'put',
+            {'ids': self.ids + [self.webresource_2.id + 123],
+             'status': 'inactive'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_put_when_project_is_locked(self):
+        """
+        Test PUT with with admin, when project is locked.
+
+        It should return 403 response.
+        """
+        self.project.islocked = True
+        self.project.save()
+
+        response = self._request(
+            'put',
+            {'ids': self.ids, 'status': 'inactive'},
+            self.admin
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_delete_with_contributor(self):
+        """
+        Test DELETE with with contributor.
+
+        It should return 403 response.
+        """
+        response = self._request('delete', {'ids': self.ids}, self.contributor)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_delete_with_admin(self):
+        """
+        Test DELETE with with admin.
+
+        It should return 200 response with all removed web resources.
+        """
+        response = self._request('delete', {'ids': self.ids}, self.admin)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_statuses(), [STATUS.deleted] * 2)
+        self.assertFalse(self.project.webresources.exists())
+
+    def test_delete_when_ids_are_not_list(self):
+        """
+        Test DELETE with with admin, when IDs are not a list.
+
+        It should return 400 response.
+        """
+        response = self._request('delete', {'ids': 'wrong'}, self.admin)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+    def test_delete_when_project_is_locked(self):
+        """
+        Test DELETE with with admin, when project is locked.
+
+        It should return 403 response.
+        """
+        self.project.islocked = True
+        self.project.save()
+
+        response = self._request('delete', {'ids': self.ids}, self.admin)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._get_statuses(), [STATUS.active] * 2)
+
+
+# ###########################
+# TESTS FOR PUBLIC API
+# ###########################
+
+class AllWebResourcesAPITest(TestCase):
+    """Test all web resources via API."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = AllWebResourcesAPI.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource_1 = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project
+        )
+        self.webresource_2 = WebResourceFactory.create(
+            status=STATUS.inactive,
+            project=self.project
+        )
+
+        self.url = reverse(
+            'geokey_webresources:api_all_webresources',
+            kwargs={
+                'project_id': self.project.id
+            }
+        )
+
+    def _get(self, user):
+        """Make test GET method."""
+        request = self.factory.get(self.url)
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id
+        ).render()
+
+    def test_get_with_user(self):
+        """
+        Test GET with with user.
+
+        Project is private and not everyone can contribute to it by default.
+
+        It should return 404 response.
+        """
+        response = self._get(self.user)
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_with_contributor(self):
+        """
+        Test GET with with contributor.
+
+        Contributors can access active web resources, but only active web
+        resources should be included.
+
+        It should return 200 response.
+        """
+        response = self._get(self.contributor)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(len(content), 1)
+        self.assertEqual(content[0]['id'], self.webresource_1.id)
+
+    def test_get_with_admin(self):
+        """
+        Test GET with with admin.
+
+        Admins can access active web resources, but only active web resources
+        should be included.
+
+        It should return 200 response.
+        """
+        response = self._get(self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(len(content), 1)
+        self.assertEqual(content[0]['id'], self.webresource_1.id)
+
+    def test_get_when_no_webresources(self):
+        """
+        Test GET with contributor and admin.
+
+        Even when there are no web resources, an empty array should be still
+        returned.
+
+        It should return 200 response.
+        """
+        self.webresource_1.delete()
+        self.webresource_2.delete()
+
+        response = self._get(self.contributor)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(len(content), 0)
+
+        response = self._get(self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(len(content), 0)
+
+
+class SingleWebResourceAPITest(TestCase):
+    """Test single web resource via API."""
+
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = SingleWebResourceAPI.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+        self.admin = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_admins=[self.admin],
+            add_contributors=[self.contributor]
+        )
+        self.webresource = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project
+        )
+
+        self.url = reverse(
+            'geokey_webresources:api_single_webresource',
+            kwargs={
+                'project_id': self.project.id,
+                'webresource_id': self.webresource.id
+            }
+        )
+
+    def _get(self, user):
+        """Make test GET method."""
+        request = self.factory.get(self.url)
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=self.project.id,
+            webresource_id=self.webresource.id
+        ).render()
+
+    def test_get_with_user(self):
+        """
+        Test GET with user.
+
+        Project is private and not everyone can contribute to it by default.
+
+        It should return 404 response.
+        """
+        response = self._get(self.user)
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_with_contributor(self):
+        """
+        Test GET with contributor.
+
+        Contributors can access active web resources.
+
+        It should return 200 response.
+        """
+        response = self._get(self.contributor)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(content['id'], self.webresource.id)
+
+    def test_get_with_admin(self):
+        """
+        Test GET with admin.
+
+        Admins can access active web resources.
+
+        It should return 200 response.
+        """
+        response = self._get(self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(content['id'], self.webresource.id)
+
+    def test_get_when_no_webresource(self):
+        """
+        Test GET with contributor and admin.
+
+        It should return 404 response.
+        """
+        self.webresource.delete()
+
+        response = self._get(self.contributor)
+        self.assertEqual(response.status_code, 404)
+
+        response = self._get(self.admin)
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_when_webresource_is_inactive(self):
+        """
+        Test GET with contributor and admin.
+
+        Inactive web resources cannot be accessed.
+
+        It should return 404 response.
+        """
+        self.webresource.status = STATUS.inactive
+        self.webresource.save()
+
+        response = self._get(self.contributor)
+        self.assertEqual(response.status_code, 404)
+
+        response = self._get(self.admin)
+        self.assertEqual(response.status_code, 404)
+
+
+class WebResourceDataAPITest(TestCase):
+    """Test data of a single web resource via API."""
+
+    def setUp(self):
+        """Set up test."""
+        install_opener(urllib2.build_opener(GeoJSONHTTPHandler))
+        GeoJSONHTTPHandler.requests = []
+
+        self.factory = APIRequestFactory()
+        self.view = WebResourceDataAPI.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_contributors=[self.contributor]
+        )
+        self.webresource = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project,
+            url='http://domain.com/data.json'
+        )
+
+    def tearDown(self):
+        """Tear down test."""
+        for cached in CachedContent.objects.all():
+            cached.content.delete(save=False)
+            cached.brotli.delete(save=False)
+            cached.features.delete(save=False)
+            cached.flatgeobuf.delete(save=False)
+
+    def _get(self, user, webresource=None, data=None, **headers):
+        """Make test GET method."""
+        webresource = webresource or self.webresource
+        request = self.factory.get(
+            reverse(
+                'geokey_webresources:api_webresource_data',
+                kwargs={
+                    'project_id': webresource.project_id,
+                    'webresource_id': webresource.id
+                }
+            ),
+            data,
+            **headers
+        )
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=webresource.project_id,
+            webresource_id=webresource.id
+        )
+
+    def test_get_with_user(self):
+        """
+        Test GET with with user.
+
+        Project is private and not everyone can contribute to it by default.
+
+        It should return 404 response.
+        """
+        response = self._get(self.user).render()
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(GeoJSONHTTPHandler.requests, [])
+
+    def test_get_with_contributor(self):
+        """
+        Test GET with with contributor.
+
+        Data of the same URL in another project should be fetched from the
+        remote server only once.
+
+        It should return 200 response with the data.
+        """
+        project = ProjectFactory.create(add_contributors=[self.contributor])
+        copy = WebResourceFactory.create(
+            status=STATUS.active,
+            project=project,
+            url='http://domain.com/data.json#copy'
+        )
+
+        for webresource in (self.webresource, copy):
+            response = self._get(self.contributor, webresource)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            self.assertEqual(
+                ''.join(response.streaming_content),
+                GeoJSONHTTPHandler.content
+            )
+
+        self.assertEqual(len(GeoJSONHTTPHandler.requests), 1)
+        self.assertEqual(CachedContent.objects.count(), 1)
+
+    def test_get_when_not_modified(self):
+        """
+        Test GET with contributor, with ETag of the data.
+
+        It should return 304 response.
+        """
+        etag = self._get(self.contributor)['ETag']
+
+        response = self._get(self.contributor, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_with_gzip(self):
+        """
+        Test GET with contributor, when client accepts gzip.
+
+        It should return 200 response with the stored gzip data as it is.
+        """
+        response = self._get(
+            self.contributor,
+            HTTP_ACCEPT_ENCODING='gzip, deflate'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertTrue(response['ETag'].endswith('-gzip"'))
+        self.assertEqual(
+            zlib.decompress(
+                ''.join(response.streaming_content),
+                16 + zlib.MAX_WBITS
+            ),
+            GeoJSONHTTPHandler.content
+        )
+
+    def test_get_with_brotli(self):
+        """
+        Test GET with contributor, when client accepts brotli.
+
+        It should return 200 response with brotli data when it is stored,
+        and gzip data otherwise.
+        """
+        response = self._get(
+            self.contributor,
+            HTTP_ACCEPT_ENCODING='gzip, br'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        if CachedContent.objects.get().brotli:
+            self.assertEqual(response['Content-Encoding'], 'br')
+        else:
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_get_when_not_modified_with_other_encoding(self):
+        """
+        Test GET with contributor, with ETag of the data in other encoding.
+
+        It should return 200 response.
+        """
+        etag = self._get(
+            self.contributor,
+            HTTP_ACCEPT_ENCODING='gzip'
+        )['ETag']
+
+        response = self._get(self.contributor, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_get_with_bbox(self):
+        """
+        Test GET with contributor, with bounding box.
+
+        It should return 200 response with features intersecting it.
+        """
+        features = [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [x, x]},
+                'properties': {'x': x}
+            }
+            for x in range(10)
+        ]
+        content = GeoJSONHTTPHandler.content
+        GeoJSONHTTPHandler.content = json.dumps({
+            'type': 'FeatureCollection',
+            'features': features
+        })
+
+        try:
+            response = self._get(self.contributor, data={'bbox': '2,2,4.5,9'})
+        finally:
+            GeoJSONHTTPHandler.content = content
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(''.join(response.streaming_content)),
+            {'type': 'FeatureCollection', 'features': features[2:5]}
+        )
+
+        response = self._get(
+            self.contributor,
+            data={'bbox': '2,2,4.5,9'},
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_with_invalid_bbox(self):
+        """
+        Test GET with contributor, with invalid bounding box.
+
+        It should return 400 response.
+        """
+        for bbox in ('1,2,3', '1,2,3,north'):
+            response = self._get(
+                self.contributor,
+                data={'bbox': bbox}
+            ).render()
+            self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(GeoJSONHTTPHandler.requests, [])
+
+    def test_get_with_bbox_when_data_is_not_kml(self):
+        """
+        Test GET with contributor, with bounding box, when KML is not valid.
+
+        It should return 400 response.
+        """
+        self.webresource.dataformat = FORMAT.KML
+        self.webresource.save()
+
+        response = self._get(
+            self.contributor,
+            data={'bbox': '0,0,1,1'}
+        ).render()
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_when_url_is_missing(self):
+        """
+        Test GET with contributor, when data cannot be fetched.
+
+        It should return 502 response.
+        """
+        self.webresource.url = 'http://domain.com/missing.json'
+        self.webresource.save()
+
+        response = self._get(self.contributor).render()
+        self.assertEqual(response.status_code, 502)
+
+    def test_get_when_data_is_being_fetched(self):
+        """
+        Test GET with contributor, when data is being fetched by another
+        request.
+
+        It should return 503 response.
+        """
+        key = _fetch_key('http://domain.com/data.json')
+        cache.set(key, True)
+
+        try:
+            response = self._get(self.contributor).render()
+        finally:
+            cache.delete(key)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(GeoJSONHTTPHandler.requests, [])
+
+    def test_get_when_webresource_is_inactive(self):
+        """
+        Test GET with contributor, when web resource is inactive.
+
+        It should return 404 response.
+        """
+        self.webresource.status = STATUS.inactive
+        self.webresource.save()
+
+        response = self._get(self.contributor).render()
+        self.assertEqual(response.status_code, 404)
+
+
+class WebResourceFlatGeobufAPITest(TestCase):
+    """Test data of a single web resource in FlatGeobuf via API."""
+
+    def setUp(self):
+        """Set up test."""
+        install_opener(urllib2.build_opener(GeoJSONHTTPHandler))
+        GeoJSONHTTPHandler.requests = []
+
+        self.factory = APIRequestFactory()
+        self.view = WebResourceFlatGeobufAPI.as_view()
+
+        self.user = UserFactory.create()
+        self.contributor = UserFactory.create()
+
+        self.project = ProjectFactory.create(
+            add_contributors=[self.contributor]
+        )
+        self.webresource = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project,
+            url='http://domain.com/data.json'
+        )
+
+    def tearDown(self):
+        """Tear down test."""
+        for cached in CachedContent.objects.all():
+            cached.content.delete(save=False)
+            cached.brotli.delete(save=False)
+            cached.features.delete(save=False)
+            cached.flatgeobuf.delete(save=False)
+
+    def _get(self, user, webresource=None, **headers):
+        """Make test GET method."""
+        webresource = webresource or self.webresource
+        request = self.factory.get(
+            reverse(
+                'geokey_webresources:api_webresource_flatgeobuf',
+                kwargs={
+                    'project_id': webresource.project_id,
+                    'webresource_id': webresource.id
+                }
+            ),
+            **headers
+        )
+        force_authenticate(request, user=user)
+
+        return self.view(
+            request,
+            project_id=webresource.project_id,
+            webresource_id=webresource.id
+        )
+
+    def test_get_with_user(self):
+        """
+        Test GET with with user.
+
+        Project is private and not everyone can contribute to it by default.
+
+        It should return 404 response.
+        """
+        response = self._get(self.user).render()
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(GeoJSONHTTPHandler.requests, [])
+
+    def test_get_with_contributor(self):
+        """
+        Test GET with contributor.
+
+        It should return 200 response with features of the data.
+        """
+        response = self._get(self.contributor)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/flatgeobuf')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+        reader = FlatGeobufReader(''.join(response.streaming_content))
         self.assertEqual(
-            WebResource.objects.get(pk=self.webresource.id).status,
-            self.webresource.status
+            reader.count,
+            len(json.loads(GeoJSONHTTPHandler.content)['features'])
         )
 
-    def test_put_when_no_project(self):
+        response = self._get(
+            self.contributor,
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_with_range(self):
         """
-        Test PUT with with admin, when project does not exist.
+        Test GET with contributor, with a byte range.
 
-        It should return 404 response.
+        It should return 206 response with the range of the data.
         """
-        self.project.delete()
+        data = ''.join(self._get(self.contributor).streaming_content)
 
-        response = self._put(
-            {'status': 'inactive'},
-            self.admin
+        response = self._get(self.contributor, HTTP_RANGE='bytes=8-15')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            response['Content-Range'],
+            'bytes 8-15/%s' % len(data)
         )
-        self.assertEqual(response.status_code, 404)
+        self.assertEqual(''.join(response.streaming_content), data[8:16])
 
-    def test_put_when_no_webresource(self):
+        response = self._get(
+            self.contributor,
+            HTTP_RANGE='bytes=%s-' % len(data)
+        )
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */%s' % len(data))
+
+        response = self._get(self.contributor, HTTP_RANGE='bytes=15-8')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(''.join(response.streaming_content), data)
+
+    def test_get_with_if_range(self):
         """
-        Test PUT with with admin, when web resource does not exist.
+        Test GET with contributor, with a byte range of some version.
 
-        It should return 404 response.
+        It should return 206 response with the range of the data when the
+        data has not changed, 200 response with the data otherwise.
         """
-        self.webresource.delete()
+        response = self._get(self.contributor)
+        data = ''.join(response.streaming_content)
 
-        response = self._put(
-            {'status': 'inactive'},
-            self.admin
+        response = self._get(
+            self.contributor,
+            HTTP_RANGE='bytes=8-15',
+            HTTP_IF_RANGE=response['ETag']
         )
-        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(''.join(response.streaming_content), data[8:16])
 
-    def test_put_when_project_is_locked(self):
+        response = self._get(
+            self.contributor,
+            HTTP_RANGE='bytes=8-15',
+            HTTP_IF_RANGE='"changed-fgb"'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(''.join(response.streaming_content), data)
+
+    def test_get_when_data_is_not_kml(self):
         """
-        Test PUT with with admin, when project is locked.
+        Test GET with contributor, when KML is not valid.
 
-        It should return 403 response.
+        It should return 400 response.
         """
-        self.project.islocked = True
-        self.project.save()
+        self.webresource.dataformat = FORMAT.KML
+        self.webresource.save()
 
-        response = self._put(
-            {'status': 'inactive'},
-            self.admin
-        )
-        self.assertEqual(response.status_code, 403)
-        self.assertEqual(
-            WebResource.objects.get(pk=self.webresource.id).status,
-            self.webresource.status
-        )
+        response = self._get(self.contributor).render()
+        self.assertEqual(response.status_code, 400)
 
+    def test_get_when_url_is_missing(self):
+        """
+        Test GET with contributor, when data cannot be fetched.
 
-# ###########################
-# TESTS FOR PUBLIC API
-# ###########################
+        It should return 502 response.
+        """
+        self.webresource.url = 'http://domain.com/missing.json'
+        self.webresource.save()
 
-class AllWebResourcesAPITest(TestCase):
-    """Test all web resources via API."""
+        response = self._get(self.contributor).render()
+        self.assertEqual(response.status_code, 502)
+
+
+class SymbolSpriteAPITest(TestCase):
+    """Test sprite of symbols via API."""
 
     def setUp(self):
         """Set up test."""
         self.factory = APIRequestFactory()
-        self.view = AllWebResourcesAPI.as_view()
+        self.view = SymbolSpriteAPI.as_view()
 
         self.user = UserFactory.create()
         self.contributor = UserFactory.create()
-        self.admin = UserFactory.create()
 
         self.project = ProjectFactory.create(
-            add_admins=[self.admin],
             add_contributors=[self.contributor]
         )
-        self.webresource_1 = WebResourceFactory.create(
+        self.webresource = WebResourceFactory.create(
             status=STATUS.active,
-            project=self.project
-        )
-        self.webresource_2 = WebResourceFactory.create(
-            status=STATUS.inactive,
-            project=self.project
+            project=self.project,
+            symbol=image_helpers.get_image(file_name='test_symbol.png')
         )
+        refresh_symbol_variants(self.webresource)
+        refresh_symbol_sprites(self.project.id)
 
-        self.url = reverse(
-            'geokey_webresources:api_all_webresources',
-            kwargs={
-                'project_id': self.project.id
-            }
-        )
+        self.version = SymbolSprite.objects.version(self.project.id)
 
-    def _get(self, user):
+    def tearDown(self):
+        """Tear down test."""
+        for sprite in SymbolSprite.objects.all():
+            sprite.image.delete(save=False)
+
+        for variant in SymbolVariant.objects.all():
+            variant.image.delete(save=False)
+
+        for webresource in WebResource._base_manager.all():
+            if webresource.symbol:
+                webresource.symbol.delete()
+
+    def _get(self, user, version, extension, scale=None):
         """Make test GET method."""
-        request = self.factory.get(self.url)
+        kwargs = {
+            'project_id': self.project.id,
+            'version': version,
+            'extension': extension
+        }
+        if scale is not None:
+            kwargs['scale'] = scale
+
+        request = self.factory.get(reverse(
+            'geokey_webresources:api_symbol_sprite',
+            kwargs=kwargs
+        ))
         force_authenticate(request, user=user)
 
-        return self.view(
-            request,
-            project_id=self.project.id
-        ).render()
+        return self.view(request, **kwargs)
 
     def test_get_with_user(self):
         """
@@ -2403,172 +4340,332 @@ class AllWebResourcesAPITest(TestCase):
 
         It should return 404 response.
         """
-        response = self._get(self.user)
+        response = self._get(self.user, self.version, 'json')
         self.assertEqual(response.status_code, 404)
 
     def test_get_with_contributor(self):
         """
         Test GET with with contributor.
 
-        Contributors can access active web resources, but only active web
-        resources should be included.
-
-        It should return 200 response.
+        It should return 200 response with the index and the image of the
+        sprite, which can be cached forever.
         """
-        response = self._get(self.contributor)
+        response = self._get(self.contributor, self.version, 'json')
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn(
+            str(self.webresource.id),
+            json.loads(response.content)
+        )
 
-        content = json.loads(response.content)
-        self.assertEqual(len(content), 1)
-        self.assertEqual(content[0]['id'], self.webresource_1.id)
+        response = self._get(self.contributor, self.version, 'png', 2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(
+            ''.join(response.streaming_content),
+            SymbolSprite.objects.get(
+                project=self.project,
+                scale=2
+            ).image.read()
+        )
 
-    def test_get_with_admin(self):
+    def test_get_when_version_is_old(self):
         """
-        Test GET with with admin.
+        Test GET with contributor, when version of sprites is old.
 
-        Admins can access active web resources, but only active web resources
-        should be included.
+        It should return 404 response.
+        """
+        response = self._get(self.contributor, 'a' * 40, 'json')
+        self.assertEqual(response.status_code, 404)
 
-        It should return 200 response.
+    def test_get_when_all_webresources_api_links_sprite(self):
         """
-        response = self._get(self.admin)
+        Test GET of all web resources with contributor.
+
+        It should return 200 response with the versioned URL of sprites.
+        """
+        request = self.factory.get(reverse(
+            'geokey_webresources:api_all_webresources',
+            kwargs={'project_id': self.project.id}
+        ))
+        force_authenticate(request, user=self.contributor)
+
+        response = AllWebResourcesAPI.as_view()(
+            request,
+            project_id=self.project.id
+        ).render()
         self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            '/webresources/sprites/%s>; rel="sprite"' % self.version,
+            response['Link']
+        )
 
-        content = json.loads(response.content)
-        self.assertEqual(len(content), 1)
-        self.assertEqual(content[0]['id'], self.webresource_1.id)
 
-    def test_get_when_no_webresources(self):
-        """
-        Test GET with contributor and admin.
+class SymbolAPITest(TestCase):
+    """Test symbol via API."""
 
-        Even when there are no web resources, an empty array should be still
-        returned.
+    def setUp(self):
+        """Set up test."""
+        self.factory = APIRequestFactory()
+        self.view = SymbolAPI.as_view()
+        self.user = UserFactory.create()
 
-        It should return 200 response.
+        self.name = store_symbol(
+            image_helpers.get_image(),
+            'test_symbol.png'
+        )
+        self.webresource = WebResourceFactory.create(symbol=self.name)
+
+    def tearDown(self):
+        """Tear down test."""
+        for webresource in WebResource._base_manager.all():
+            if webresource.symbol:
+                webresource.symbol.delete()
+
+    def _get(self, name, **headers):
+        """Make test GET method."""
+        name = name.split('/')[-1]
+        request = self.factory.get(
+            reverse('geokey_webresources:api_symbol', kwargs={'name': name}),
+            **headers
+        )
+        force_authenticate(request, user=self.user)
+
+        return self.view(request, name=name)
+
+    def test_get(self):
         """
-        self.webresource_1.delete()
-        self.webresource_2.delete()
+        Test GET.
 
-        response = self._get(self.contributor)
+        It should return 200 response with the symbol, which can be cached
+        forever.
+        """
+        response = self._get(self.name)
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(
+            response['ETag'],
+            '"%s"' % self.name.split('/')[-1].split('.')[0]
+        )
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('public', response['Cache-Control'])
+        self.assertEqual(
+            ''.join(response.streaming_content),
+            self.webresource.symbol.read()
+        )
 
-        content = json.loads(response.content)
-        self.assertEqual(len(content), 0)
+    def test_get_when_not_modified(self):
+        """
+        Test GET with ETag of the symbol.
 
-        response = self._get(self.admin)
+        It should return 304 response without the symbol.
+        """
+        etag = self._get(self.name)['ETag']
+
+        response = self._get(self.name, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, '')
+
+    def test_get_when_not_content_addressed(self):
+        """
+        Test GET, when symbol is not stored under content-addressed name.
+
+        It should return 200 response with ETag from the content.
+        """
+        webresource = WebResourceFactory.create(
+            symbol=image_helpers.get_image(file_name='test_symbol.png')
+        )
+
+        response = self._get(webresource.symbol.name)
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response['ETag'],
+            '"%s"' % self.name.split('/')[-1].split('.')[0]
+        )
 
-        content = json.loads(response.content)
-        self.assertEqual(len(content), 0)
+    def test_get_when_symbol_is_not_used(self):
+        """
+        Test GET, when no web resource uses the symbol.
 
+        It should return 404 response.
+        """
+        self.webresource.symbol = None
+        self.webresource.save()
+
+        response = self._get(self.name).render()
+        self.assertEqual(response.status_code, 404)
+
+        WebResource._meta.get_field('symbol').storage.delete(self.name)
 
-class SingleWebResourceAPITest(TestCase):
-    """Test single web resource via API."""
+
+class WebResourceChangesAPITest(TestCase):
+    """Test changes of web resources via API."""
 
     def setUp(self):
         """Set up test."""
         self.factory = APIRequestFactory()
-        self.view = SingleWebResourceAPI.as_view()
+        self.view = WebResourceChangesAPI.as_view()
 
         self.user = UserFactory.create()
         self.contributor = UserFactory.create()
-        self.admin = UserFactory.create()
 
         self.project = ProjectFactory.create(
-            add_admins=[self.admin],
             add_contributors=[self.contributor]
         )
-        self.webresource = WebResourceFactory.create(
+        self.webresource_1 = WebResourceFactory.create(
+            status=STATUS.active,
+            project=self.project
+        )
+        self.webresource_2 = WebResourceFactory.create(
             status=STATUS.active,
             project=self.project
         )
+        self._settle()
+        self.cursor = WebResourceChange.objects.cursor(self.project.id)
 
         self.url = reverse(
-            'geokey_webresources:api_single_webresource',
+            'geokey_webresources:api_webresource_changes',
             kwargs={
-                'project_id': self.project.id,
-                'webresource_id': self.webresource.id
+                'project_id': self.project.id
             }
         )
 
-    def _get(self, user):
+    def _settle(self):
+        """Make all changes older than the grace period."""
+        WebResourceChange.objects.update(
+            changed=timezone.now() - timedelta(seconds=CHANGES_GRACE)
+        )
+
+    def _get(self, data, user):
         """Make test GET method."""
-        request = self.factory.get(self.url)
+        request = self.factory.get(self.url, data)
         force_authenticate(request, user=user)
 
         return self.view(
             request,
-            project_id=self.project.id,
-            webresource_id=self.webresource.id
+            project_id=self.project.id
         ).render()
 
     def test_get_with_user(self):
         """
-        Test GET with user.
+        Test GET with with user.
 
         Project is private and not everyone can contribute to it by default.
 
         It should return 404 response.
         """
-        response = self._get(self.user)
+        response = self._get({'since': self.cursor}, self.user)
         self.assertEqual(response.status_code, 404)
 
     def test_get_with_contributor(self):
         """
-        Test GET with contributor.
-
-        Contributors can access active web resources.
+        Test GET with with contributor.
 
-        It should return 200 response.
+        It should return 200 response with changes since the cursor.
+        Web resources that are not active anymore are reported as deleted.
         """
-        response = self._get(self.contributor)
+        self.webresource_2.status = STATUS.inactive
+        self.webresource_2.save()
+        self.webresource_1.name = 'Rivers'
+        self.webresource_1.save()
+        self._settle()
+
+        response = self._get({'since': self.cursor}, self.contributor)
         self.assertEqual(response.status_code, 200)
 
         content = json.loads(response.content)
-        self.assertEqual(content['id'], self.webresource.id)
+        self.assertFalse(content['more'])
+        self.assertEqual(
+            content['cursor'],
+            WebResourceChange.objects.cursor(self.project.id)
+        )
+        changes = content['changes']
+        self.assertEqual(
+            [(change['id'], change['action']) for change in changes],
+            [
+                (self.webresource_2.id, 'deleted'),
+                (self.webresource_1.id, 'updated')
+            ]
+        )
+        self.assertIsNone(changes[0]['webresource'])
+        self.assertEqual(changes[1]['webresource']['name'], 'Rivers')
 
-    def test_get_with_admin(self):
+    def test_get_with_contributor_when_deleted_permanently(self):
         """
-        Test GET with admin.
-
-        Admins can access active web resources.
+        Test GET with with contributor, when web resource no longer exists.
 
-        It should return 200 response.
+        It should return 200 response with the web resource deleted.
         """
-        response = self._get(self.admin)
+        webresource_id = self.webresource_1.id
+        self.webresource_1.delete()
+        WebResource._base_manager.filter(pk=webresource_id).delete()
+        self._settle()
+
+        response = self._get({'since': self.cursor}, self.contributor)
         self.assertEqual(response.status_code, 200)
 
         content = json.loads(response.content)
-        self.assertEqual(content['id'], self.webresource.id)
+        self.assertEqual(content['changes'], [{
+            'cursor': content['cursor'],
+            'action': 'deleted',
+            'id': webresource_id,
+            'order': None,
+            'webresource': None
+        }])
 
-    def test_get_when_no_webresource(self):
+    def test_get_with_contributor_when_not_settled(self):
         """
-        Test GET with contributor and admin.
+        Test GET with with contributor, when changes are recent.
 
-        It should return 404 response.
+        It should return 200 response without changes, until they settle.
         """
-        self.webresource.delete()
+        self.webresource_1.save()
 
-        response = self._get(self.contributor)
-        self.assertEqual(response.status_code, 404)
+        response = self._get({'since': self.cursor}, self.contributor)
+        self.assertEqual(response.status_code, 200)
 
-        response = self._get(self.admin)
-        self.assertEqual(response.status_code, 404)
+        content = json.loads(response.content)
+        self.assertEqual(content['cursor'], self.cursor)
+        self.assertEqual(content['changes'], [])
 
-    def test_get_when_webresource_is_inactive(self):
+    def test_get_with_contributor_when_no_cursor(self):
         """
-        Test GET with contributor and admin.
+        Test GET with with contributor, when cursor is not set.
 
-        Inactive web resources cannot be accessed.
+        It should return 200 response with the latest cursor only.
+        """
+        response = self._get({}, self.contributor)
+        self.assertEqual(response.status_code, 200)
 
-        It should return 404 response.
+        content = json.loads(response.content)
+        self.assertEqual(content['cursor'], self.cursor)
+        self.assertEqual(content['changes'], [])
+
+    def test_get_with_contributor_when_waiting(self):
         """
-        self.webresource.status = STATUS.inactive
-        self.webresource.save()
+        Test GET with with contributor, when there are no changes.
 
-        response = self._get(self.contributor)
-        self.assertEqual(response.status_code, 404)
+        It should return 200 response without changes, after the timeout.
+        """
+        response = self._get(
+            {'since': self.cursor, 'timeout': 0.1},
+            self.contributor
+        )
+        self.assertEqual(response.status_code, 200)
 
-        response = self._get(self.admin)
-        self.assertEqual(response.status_code, 404)
+        content = json.loads(response.content)
+        self.assertEqual(content['cursor'], self.cursor)
+        self.assertEqual(content['changes'], [])
+
+    def test_get_with_contributor_when_wrong_cursor(self):
+        """
+        Test GET with with contributor, when cursor is not a number.
+
+        It should return 400 response.
+        """
+        response = self._get({'since': 'latest'}, self.contributor)
+        self.assertEqual(response.status_code, 400)
@@ -41,3 +41,49 @@ class InvalidURLHTTPHandler(urllib2.HTTPHandler):
     def http_open(self, request):
         """Mock response."""
         return mock_responses(request, 404, 'NOT FOUND', '*')
+
+
+class MixedURLHTTPHandler(urllib2.HTTPHandler):
+    """Custom HTTP handler for valid URLs, except the missing ones."""
+
+    def http_open(self, request):
+        """Mock response."""
+        if 'missing' in request.get_full_url():
+            return mock_responses(request, 404, 'NOT FOUND', '*')
+
+        return mock_responses(request, 200, 'OK', '*')
+
+
+class GeoJSONHTTPHandler(urllib2.HTTPHandler):
+    """Custom HTTP handler for GeoJSON data, which counts requests."""
+
+    content = '{"type": "FeatureCollection", "features": []}'
+    etag = '"geojson"'
+    requests = []
+
+    def http_open(self, request):
+        """Mock response."""
+        GeoJSONHTTPHandler.requests.append(request.get_full_url())
+
+        if 'missing' in request.get_full_url():
+            return mock_responses(request, 404, 'NOT FOUND', '*')
+
+        if request.get_header('If-none-match') == self.etag:
+            content = ''
+            code, msg = 304, 'NOT MODIFIED'
+        else:
+            content = self.content
+            code, msg = 200, 'OK'
+
+        response = urllib2.addinfourl(
+            StringIO(content),
+            {
+                'Access-Control-Allow-Origin': '*',
+                'Content-Type': 'application/json',
+                'ETag': self.etag
+            },
+            request.get_full_url()
+        )
+        response.code = code
+        response.msg = msg
+        return response
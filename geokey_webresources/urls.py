@@ -8,10 +8,21 @@ from .views import (
     AddWebResourcePage,
     SingleWebResourcePage,
     RemoveWebResourcePage,
+    AllWebResourcesAjax,
+    ImportWebResourcesAjax,
+    ExportWebResourcesAjax,
+    CloneWebResourcesAjax,
     ReorderWebResourcesAjax,
+    MoveWebResourceAjax,
     UpdateWebResourceAjax,
+    UpdateWebResourcesAjax,
     AllWebResourcesAPI,
-    SingleWebResourceAPI
+    SingleWebResourceAPI,
+    WebResourceDataAPI,
+    WebResourceFlatGeobufAPI,
+    SymbolSpriteAPI,
+    SymbolAPI,
+    WebResourceChangesAPI
 )
 
 
@@ -49,16 +60,46 @@ urlpatterns = [
     # ADMIN AJAX
     # ###########################
 
+    url(
+        r'^ajax/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/$',
+        AllWebResourcesAjax.as_view(),
+        name='ajax_all_webresources'),
+    url(
+        r'^ajax/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/import/$',
+        ImportWebResourcesAjax.as_view(),
+        name='ajax_webresources_import'),
+    url(
+        r'^ajax/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/export/$',
+        ExportWebResourcesAjax.as_view(),
+        name='ajax_webresources_export'),
+    url(
+        r'^ajax/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/clone/$',
+        CloneWebResourcesAjax.as_view(),
+        name='ajax_webresources_clone'),
     url(
         r'^ajax/projects/(?P<project_id>[0-9]+)/'
         r'webresources/reorder/$',
         ReorderWebResourcesAjax.as_view(),
         name='ajax_webresources_reorder'),
+    url(
+        r'^ajax/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/(?P<webresource_id>[0-9]+)/move/$',
+        MoveWebResourceAjax.as_view(),
+        name='ajax_webresource_move'),
     url(
         r'^ajax/projects/(?P<project_id>[0-9]+)/'
         r'webresources/(?P<webresource_id>[0-9]+)/$',
         UpdateWebResourceAjax.as_view(),
         name='ajax_webresource_update'),
+    url(
+        r'^ajax/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/bulk/$',
+        UpdateWebResourcesAjax.as_view(),
+        name='ajax_webresources_update'),
 
     # ###########################
     # PUBLIC API
@@ -73,5 +114,30 @@ urlpatterns = [
         r'^api/projects/(?P<project_id>[0-9]+)/'
         r'webresources/(?P<webresource_id>[0-9]+)/$',
         SingleWebResourceAPI.as_view(),
-        name='api_single_webresource')
+        name='api_single_webresource'),
+    url(
+        r'^api/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/(?P<webresource_id>[0-9]+)/data/$',
+        WebResourceDataAPI.as_view(),
+        name='api_webresource_data'),
+    url(
+        r'^api/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/(?P<webresource_id>[0-9]+)/data\.fgb$',
+        WebResourceFlatGeobufAPI.as_view(),
+        name='api_webresource_flatgeobuf'),
+    url(
+        r'^api/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/sprites/(?P<version>[0-9a-f]{40})'
+        r'(?:@(?P<scale>[0-9])x)?\.(?P<extension>png|json)$',
+        SymbolSpriteAPI.as_view(),
+        name='api_symbol_sprite'),
+    url(
+        r'^api/webresources/symbols/(?P<name>[^/]+)$',
+        SymbolAPI.as_view(),
+        name='api_symbol'),
+    url(
+        r'^api/projects/(?P<project_id>[0-9]+)/'
+        r'webresources/changes/$',
+        WebResourceChangesAPI.as_view(),
+        name='api_webresource_changes')
 ]
@@ -3,16 +3,42 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import time
+import hashlib
+import mimetypes
+
+from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.views.generic import CreateView, FormView, TemplateView
 from django.shortcuts import redirect
-from django.db.models import BooleanField, Q, Case, When
+from django.template.loader import render_to_string
+from django.http import StreamingHttpResponse, HttpResponse, FileResponse
+from django.db.models import (
+    BooleanField,
+    IntegerField,
+    Case,
+    When,
+    Value,
+    F,
+    Exists,
+    OuterRef,
+    prefetch_related_objects
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.cache import (
+    patch_cache_control,
+    patch_vary_headers,
+    get_conditional_response
+)
+from django.utils.http import quote_etag
 from django.utils.safestring import mark_safe
 from django.contrib import messages
 
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.renderers import BrowsableAPIRenderer
 
 from braces.views import LoginRequiredMixin
 
@@ -21,12 +47,44 @@ from geokey.projects.models import Project
 from geokey.projects.views import ProjectContext
 
 from .helpers.context_helpers import does_not_exist_msg
+from .helpers.access_helpers import check_read_access
+from .helpers.symbol_helpers import symbol_checksum
+from .helpers.cache_helpers import (
+    get_cached_content,
+    accepted_encodings,
+    byte_range,
+    read_range,
+    decompress
+)
+from .helpers.feature_helpers import get_features, stream_features
+from .helpers.flatgeobuf_helpers import get_flatgeobuf
 from .helpers.url_helpers import check_url
-from .base import STATUS
-from .exceptions import URLError
-from .models import WebResource
+from .helpers.import_helpers import read_manifest, import_webresources
+from .helpers.clone_helpers import clone_webresources
+from .helpers.export_helpers import (
+    export_webresources,
+    stream_ndjson,
+    stream_json,
+    stream_archive
+)
+from .base import (
+    STATUS,
+    FORMAT,
+    CHANGES_TIMEOUT,
+    IMMUTABLE_MAX_AGE,
+    CACHE_FETCH_TIMEOUT,
+    FLATGEOBUF_VERSION
+)
+from .exceptions import URLError, FetchInProgressError
+from .models import (
+    WebResource,
+    SymbolSprite,
+    ProjectSummary,
+    WebResourceChange
+)
 from .forms import WebResourceForm
 from .serializers import WebResourceSerializer
+from .renderers import RawJSON, SnapshotJSONRenderer
 
 
 # ###########################
@@ -47,22 +105,34 @@ class IndexPage(LoginRequiredMixin, TemplateView):
         the context. It optionally filters projects by the filter provided on
         the URL.
 
+        Web resources are counted from summaries of projects. Projects without
+        a summary fall back to checking if any web resource exists.
+
         Returns
         -------
         dict
             Context.
         """
         projects = Project.objects.filter(admins=self.request.user).annotate(
+            webresources_count=Coalesce(
+                F('webresources_summary__active') +
+                F('webresources_summary__inactive'),
+                Value(0),
+                output_field=IntegerField()
+            )
+        ).annotate(
             with_webresources=Case(
                 When(
-                    ~Q(webresources__status='deleted') &
-                    Q(webresources__isnull=False),
-                    then=True
+                    webresources_summary__isnull=True,
+                    then=Exists(WebResource.objects.filter(
+                        project=OuterRef('pk')
+                    ))
                 ),
-                default=False,
+                When(webresources_count__gt=0, then=Value(True)),
+                default=Value(False),
                 output_field=BooleanField()
             )
-        ).distinct()
+        )
 
         filters = {}
         filter_for_projects = self.request.GET.get('filter')
@@ -90,6 +160,39 @@ class AllWebResourcesPage(LoginRequiredMixin, ProjectContext, TemplateView):
 
     template_name = 'wr_all_webresources.html'
 
+    def get_context_data(self, project_id, *args, **kwargs):
+        """
+        GET method for the template.
+
+        Return the context to render the view. Overwrite the method by adding
+        the first page of web resources of the project to the context. Web
+        resources are searched, when the `search` query parameter is set.
+
+        Parameters
+        ----------
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        dict
+            Context.
+        """
+        context = super(AllWebResourcesPage, self).get_context_data(
+            project_id,
+            *args,
+            **kwargs
+        )
+
+        project = context.get('project')
+        if project:
+            context['search'] = self.request.GET.get('search', '').strip()
+            context['webresources'], context['more'] = (
+                project.webresources.page(query=context['search'])
+            )
+
+        return context
+
 
 class AddWebResourcePage(LoginRequiredMixin, ProjectContext, CreateView):
     """Add new web resource page."""
@@ -146,6 +249,7 @@ class AddWebResourcePage(LoginRequiredMixin, ProjectContext, CreateView):
 
                 try:
                     form.instance.dataformat = check_url(form.instance.url)
+                    form.instance.url_checked = timezone.now()
 
                     add_another_url = reverse(
                         'geokey_webresources:webresource_add',
@@ -317,6 +421,7 @@ class SingleWebResourcePage(WebResourceContext, FormView):
             else:
                 try:
                     form.instance.dataformat = check_url(form.instance.url)
+                    form.instance.url_checked = timezone.now()
 
                     if self.request.POST.get('symbol_clear') == 'true':
                         form.instance.symbol = None
@@ -424,6 +529,75 @@ class RemoveWebResourcePage(WebResourceContext, TemplateView):
 # ADMIN AJAX
 # ###########################
 
+class AllWebResourcesAjax(APIView):
+    """All web resources via Ajax."""
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id):
+        """
+        GET method for a single page of web resources.
+
+        The page follows the web resource set in the `after` query parameter
+        and is searched, when the `search` query parameter is set. Web
+        resources are rendered as HTML (default) or serialized as JSON,
+        depending on the `output` query parameter.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project = Project.objects.as_admin(request.user, project_id)
+        output = request.GET.get('output', 'html')
+
+        if output not in ['html', 'json']:
+            return Response(
+                {'error': 'Output must be html or json.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        after = request.GET.get('after')
+
+        try:
+            if after is not None:
+                after = project.webresources.get(pk=int(after))
+        except ValueError:
+            return Response(
+                {'error': 'After must be a web resource ID.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except WebResource.DoesNotExist, error:
+            return Response(
+                {'error': str(error)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        webresources, more = project.webresources.page(
+            query=request.GET.get('search', '').strip(),
+            after=after
+        )
+
+        if output == 'html':
+            return Response({
+                'html': render_to_string(
+                    'snippets/wr_webresource_list.html',
+                    {'project': project, 'webresources': webresources}
+                ),
+                'more': more
+            })
+
+        prefetch_related_objects(webresources, 'symbol_variants')
+        serializer = WebResourceSerializer(webresources, many=True)
+        return Response({'webresources': serializer.data, 'more': more})
+
+
 class ReorderWebResourcesAjax(APIView):
     """Reorder web resources via Ajax."""
 
@@ -458,21 +632,18 @@ class ReorderWebResourcesAjax(APIView):
             )
 
         try:
-            webresources = []
-
-            for order, webresource_id in enumerate(request.data.get('order')):
-                webresource = project.webresources.get(pk=webresource_id)
-                webresource.order = order
-                webresources.append(webresource)
-
-            for webresource in webresources:
-                webresource.save()
+            project.webresources.reorder(request.data.get('order'))
 
             serializer = WebResourceSerializer(
                 project.webresources,
                 many=True
             )
             return Response(serializer.data)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'Order must be a list of web resource IDs.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except WebResource.DoesNotExist:
             return Response(
                 {'error': 'One or more web resources were not found.'},
@@ -480,13 +651,16 @@ class ReorderWebResourcesAjax(APIView):
             )
 
 
-class UpdateWebResourceAjax(APIView):
-    """Update web resource via Ajax."""
+class ImportWebResourcesAjax(APIView):
+    """Import web resources via Ajax."""
 
     @handle_exceptions_for_ajax
-    def put(self, request, project_id, webresource_id):
+    def post(self, request, project_id):
         """
-        PUT method for updating web resource.
+        POST method for importing web resources.
+
+        Web resources are either provided as a list in the request data, or
+        as a JSON or CSV manifest file.
 
         Parameters
         ----------
@@ -494,8 +668,6 @@ class UpdateWebResourceAjax(APIView):
             Object representing the request.
         project_id : int
             Identifies the project in the database.
-        webresource_id : int
-            Identifies the web resource in the database.
 
         Returns
         -------
@@ -511,40 +683,41 @@ class UpdateWebResourceAjax(APIView):
             )
 
         try:
-            webresource = project.webresources.get(pk=webresource_id)
-            serializer = WebResourceSerializer(
-                webresource,
-                data=request.data,
-                partial=True,
-                fields=('id', 'status')
-            )
+            manifest = request.FILES.get('manifest')
 
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data)
+            if manifest:
+                manifest_format = request.data.get('format')
+                if manifest_format is None:
+                    manifest_format = manifest.name.rsplit('.', 1)[-1].lower()
+
+                rows = read_manifest(manifest, manifest_format)
             else:
-                return Response(
-                    serializer.errors,
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        except WebResource.DoesNotExist, error:
+                rows = request.data.get('webresources')
+
+                if not isinstance(rows, list):
+                    raise ValueError(
+                        'Web resources must be a list or a manifest file.'
+                    )
+        except ValueError, error:
             return Response(
                 {'error': str(error)},
-                status=status.HTTP_404_NOT_FOUND
+                status=status.HTTP_400_BAD_REQUEST
             )
 
+        report = import_webresources(project, request.user, rows)
+        return Response(report)
 
-# ###########################
-# PUBLIC API
-# ###########################
 
-class AllWebResourcesAPI(APIView):
-    """All web resources via API."""
+class ExportWebResourcesAjax(APIView):
+    """Export web resources via Ajax."""
 
     @handle_exceptions_for_ajax
     def get(self, request, project_id):
         """
-        GET method for all web resources of a project.
+        GET method for exporting web resources.
+
+        Web resources are streamed as NDJSON (default), JSON or a zip archive
+        including symbols, depending on the `output` query parameter.
 
         Parameters
         ----------
@@ -555,27 +728,105 @@ class AllWebResourcesAPI(APIView):
 
         Returns
         -------
+        django.http.StreamingHttpResponse
+            Streamed web resources.
         rest_framework.response.Response
-            Response to the request.
+            Response to the request, if web resources cannot be exported.
         """
-        project = Project.objects.get_single(request.user, project_id)
-        serializer = WebResourceSerializer(
-            project.webresources.filter(status=STATUS.active),
-            many=True
+        project = Project.objects.as_admin(request.user, project_id)
+        output = request.GET.get('output', 'ndjson')
+
+        if output == 'ndjson':
+            content = stream_ndjson(export_webresources(project.webresources))
+            content_type = 'application/x-ndjson'
+        elif output == 'json':
+            content = stream_json(export_webresources(project.webresources))
+            content_type = 'application/json'
+        elif output == 'zip':
+            content = stream_archive(project.webresources)
+            content_type = 'application/zip'
+        else:
+            return Response(
+                {'error': 'Output must be ndjson, json or zip.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = (
+            'attachment; filename="webresources-%s.%s"' % (project.id, output)
         )
-        return Response(serializer.data)
+        return response
 
 
-class SingleWebResourceAPI(APIView):
-    """Single web resource via API."""
+class CloneWebResourcesAjax(APIView):
+    """Clone web resources from other project via Ajax."""
 
     @handle_exceptions_for_ajax
-    def get(self, request, project_id, webresource_id):
+    def post(self, request, project_id):
         """
-        GET method for a single web resource of a project.
+        POST method for cloning web resources.
 
-        Only active web resources are returned to anyone who has access to the
-        project.
+        Web resources of the `source` project are cloned to this project,
+        optionally only those with `ids`. URLs checked within `checked_within`
+        seconds are not checked again.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project = Project.objects.as_admin(request.user, project_id)
+
+        if project.islocked:
+            return Response(
+                {'error': 'Project is locked.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        source = Project.objects.as_admin(
+            request.user,
+            request.data.get('source')
+        )
+
+        try:
+            checked_within = request.data.get('checked_within')
+            if checked_within is not None:
+                checked_within = int(checked_within)
+
+            report = clone_webresources(
+                source,
+                project,
+                request.user,
+                ids=request.data.get('ids'),
+                checked_within=checked_within
+            )
+            return Response(report)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'IDs or number of seconds are malformed.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except WebResource.DoesNotExist:
+            return Response(
+                {'error': 'One or more web resources were not found.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class MoveWebResourceAjax(APIView):
+    """Move web resource via Ajax."""
+
+    @handle_exceptions_for_ajax
+    def post(self, request, project_id, webresource_id):
+        """
+        POST method for moving web resource next to another one.
 
         Parameters
         ----------
@@ -591,17 +842,838 @@ class SingleWebResourceAPI(APIView):
         rest_framework.response.Response
             Response to the request.
         """
-        project = Project.objects.get_single(request.user, project_id)
+        project = Project.objects.as_admin(request.user, project_id)
+
+        if project.islocked:
+            return Response(
+                {'error': 'Project is locked.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
 
         try:
-            webresource = project.webresources.get(
-                pk=webresource_id,
-                status=STATUS.active
+            webresource = project.webresources.get(pk=webresource_id)
+        except WebResource.DoesNotExist, error:
+            return Response(
+                {'error': str(error)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            project.webresources.move(
+                webresource,
+                before=request.data.get('before'),
+                after=request.data.get('after')
             )
+
             serializer = WebResourceSerializer(webresource)
             return Response(serializer.data)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'Either before or after must be a web resource ID.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except WebResource.DoesNotExist:
             return Response(
-                {'error': 'Web resource not found.'},
+                {'error': 'Neighbour web resource was not found.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class UpdateWebResourceAjax(APIView):
+    """Update web resource via Ajax."""
+
+    @handle_exceptions_for_ajax
+    def put(self, request, project_id, webresource_id):
+        """
+        PUT method for updating web resource.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+        webresource_id : int
+            Identifies the web resource in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project = Project.objects.as_admin(request.user, project_id)
+
+        if project.islocked:
+            return Response(
+                {'error': 'Project is locked.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            webresource = project.webresources.get(pk=webresource_id)
+            serializer = WebResourceSerializer(
+                webresource,
+                data=request.data,
+                partial=True,
+                fields=('id', 'status')
+            )
+
+            if serializer.is_valid():
+                serializer.save()
+                return Response(serializer.data)
+            else:
+                return Response(
+                    serializer.errors,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        except WebResource.DoesNotExist, error:
+            return Response(
+                {'error': str(error)},
                 status=status.HTTP_404_NOT_FOUND
             )
+
+
+class UpdateWebResourcesAjax(APIView):
+    """Update multiple web resources via Ajax."""
+
+    def _update_status(self, request, project_id, new_status):
+        """
+        Update status of web resources provided in the request.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+        new_status : str
+            New status of web resources.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project = Project.objects.as_admin(request.user, project_id)
+
+        if project.islocked:
+            return Response(
+                {'error': 'Project is locked.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            webresources = project.webresources.update_status(
+                request.data.get('ids'),
+                new_status
+            )
+
+            prefetch_related_objects(webresources, 'symbol_variants')
+            serializer = WebResourceSerializer(webresources, many=True)
+            return Response(serializer.data)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'IDs must be a list of web resource IDs.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except WebResource.DoesNotExist:
+            return Response(
+                {'error': 'One or more web resources were not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+    @handle_exceptions_for_ajax
+    def put(self, request, project_id):
+        """
+        PUT method for updating status of web resources.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        new_status = request.data.get('status')
+
+        if new_status not in [STATUS.active, STATUS.inactive]:
+            return Response(
+                {'error': 'Status must be active or inactive.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return self._update_status(request, project_id, new_status)
+
+    @handle_exceptions_for_ajax
+    def delete(self, request, project_id):
+        """
+        DELETE method for removing web resources.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        return self._update_status(request, project_id, STATUS.deleted)
+
+
+# ###########################
+# PUBLIC API
+# ###########################
+
+class AllWebResourcesAPI(APIView):
+    """All web resources via API."""
+
+    renderer_classes = (SnapshotJSONRenderer, BrowsableAPIRenderer)
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id):
+        """
+        GET method for all web resources of a project.
+
+        The stored snapshot of active web resources of the project is
+        returned as it is, unless it is not available yet. When the project
+        has a sprite of symbols, its versioned URL is added as a `Link`
+        header.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project_id = check_read_access(request.user, project_id)
+        snapshot = ProjectSummary.objects.filter(
+            project=project_id
+        ).values_list('snapshot', flat=True).first()
+
+        if snapshot:
+            response = Response(RawJSON(snapshot))
+        else:
+            serializer = WebResourceSerializer(
+                WebResource.objects.filter(
+                    project=project_id,
+                    status=STATUS.active
+                ).prefetch_related('symbol_variants'),
+                many=True
+            )
+            response = Response(serializer.data)
+
+        version = SymbolSprite.objects.version(project_id)
+        if version is not None:
+            index_url = reverse(
+                'geokey_webresources:api_symbol_sprite',
+                kwargs={
+                    'project_id': project_id,
+                    'version': version,
+                    'extension': 'json'
+                }
+            )
+            response['Link'] = '<%s>; rel="sprite"' % (
+                request.build_absolute_uri(index_url[:-len('.json')])
+            )
+
+        return response
+
+
+class SingleWebResourceAPI(APIView):
+    """Single web resource via API."""
+
+    renderer_classes = (SnapshotJSONRenderer, BrowsableAPIRenderer)
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id, webresource_id):
+        """
+        GET method for a single web resource of a project.
+
+        Only active web resources are returned to anyone who has access to the
+        project. The stored snapshot of the web resource is returned as it
+        is, unless it is not available yet.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+        webresource_id : int
+            Identifies the web resource in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project_id = check_read_access(request.user, project_id)
+
+        try:
+            webresource = WebResource.objects.get(
+                pk=webresource_id,
+                project=project_id,
+                status=STATUS.active
+            )
+
+            if webresource.snapshot:
+                return Response(RawJSON(webresource.snapshot))
+
+            serializer = WebResourceSerializer(webresource)
+            return Response(serializer.data)
+        except WebResource.DoesNotExist:
+            return Response(
+                {'error': 'Web resource not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+
+class WebResourceDataMixin(object):
+    """Get cached data of a web resource mixin."""
+
+    def get_cached_data(self, project_id, webresource_id):
+        """
+        Get the web resource and its cached data.
+
+        Data is fetched from the remote server when not cached yet (or out
+        of date).
+
+        Parameters
+        ----------
+        project_id : int
+            Identifies the project in the database.
+        webresource_id : int
+            Identifies the web resource in the database.
+
+        Returns
+        -------
+        tuple
+            Web resource, its cached content and `None`, or `None` twice and
+            the error response, if data is not available.
+        """
+        try:
+            webresource = WebResource.objects.select_related(
+                'cached_content'
+            ).get(
+                pk=webresource_id,
+                project=project_id,
+                status=STATUS.active
+            )
+        except WebResource.DoesNotExist:
+            return None, None, Response(
+                {'error': 'Web resource not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            cached = get_cached_content(webresource)
+        except FetchInProgressError, error:
+            response = Response(
+                {'error': error.message, 'errors': error.errors},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = CACHE_FETCH_TIMEOUT
+            return None, None, response
+        except URLError, error:
+            return None, None, Response(
+                {'error': error.message, 'errors': error.errors},
+                status=status.HTTP_502_BAD_GATEWAY
+            )
+
+        return webresource, cached, None
+
+
+class WebResourceDataAPI(WebResourceDataMixin, APIView):
+    """Data of a single web resource via API."""
+
+    content_types = {
+        FORMAT.GeoJSON: 'application/json',
+        FORMAT.KML: 'application/vnd.google-earth.kml+xml'
+    }
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id, webresource_id):
+        """
+        GET method for data of a single web resource of a project.
+
+        Data is served from the cache shared by all web resources with the
+        same URL, and fetched from the remote server only when not cached
+        yet (or out of date). Data is stored compressed and served as it is
+        to clients accepting brotli or gzip, and decompressed on the fly for
+        other clients. ETag is the checksum of the data, suffixed with the
+        content encoding.
+
+        Data can be filtered by a bounding box (`bbox` query parameter:
+        west, south, east and north), which returns GeoJSON features
+        intersecting it. Data is converted to a memory-mapped feature store
+        once, so that it is not parsed again for each request.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+        webresource_id : int
+            Identifies the web resource in the database.
+
+        Returns
+        -------
+        django.http.HttpResponse
+            Data of the web resource, or 304 response when it has not
+            changed.
+        rest_framework.response.Response
+            Response to the request, if data is not available.
+        """
+        project_id = check_read_access(request.user, project_id)
+        bbox = request.GET.get('bbox')
+
+        if bbox is not None:
+            try:
+                bbox = tuple(float(value) for value in bbox.split(','))
+
+                if len(bbox) != 4:
+                    raise ValueError
+            except ValueError:
+                return Response(
+                    {'error': 'Bounding box must be west, south, east and '
+                              'north, separated by commas.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        webresource, cached, response = self.get_cached_data(
+            project_id,
+            webresource_id
+        )
+
+        if response is not None:
+            return response
+
+        if bbox is not None:
+            return self._filtered(
+                request,
+                cached,
+                webresource.dataformat,
+                bbox
+            )
+
+        accepted = accepted_encodings(
+            request.META.get('HTTP_ACCEPT_ENCODING', '')
+        )
+        name = cached.content.name
+        encoding = cached.encoding
+
+        if cached.brotli and 'br' in accepted:
+            name = cached.brotli.name
+            encoding = 'br'
+        elif encoding and encoding not in accepted:
+            encoding = ''
+
+        etag = quote_etag(
+            '%s-%s' % (cached.checksum, encoding) if encoding
+            else cached.checksum
+        )
+        response = get_conditional_response(request, etag=etag)
+
+        if response is None:
+            content = cached.content.storage.open(name, 'rb')
+            content_type = self.content_types.get(
+                webresource.dataformat,
+                cached.content_type or 'application/octet-stream'
+            )
+
+            if encoding == cached.encoding or encoding == 'br':
+                response = FileResponse(content, content_type=content_type)
+            else:
+                response = StreamingHttpResponse(
+                    decompress(content),
+                    content_type=content_type
+                )
+
+            if encoding:
+                response['Content-Encoding'] = encoding
+
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def _filtered(self, request, cached, dataformat, bbox):
+        """Return features of cached data intersecting a bounding box."""
+        etag = quote_etag('%s-%s' % (
+            cached.checksum,
+            hashlib.sha1(
+                ','.join(repr(value) for value in bbox)
+            ).hexdigest()[:12]
+        ))
+        response = get_conditional_response(request, etag=etag)
+
+        if response is None:
+            try:
+                features = get_features(cached, dataformat)
+            except ValueError, error:
+                return Response(
+                    {'error': 'Data cannot be filtered: %s' % error},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            response = StreamingHttpResponse(
+                stream_features(features, features.intersecting(bbox)),
+                content_type=self.content_types[FORMAT.GeoJSON]
+            )
+
+        response['ETag'] = etag
+        return response
+
+
+class WebResourceFlatGeobufAPI(WebResourceDataMixin, APIView):
+    """Data of a single web resource in the FlatGeobuf format via API."""
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id, webresource_id):
+        """
+        GET method for data of a single web resource in FlatGeobuf.
+
+        Data is converted from the cache once, with features sorted along
+        the Hilbert curve and a spatial index, so that clients can read the
+        header, the index and only features within a bounding box with
+        requests for a single byte range (`Range` header). A range is only
+        served when the data has not changed since (`If-Range` header).
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+        webresource_id : int
+            Identifies the web resource in the database.
+
+        Returns
+        -------
+        django.http.HttpResponse
+            Data (or a range of it) of the web resource, or 304 response
+            when it has not changed.
+        rest_framework.response.Response
+            Response to the request, if data is not available.
+        """
+        project_id = check_read_access(request.user, project_id)
+
+        webresource, cached, response = self.get_cached_data(
+            project_id,
+            webresource_id
+        )
+
+        if response is not None:
+            return response
+
+        etag = quote_etag('%s-fgb%s' % (cached.checksum, FLATGEOBUF_VERSION))
+        response = get_conditional_response(request, etag=etag)
+
+        if response is None:
+            try:
+                name = get_flatgeobuf(cached, webresource.dataformat)
+            except ValueError, error:
+                return Response(
+                    {'error': 'Data cannot be converted: %s' % error},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            storage = cached.flatgeobuf.storage
+            size = storage.size(name)
+
+            # Ranges of another version of the data must not be mixed, so
+            # the whole data is served when it has changed since
+            if request.META.get('HTTP_IF_RANGE', etag) != etag:
+                ranges = ''
+            else:
+                ranges = request.META.get('HTTP_RANGE', '')
+
+            try:
+                requested = byte_range(ranges, size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = 'bytes */%s' % size
+                return response
+
+            content = storage.open(name, 'rb')
+
+            if requested is None:
+                response = FileResponse(
+                    content,
+                    content_type='application/flatgeobuf'
+                )
+            else:
+                first, last = requested
+                response = StreamingHttpResponse(
+                    read_range(content, first, last),
+                    status=206,
+                    content_type='application/flatgeobuf'
+                )
+                response['Content-Range'] = 'bytes %s-%s/%s' % (
+                    first,
+                    last,
+                    size
+                )
+                response['Content-Length'] = last - first + 1
+
+            response['Accept-Ranges'] = 'bytes'
+
+        response['ETag'] = etag
+        return response
+
+
+class SymbolSpriteAPI(APIView):
+    """Sprite of symbols via API."""
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id, version, extension, scale=None):
+        """
+        GET method for a sprite of symbols of a project.
+
+        Sprite image (`png`) or its index (`json`) is returned for the given
+        scale (1x by default). Only the current version is available, so the
+        response can be cached by clients forever.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+        version : str
+            Version of sprites of the project.
+        extension : str
+            Extension of the requested file: `png` or `json`.
+        scale : str
+            Scale of the sprite.
+
+        Returns
+        -------
+        django.http.HttpResponse
+            Sprite image or its index.
+        rest_framework.response.Response
+            Response to the request, if the sprite is not found.
+        """
+        project_id = check_read_access(request.user, project_id)
+
+        sprite = None
+        if version == SymbolSprite.objects.version(project_id):
+            sprite = SymbolSprite.objects.filter(
+                project=project_id,
+                scale=int(scale or 1)
+            ).first()
+
+        if sprite is None:
+            return Response(
+                {'error': 'Sprite not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if extension == 'json':
+            response = HttpResponse(
+                sprite.index,
+                content_type='application/json'
+            )
+        else:
+            response = FileResponse(
+                sprite.image.storage.open(sprite.image.name, 'rb'),
+                content_type='image/png'
+            )
+
+        if request.user.is_anonymous():
+            patch_cache_control(response, public=True)
+        else:
+            patch_cache_control(response, private=True)
+
+        patch_cache_control(
+            response,
+            max_age=IMMUTABLE_MAX_AGE,
+            immutable=True
+        )
+        return response
+
+
+class SymbolAPI(APIView):
+    """Symbol of web resources via API."""
+
+    def get(self, request, name):
+        """
+        GET method for a symbol.
+
+        Symbols are served under immutable URLs, so the response can be
+        cached by clients forever. ETag is the checksum of the symbol, and
+        conditional requests are answered with 304 response.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        name : str
+            Name of the symbol file.
+
+        Returns
+        -------
+        django.http.HttpResponse
+            Symbol, or 304 response when it has not changed.
+        rest_framework.response.Response
+            Response to the request, if the symbol is not found.
+        """
+        field = WebResource._meta.get_field('symbol')
+        name = '%s/%s' % (field.upload_to, name)
+
+        try:
+            if not WebResource._base_manager.filter(symbol=name).exists():
+                raise IOError('Symbol is not used.')
+
+            checksum = symbol_checksum(name)
+            if checksum is None:
+                content = field.storage.open(name, 'rb')
+                try:
+                    checksum = hashlib.sha1(content.read()).hexdigest()
+                finally:
+                    content.close()
+
+            etag = quote_etag(checksum)
+            response = get_conditional_response(request, etag=etag)
+
+            if response is None:
+                response = FileResponse(
+                    field.storage.open(name, 'rb'),
+                    content_type=(
+                        mimetypes.guess_type(name)[0] or
+                        'application/octet-stream'
+                    )
+                )
+        except IOError:
+            return Response(
+                {'error': 'Symbol not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        response['ETag'] = etag
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=IMMUTABLE_MAX_AGE,
+            immutable=True
+        )
+        return response
+
+
+class WebResourceChangesAPI(APIView):
+    """Changes of web resources via API."""
+
+    def _serialize(self, change):
+        """
+        Serialize a single change of web resource.
+
+        Web resources that are not active anymore (or deleted permanently)
+        are reported as deleted, because they are not available via API.
+
+        Parameters
+        ----------
+        change : geokey_webresources.models.WebResourceChange
+            Change of web resource.
+
+        Returns
+        -------
+        dict
+            Serialized change.
+        """
+        webresource = change.webresource
+
+        if webresource is None or webresource.status != STATUS.active:
+            return {
+                'cursor': change.id,
+                'action': WebResourceChange.ACTION.deleted,
+                'id': change.webresource_key,
+                'order': None,
+                'webresource': None
+            }
+
+        return {
+            'cursor': change.id,
+            'action': change.action,
+            'id': webresource.id,
+            'order': webresource.order,
+            'webresource': WebResourceSerializer(webresource).data
+        }
+
+    @handle_exceptions_for_ajax
+    def get(self, request, project_id):
+        """
+        GET method for changes of web resources of a project.
+
+        Changes that follow the `since` cursor are returned. When there are
+        none yet, the request waits for them up to `timeout` seconds (but no
+        longer than `WEBRESOURCES_CHANGES_TIMEOUT` setting, as it holds a
+        worker of the server). Without the cursor, only the cursor of the
+        latest change is returned.
+
+        Parameters
+        ----------
+        request : rest_framework.request.Request
+            Object representing the request.
+        project_id : int
+            Identifies the project in the database.
+
+        Returns
+        -------
+        rest_framework.response.Response
+            Response to the request.
+        """
+        project_id = check_read_access(request.user, project_id)
+
+        try:
+            since = request.GET.get('since')
+            since = int(since) if since is not None else None
+            timeout = float(request.GET.get('timeout', 0))
+        except ValueError:
+            return Response(
+                {'error': 'Since and timeout must be numbers.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if since is None:
+            return Response({
+                'cursor': WebResourceChange.objects.cursor(project_id),
+                'more': False,
+                'changes': []
+            })
+
+        deadline = time.time() + min(
+            max(timeout, 0),
+            getattr(settings, 'WEBRESOURCES_CHANGES_TIMEOUT', CHANGES_TIMEOUT)
+        )
+        changes, cursor, more = WebResourceChange.objects.since(
+            project_id,
+            since
+        )
+
+        while not changes and time.time() < deadline:
+            time.sleep(min(1, deadline - time.time()))
+            changes, cursor, more = WebResourceChange.objects.since(
+                project_id,
+                since
+            )
+
+        return Response({
+            'cursor': cursor,
+            'more': more,
+            'changes': [self._serialize(change) for change in changes]
+        })
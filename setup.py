@@ -28,4 +28,5 @@ setup(
     packages=find_packages(exclude=['*.tests', '*.tests.*', 'tests.*']),
     include_package_data=True,
     install_requires=[],
+    extras_require={'brotli': ['brotli'], 'numpy': ['numpy']},
 )